@@ -4,18 +4,51 @@
 # dependencies = [
 #     "aiohttp>=3.8.0",
 #     "beautifulsoup4>=4.9.0",
+#     "lxml>=5.0.0",
 # ]
 # ///
 import asyncio
+import bisect
+import email.utils
+import functools
+import hashlib
+import json
+import math
+import os
 import re
 import string
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from html import unescape
 from typing import Optional
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
 
 import aiohttp
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+def has_class(name: str) -> re.Pattern:
+    """Strainer filter for one CSS class; strainers see the raw, space-separated class attribute."""
+    return re.compile(rf"(^|\s){re.escape(name)}(\s|$)")
+
+
+# MaxPreps pages are read JSON-first: __NEXT_DATA__ and the team name are pulled out of the
+# raw text, and only the schedule table is ever built into a tree
+MAXPREPS_NEXT_DATA_RE = re.compile(r'<script[^>]*\bid="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S)
+MAXPREPS_TITLE_RE = re.compile(r'<[^>]*\bclass="(?:[^"]*\s)?sub-title(?:\s[^"]*)?"[^>]*>([^<]+)</')
+MAXPREPS_TABLE_STRAINER = SoupStrainer("table")
+MAXPREPS_TITLE_STRAINER = SoupStrainer(attrs={"class": has_class("sub-title")})
+TAG_RE = re.compile(r'<[^>]+>')
+# A finished game's schedule row reads "W 65-58" (MaxPreps Game Info, ESPN Schedule__Score)
+SCORE_CELL_RE = re.compile(r'^([WL])\s*(\d+-\d+)')
 
 
 # <bitbar.title>Max Preps Basketball Schedule</bitbar.title>
@@ -57,13 +90,80 @@ class School:
     last_successful_update: Optional[datetime] = None
 
 
+@dataclass
+class Team:
+    name: str
+    source: str  # "maxpreps", "espn", "sidearm" or "custom"
+    section: str  # Key into SECTIONS
+    url: str = ""
+    scraper: Optional[str] = None  # Custom scraper name (source == "custom")
+    record_url: Optional[str] = None  # Page with an "Overall: W-L" line (sidearm)
+    refresh_hours: float = 0  # 0 = fetch every run
+
+
 # --- CONFIGURATION ---
 MAX_PAST_GAMES_DISPLAY = 2
 FETCH_TIMEOUT_SECONDS = 10
 FETCH_RETRY_COUNT = 1
-FETCH_LIMIT_PER_HOST = 3  # Throttle concurrent connections per host to avoid rate limiting
+CONNECTION_LIMIT = 30  # Total pooled connections; each host is held to its HOST_CONCURRENCY budget
+DEFAULT_HOST_CONCURRENCY = 3  # Throttle concurrent requests per host to avoid rate limiting
+HOST_CONCURRENCY = {
+    "www.espn.com": 4,
+    "site.api.espn.com": 4,
+    "www.ncaa.com": 2,
+    "www.njcaa.org": 2,
+}
+
+# Per-host token buckets (requests/second). A 429/503 halves only that host's rate and
+# pauses it for Retry-After; each success adds HOST_RATE_RECOVERY back up to the configured rate
+DEFAULT_HOST_RATE = 4.0
+HOST_RATES = {
+    "www.maxpreps.com": 2.0,
+    "www.ncaa.com": 1.0,
+    "www.njcaa.org": 1.0,
+}
+MIN_HOST_RATE = 0.2
+HOST_RATE_RECOVERY = 0.25
+THROTTLE_STATUSES = {429, 503}
+THROTTLE_RETRIES = 2  # Extra attempts for a throttled request, on top of FETCH_RETRY_COUNT
+MAX_RETRY_AFTER = 20  # Never wait longer than this on a server-supplied Retry-After
 SHOW_SECTION_HEADERS = True
 
+# On-disk response cache: each page type is reused until its TTL, then revalidated
+CACHE_DIR = os.path.expanduser("~/.cache/swiftbar_bball")
+HOUR = 3600
+CACHE_TTLS = {
+    "schedule": 3 * HOUR,  # Schedule/record pages change when games are played
+}
+# A page past its TTL is kept this much longer to send a conditional request for, then deleted
+CACHE_REVALIDATE_WINDOW = 7 * 24 * HOUR
+CACHE_FILE_RE = re.compile(r"^(?:(\w+)-)?[0-9a-f]{40}\.json$")
+
+# MaxPreps rankings only feed a tooltip and move about weekly, so the parsed result is cached
+# on its own cadence and the rankings page is only requested once that copy is stale
+MAXPREPS_RANKINGS_CACHE = os.path.join(CACHE_DIR, "maxpreps_rankings.json")
+MAXPREPS_RANKINGS_TTL = 24 * HOUR
+
+# NET/NJCAA rankings are kept as parsed snapshots, one per source. A source is only checked
+# for a new edition after its interval, with a conditional request, so most runs send nothing
+RANKINGS_SNAPSHOTS = os.path.join(CACHE_DIR, "rankings_snapshots.json")
+SNAPSHOT_CHECK_INTERVALS = {
+    "net": 12 * HOUR,  # NCAA NET is recomputed daily during the season
+    "njcaa": 24 * HOUR,  # NJCAA posts one poll a week
+}
+
+# Per-school schedules from earlier runs: completed games are frozen, and a school
+# that errors or misses SCHOOL_DEADLINE is rendered from here instead
+SCHEDULE_STORE = os.path.join(CACHE_DIR, "schedules.json")
+SCHOOL_DEADLINE = 30  # Seconds before a slow school falls back to its stored schedule
+
+# Per-run timing of every fetch, parse and school task, appended to a rolling log.
+# Set BBALL_DIAGNOSTICS=1 (or "diagnostics": true in the registry) for a menu summary.
+DIAGNOSTICS_LOG = os.path.join(CACHE_DIR, "runs.jsonl")
+DIAGNOSTICS_HISTORY = 50  # Runs kept in the log for the p50/p95 columns
+DIAGNOSTICS_ROWS = 12  # Slowest steps shown in the submenu
+SHOW_DIAGNOSTICS = os.environ.get("BBALL_DIAGNOSTICS") == "1"
+
 il_school_urls = {
     "BELLEVILLE_EAST": "https://www.maxpreps.com/il/belleville/belleville-east-lancers/basketball/schedule/",
     "O'FALLON": "https://www.maxpreps.com/il/ofallon/ofallon-panthers/basketball/schedule/",
@@ -83,10 +183,137 @@ college_urls = {
     "Lindenwood": "https://www.espn.com/mens-college-basketball/team/_/id/2815/lindenwood-lions"
 }
 
+# ESPN's site API serves a team's schedule and record as compact JSON, a fraction of the size of
+# the team page. The page is still parsed when the API fails or comes back empty
+ESPN_SCHEDULE_API = "https://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/teams/{team_id}/schedule"
+ESPN_TEAM_ID_RE = re.compile(r"/id/(\d+)")
+
 SWIC_URL = "https://www.swic.edu/students/services/student-life/athletics/mens-basketball/"
 VINCENNES_SCHEDULE_URL = "https://govutrailblazers.com/sports/mbkb/{season}/schedule"
 NCAA_NET_URL = "https://www.ncaa.com/rankings/basketball-men/d1/ncaa-mens-basketball-net-rankings"
 
+# Team registry. The dicts above are the defaults; to follow other teams create
+# ~/.config/swiftbar-plugins/bball.json:
+#
+#   {
+#     "teams": [
+#       {"name": "O'FALLON", "source": "maxpreps", "section": "il_hs", "url": "https://www.maxpreps.com/..."},
+#       {"name": "SLU", "source": "espn", "section": "d1", "url": "https://www.espn.com/..."},
+#       {"name": "McKendree", "source": "sidearm", "section": "d2", "url": "https://.../sports/mens-basketball/schedule",
+#        "record_url": "https://...", "refresh_hours": 24},
+#       {"name": "SWIC", "source": "custom", "scraper": "swic", "section": "cc"}  # url comes from the scraper
+#     ],
+#     "host_concurrency": {"www.maxpreps.com": 2},
+#     "host_rates": {"www.maxpreps.com": 1.0},
+#     "diagnostics": true
+#   }
+#
+# refresh_hours > 0 re-renders a team from the schedule store until its last good fetch is that old.
+_PLUGIN_NAME = os.path.splitext(os.path.splitext(os.path.basename(__file__))[0])[0]
+REGISTRY_PATH = os.path.expanduser(f"~/.config/swiftbar-plugins/{_PLUGIN_NAME}.json")
+
+# Display sections in menu order: (rank scope, header, which rankings index applies)
+SECTIONS = {
+    "il_hs": ("IL", "ILLINOIS HIGH SCHOOLS", None),
+    "mo_hs": ("MO", "MISSOURI HIGH SCHOOLS", None),
+    "cc": ("", "COMMUNITY COLLEGE", "njcaa"),
+    "d1": ("", "DIVISION I", "net"),
+    "d2": ("", "DIVISION II", None),
+}
+
+
+# --- INSTRUMENTATION ---
+RUN_EVENTS: list[dict] = []
+
+
+def record_event(kind: str, name: str, started: float, **fields) -> None:
+    """Log one timed step of this run; started is a time.perf_counter() reading."""
+    RUN_EVENTS.append({"kind": kind, "name": name, "ms": round((time.perf_counter() - started) * 1000, 1), **fields})
+
+
+def instrumented(func):
+    """Time an async task. School results also log their URL and fetch_error."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        result = await func(*args, **kwargs)
+        record_event("task", func.__name__, started,
+                     key=getattr(result, "url", None), error=getattr(result, "fetch_error", None))
+        return result
+    return wrapper
+
+
+@contextmanager
+def timed_parse(name: str, key: str = ""):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_event("parse", name, started, key=key)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def save_run_log(total_ms: float) -> list[dict]:
+    """Append this run to DIAGNOSTICS_LOG, trimmed to DIAGNOSTICS_HISTORY runs. Returns the history."""
+    history = []
+    try:
+        with open(DIAGNOSTICS_LOG) as f:
+            for line in f:
+                try:
+                    history.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    history.append({"at": datetime.now().isoformat(timespec="seconds"), "total_ms": round(total_ms, 1),
+                    "events": RUN_EVENTS})
+    history = history[-DIAGNOSTICS_HISTORY:]
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{DIAGNOSTICS_LOG}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            for run in history:
+                f.write(json.dumps(run) + "\n")
+        os.replace(tmp, DIAGNOSTICS_LOG)
+    except OSError:
+        pass
+    return history
+
+
+def render_diagnostics(history: list[dict]) -> None:
+    """Collapsible Diagnostics submenu: this run's totals, its slowest fetches, p50/p95 across runs."""
+    run = history[-1]
+    fetches = [e for e in run["events"] if e["kind"] == "fetch"]
+    network = [e for e in fetches if e.get("cache") != "hit"]
+    total_kb = sum(e.get("bytes", 0) for e in network) / 1024
+    retries = sum(e.get("retries", 0) for e in fetches)
+
+    print("---")
+    print("Diagnostics | size=11 color=#888888")
+    print(f"--Run {run['total_ms'] / 1000:.1f}s · {len(network)} requests · "
+          f"{len(fetches) - len(network)} cached · {total_kb:.0f} KB · {retries} retries | font=Menlo size=11")
+    for e in sorted(network, key=lambda e: e["ms"], reverse=True)[:3]:
+        status = e.get("error") or e.get("status")
+        print(f"--{e['ms']:7.0f}ms {status} {e['url'].split('://')[-1][:60]} | font=Menlo size=10 color=#888888")
+
+    series: dict[str, list[float]] = {"run total": [r["total_ms"] for r in history]}
+    for r in history:
+        for e in r["events"]:
+            if e["kind"] == "fetch" and e.get("cache") == "hit":
+                continue
+            label = f"{e['kind']} {e['name']}"
+            series.setdefault(label, []).append(e["ms"])
+    print(f"--p50/p95 over {len(history)} runs, slowest first | size=11 color=#888888")
+    rows = sorted(((label, percentile(v, 50), percentile(v, 95)) for label, v in series.items()),
+                  key=lambda row: row[2], reverse=True)
+    for label, p50, p95 in rows[:DIAGNOSTICS_ROWS]:
+        print(f"--{label[:34]:<34} {p50:7.0f}ms {p95:7.0f}ms | font=Menlo size=10")
+
 
 # --- HELPERS ---
 def get_basketball_season_year(date_str: str) -> int:
@@ -131,37 +358,235 @@ def get_njcaa_rankings_index_url() -> str:
     return f"https://www.njcaa.org/sports/mbkb/rankings/DI/{get_current_season_slug()}"
 
 
-async def fetch_html(session: aiohttp.ClientSession, url: str) -> tuple[BeautifulSoup, Optional[str]]:
-    """Fetch HTML with retry logic. Returns (soup, error_message)."""
+_host_slots: dict[str, asyncio.Semaphore] = {}
+
+
+def host_slot(url: str) -> asyncio.Semaphore:
+    """Semaphore enforcing url's host budget from HOST_CONCURRENCY."""
+    host = urlparse(url).netloc
+    if host not in _host_slots:
+        _host_slots[host] = asyncio.Semaphore(HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY))
+    return _host_slots[host]
+
+
+class HostLimiter:
+    """Adaptive token bucket for one host.
+
+    Throttling responses halve the rate and block the host until Retry-After;
+    successes recover the rate additively. Other hosts are never affected.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            if now < self.blocked_until:
+                await asyncio.sleep(self.blocked_until - now)
+                continue
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def throttled(self, retry_after: Optional[float]) -> None:
+        self.rate = max(MIN_HOST_RATE, self.rate / 2)
+        self.tokens = 0.0
+        delay = min(retry_after if retry_after is not None else 1 / self.rate, MAX_RETRY_AFTER)
+        self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+
+    def succeeded(self) -> None:
+        self.rate = min(self.max_rate, self.rate + HOST_RATE_RECOVERY)
+
+
+_host_limiters: dict[str, HostLimiter] = {}
+
+
+def host_limiter(url: str) -> HostLimiter:
+    host = urlparse(url).netloc
+    if host not in _host_limiters:
+        _host_limiters[host] = HostLimiter(HOST_RATES.get(host, DEFAULT_HOST_RATE),
+                                           HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY))
+    return _host_limiters[host]
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds or HTTP-date), or None."""
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def cache_path(url: str, page_type: str) -> str:
+    """One file per URL, prefixed with its page type so prune_page_cache knows its TTL."""
+    return os.path.join(CACHE_DIR, f"{page_type}-{hashlib.sha1(url.encode()).hexdigest()}.json")
+
+
+def load_cached_page(url: str, page_type: str) -> Optional[dict]:
+    """Cached body, validators and fetch time for url, or None."""
+    try:
+        with open(cache_path(url, page_type)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def prune_page_cache() -> None:
+    """Delete cached pages older than their TTL plus CACHE_REVALIDATE_WINDOW.
+
+    Also removes files from the old unprefixed layout, which are never read, and
+    temp files a killed run left behind. The stores and logs in CACHE_DIR are kept.
+    """
+    now = time.time()
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        path = os.path.join(CACHE_DIR, name)
+        match = CACHE_FILE_RE.match(name)
+        try:
+            if match:
+                ttl = CACHE_TTLS.get(match.group(1))
+                if ttl is None or now - os.path.getmtime(path) > ttl + CACHE_REVALIDATE_WINDOW:
+                    os.remove(path)
+            elif name.endswith(".tmp") and now - os.path.getmtime(path) > HOUR:
+                os.remove(path)
+        except OSError:
+            continue
+
+
+def save_cached_page(url: str, page_type: str, body: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+    """Write a page to the cache atomically so a concurrent run never reads half a file."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        path = cache_path(url, page_type)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"url": url, "fetched_at": time.time(), "etag": etag,
+                       "last_modified": last_modified, "body": body}, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+async def fetch_page(session: aiohttp.ClientSession, url: str, page_type: Optional[str] = None,
+                     validators: Optional[dict] = None) -> tuple[str, Optional[str]]:
+    """Fetch a page's text with retry logic. Returns (text, error_message); text is "" on error.
+
+    Requests go through the host's concurrency slot and adaptive HostLimiter, so a
+    throttling host (429/503, Retry-After) slows down without holding up the others.
+
+    Pass a page_type from CACHE_TTLS to serve the page from disk while it is fresh;
+    once stale it is revalidated with If-None-Match/If-Modified-Since.
+
+    Callers that keep their own copy pass validators ({"etag", "last_modified"}) instead:
+    they are sent with the request and updated from the response, and an unchanged page
+    comes back as "" with validators["not_modified"] set.
+
+    Every call is logged to RUN_EVENTS with its status, size, retries and cache outcome.
+    """
+    event = {"url": url, "page_type": page_type, "status": None, "retries": 0, "cache": None}
+    started = time.perf_counter()
+    text, error = await _fetch_page(session, url, page_type, event, validators)
+    record_event("fetch", urlparse(url).netloc, started, bytes=len(text), error=error, **event)
+    return text, error
+
+
+async def _fetch_page(session: aiohttp.ClientSession, url: str, page_type: Optional[str],
+                      event: dict, validators: Optional[dict] = None) -> tuple[str, Optional[str]]:
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"}
-    
-    for attempt in range(FETCH_RETRY_COUNT + 1):
-        try:
-            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=FETCH_TIMEOUT_SECONDS)) as response:
-                if response.status == 200:
-                    return BeautifulSoup(await response.text(), 'html.parser'), None
-                else:
+
+    ttl = CACHE_TTLS.get(page_type, 0)
+    cached = load_cached_page(url, page_type) if ttl else None
+    if cached:
+        if time.time() - cached["fetched_at"] < ttl:
+            event["cache"] = "hit"
+            return cached["body"], None
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    elif validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    limiter = host_limiter(url)
+    attempt = 0
+    throttled = 0
+    async with host_slot(url):
+        while True:
+            await limiter.acquire()
+            event["retries"] = attempt + throttled
+            try:
+                async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=FETCH_TIMEOUT_SECONDS)) as response:
+                    event["status"] = response.status
+                    if response.status == 304 and cached:
+                        event["cache"] = "revalidated"
+                        limiter.succeeded()
+                        save_cached_page(url, page_type, cached["body"], cached.get("etag"), cached.get("last_modified"))
+                        return cached["body"], None
+                    if response.status == 304 and validators is not None:
+                        event["cache"] = "revalidated"
+                        limiter.succeeded()
+                        validators["not_modified"] = True
+                        return "", None
+                    if response.status == 200:
+                        event["cache"] = "miss" if ttl else None
+                        limiter.succeeded()
+                        body = await response.text()
+                        if ttl:
+                            save_cached_page(url, page_type, body, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+                        if validators is not None:
+                            validators.update(etag=response.headers.get("ETag"),
+                                              last_modified=response.headers.get("Last-Modified"), not_modified=False)
+                        return body, None
                     error_msg = f"HTTP {response.status}"
-                    if attempt < FETCH_RETRY_COUNT:
-                        backoff = 2.0 if response.status == 429 else 0.5 * (attempt + 1)
-                        await asyncio.sleep(backoff)
-                        continue
-                    return BeautifulSoup("", 'html.parser'), error_msg
-        except asyncio.TimeoutError:
-            error_msg = "Timeout"
-            if attempt < FETCH_RETRY_COUNT:
-                await asyncio.sleep(0.5 * (attempt + 1))
-                continue
-            return BeautifulSoup("", 'html.parser'), error_msg
-        except Exception as e:
-            error_msg = f"Error: {type(e).__name__}"
-            if attempt < FETCH_RETRY_COUNT:
-                await asyncio.sleep(0.5 * (attempt + 1))
-                continue
-            return BeautifulSoup("", 'html.parser'), error_msg
-    
-    return BeautifulSoup("", 'html.parser'), "Unknown error"
+                    if response.status in THROTTLE_STATUSES:
+                        # Back off this host only; the limiter holds the next attempt until Retry-After
+                        limiter.throttled(parse_retry_after(response.headers.get("Retry-After")))
+                        if throttled < THROTTLE_RETRIES:
+                            throttled += 1
+                            continue
+                        return "", error_msg
+            except asyncio.TimeoutError:
+                error_msg = "Timeout"
+            except Exception as e:
+                error_msg = f"Error: {type(e).__name__}"
+            if attempt >= FETCH_RETRY_COUNT:
+                return "", error_msg
+            attempt += 1
+            await asyncio.sleep(0.5 * attempt)
+
+
+async def fetch_html(session: aiohttp.ClientSession, url: str,
+                     parse_only: Optional[SoupStrainer] = None,
+                     page_type: Optional[str] = None) -> tuple[BeautifulSoup, Optional[str]]:
+    """Fetch and parse a page. Returns (soup, error_message); the soup is empty on error.
+
+    Pass parse_only to build just the matching subtrees instead of the whole page.
+    """
+    text, error = await fetch_page(session, url, page_type)
+    if error:
+        return BeautifulSoup("", HTML_PARSER), error
+    return BeautifulSoup(text, HTML_PARSER, parse_only=parse_only), None
 
 
 def parse_tipoff_time(time_str: str) -> Optional[datetime]:
@@ -203,184 +628,548 @@ def format_relative_date(game_date: datetime) -> str:
         return game_date.strftime('%b %d')  # Jan 25
 
 
-async def fetch_ncaa_net_rankings(session: aiohttp.ClientSession) -> dict[str, int]:
-    """Fetch NCAA NET rankings. Returns dict mapping school name -> rank (1-based)."""
+def parse_rankings_table(soup: BeautifulSoup, header_labels: tuple[str, ...]) -> dict[str, int]:
+    """Parse a rank | school table (NET, NJCAA) into a dict mapping school name -> rank."""
     result: dict[str, int] = {}
-    soup, error = await fetch_html(session, NCAA_NET_URL)
-    if error:
-        return result
+    # Parse table: rows have rank in first cell, school name in second
+    table = soup.find("table")
+    if table:
+        tbody = table.find("tbody") or table
+        for tr in tbody.find_all("tr"):
+            tds = tr.find_all("td")
+            if len(tds) >= 2:
+                rank_cell = tds[0].get_text(strip=True)
+                school_cell = tds[1].get_text(strip=True)
+                if rank_cell.isdigit() and school_cell:
+                    result[school_cell] = int(rank_cell)
+    # Fallback: sometimes uses div-based layout or markdown in page
+    if not result:
+        text = soup.get_text()
+        for m in re.finditer(r'\|\s*(\d+)\s*\|\s*([^|]+?)\s*\|', text):
+            rank_str, school = m.group(1), m.group(2).strip()
+            if rank_str.isdigit() and school and school not in header_labels:
+                result[school] = int(rank_str)
+    return result
+
+
+# Known aliases for our tracked schools (ESPN vs NCAA name differences)
+NET_ALIASES = {
+    "slu": "Saint Louis",
+    "saint louis": "Saint Louis",
+    "siue": "SIUE",
+    "siu edwardsville": "SIUE",
+    "illinois": "Illinois",
+    "lindenwood": "Lindenwood",
+}
+
+NJCAA_ALIASES = {
+    "swic": "Southwestern Illinois College",
+    "vincennes": "Vincennes University",
+}
+
+
+def normalize_school_name(name: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace: "St. Mary's" -> "st marys"."""
+    name = re.sub(r"[.'’]", "", name.lower())
+    return " ".join(re.sub(r"[^\w\s]", " ", name).split())
+
+
+class RankIndex:
+    """A rankings table keyed for lookups, built once per fetch.
+
+    Names are normalized once. Contained-name matches go through an index of each
+    ranked name's first token, and prefix matches bisect the sorted names, so neither
+    scans the whole table. Ties always go to the better rank.
+    """
+
+    def __init__(self, rankings: Optional[dict[str, int]] = None, aliases: Optional[dict[str, str]] = None):
+        self.exact: dict[str, int] = {}
+        self.by_first_token: dict[str, list[tuple[tuple[str, ...], int]]] = {}
+        for name, rank in sorted((rankings or {}).items(), key=lambda item: item[1]):
+            key = normalize_school_name(name)
+            if not key or key in self.exact:
+                continue
+            self.exact[key] = rank
+            tokens = tuple(key.split())
+            self.by_first_token.setdefault(tokens[0], []).append((tokens, rank))
+        self.sorted_names = sorted(self.exact)
+        self.aliases = {normalize_school_name(k): normalize_school_name(v) for k, v in (aliases or {}).items()}
+
+    def __len__(self) -> int:
+        return len(self.exact)
+
+    def lookup(self, school_name: str) -> Optional[int]:
+        """Exact match on the normalized name, then on its alias."""
+        key = normalize_school_name(school_name)
+        if key in self.exact:
+            return self.exact[key]
+        return self.exact.get(self.aliases.get(key, ""))
+
+    def contained_in(self, school_name: str) -> Optional[int]:
+        """Rank of a ranked name appearing whole inside school_name ("Illinois" in "Illinois Fighting Illini").
+
+        The longest such name wins, so "Kansas State Wildcats" matches "Kansas State" over "Kansas".
+        """
+        tokens = tuple(normalize_school_name(school_name).split())
+        best: Optional[tuple[int, int]] = None
+        for i, token in enumerate(tokens):
+            for candidate, rank in self.by_first_token.get(token, ()):
+                if tokens[i:i + len(candidate)] == candidate and (best is None or (-len(candidate), rank) < best):
+                    best = (-len(candidate), rank)
+        return best[1] if best else None
+
+    def prefixed_by(self, school_name: str) -> Optional[int]:
+        """Best rank among ranked names starting with school_name ("Vinc" -> "Vincennes University")."""
+        prefix = normalize_school_name(school_name)
+        if not prefix:
+            return None
+        best = None
+        for name in self.sorted_names[bisect.bisect_left(self.sorted_names, prefix):]:
+            if not name.startswith(prefix):
+                break
+            if best is None or self.exact[name] < best:
+                best = self.exact[name]
+        return best
+
+
+def load_rankings_snapshots() -> dict[str, dict]:
     try:
-        # Parse table: rows have rank in first cell, school name in second
-        table = soup.find("table")
-        if table:
-            tbody = table.find("tbody") or table
-            for tr in tbody.find_all("tr"):
-                tds = tr.find_all("td")
-                if len(tds) >= 2:
-                    rank_cell = tds[0].get_text(strip=True)
-                    school_cell = tds[1].get_text(strip=True)
-                    if rank_cell.isdigit():
-                        result[school_cell] = int(rank_cell)
-        # Fallback: NCAA sometimes uses div-based layout or markdown in page
-        if not result:
-            text = soup.get_text()
-            for m in re.finditer(r'\|\s*(\d+)\s*\|\s*([^|]+?)\s*\|', text):
-                rank_str, school = m.group(1), m.group(2).strip()
-                if rank_str.isdigit() and school and school not in ("Rank", "School", "---"):
-                    result[school] = int(rank_str)
-    except Exception:
+        with open(RANKINGS_SNAPSHOTS) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_rankings_snapshot(source: str, snapshot: dict) -> None:
+    snapshots = load_rankings_snapshots()
+    snapshots[source] = snapshot
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{RANKINGS_SNAPSHOTS}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(snapshots, f)
+        os.replace(tmp, RANKINGS_SNAPSHOTS)
+    except OSError:
         pass
-    return result
 
 
-def match_school_to_net_rank(school_name: Optional[str], net_rankings: dict[str, int]) -> Optional[int]:
+def snapshot_is_current(snapshot: Optional[dict], source: str) -> bool:
+    """True while a snapshot is inside its check interval, so no request is needed at all."""
+    return bool(snapshot) and time.time() - snapshot["checked_at"] < SNAPSHOT_CHECK_INTERVALS[source]
+
+
+def mark_snapshot_checked(source: str, snapshot: dict, validators: dict) -> dict:
+    """Keep the table, record the check and the validators for the next conditional request."""
+    snapshot = {**snapshot, "checked_at": time.time(),
+                "etag": validators.get("etag"), "last_modified": validators.get("last_modified")}
+    save_rankings_snapshot(source, snapshot)
+    return snapshot
+
+
+@instrumented
+async def fetch_ncaa_net_rankings(session: aiohttp.ClientSession) -> RankIndex:
+    """NCAA NET rankings, indexed by school name, served from the "net" snapshot.
+
+    Once the snapshot is due for a check the NET page is requested conditionally;
+    it is only downloaded and parsed again when NCAA.com reports a change.
+    """
+    snapshot = load_rankings_snapshots().get("net")
+    if not snapshot_is_current(snapshot, "net"):
+        validators = {"etag": snapshot.get("etag"), "last_modified": snapshot.get("last_modified")} if snapshot else {}
+        html, error = await fetch_page(session, NCAA_NET_URL, validators=validators)
+        if not error and not validators.get("not_modified"):
+            try:
+                with timed_parse("net_rankings"):
+                    soup = BeautifulSoup(html, HTML_PARSER)
+                    table = parse_rankings_table(soup, ("Rank", "School", "---"))
+            except Exception:
+                table = {}
+            if table:
+                snapshot = mark_snapshot_checked("net", {"table": table}, validators)
+        elif not error and snapshot:
+            snapshot = mark_snapshot_checked("net", snapshot, validators)
+    # A failed check keeps whatever snapshot we have, however old
+    return RankIndex(snapshot["table"], NET_ALIASES) if snapshot else RankIndex()
+
+
+def match_school_to_net_rank(school_name: Optional[str], net_index: RankIndex) -> Optional[int]:
     """Match a school name to NCAA NET ranking. Handles common name variations."""
-    if not school_name or not net_rankings:
+    if not school_name or not net_index:
         return None
-    name = school_name.strip()
-    name_lower = name.lower()
-    # Direct match
-    if name in net_rankings:
-        return net_rankings[name]
-    # Case-insensitive match
-    for ncaa_name, rank in net_rankings.items():
-        if ncaa_name.lower() == name_lower:
-            return rank
-    # Known aliases for our tracked schools (ESPN vs NCAA name differences)
-    aliases = {
-        "slu": "Saint Louis",
-        "saint louis": "Saint Louis",
-        "siue": "SIUE",
-        "siu edwardsville": "SIUE",
-        "illinois": "Illinois",
-        "lindenwood": "Lindenwood",
-    }
-    if name_lower in aliases and aliases[name_lower] in net_rankings:
-        return net_rankings[aliases[name_lower]]
-    # NCAA name contained in school name (e.g. "Illinois" in "Illinois Fighting Illini")
-    for ncaa_name, rank in net_rankings.items():
-        if ncaa_name.lower() in name_lower:
-            return rank
+    return net_index.lookup(school_name) or net_index.contained_in(school_name)
+
+
+def find_njcaa_week_url(index_soup: BeautifulSoup) -> Optional[str]:
+    """Pick the latest weekly poll linked from the NJCAA rankings index, or None if none is linked."""
+    for a in index_soup.find_all("a", href=True):
+        href = a.get("href", "")
+        if "Week_" in href and "archives" not in href.lower() and "Preseason" not in href:
+            return "https://www.njcaa.org" + href if href.startswith("/") else href
     return None
 
 
-async def fetch_njcaa_rankings(session: aiohttp.ClientSession) -> dict[str, int]:
-    """Fetch NJCAA DI top 25. Returns dict mapping school name -> rank (1-based)."""
-    result: dict[str, int] = {}
-    try:
-        # Fetch index page to get latest week URL
-        index_soup, err = await fetch_html(session, get_njcaa_rankings_index_url())
-        if err:
-            return result
-        first_week_link = None
-        for a in index_soup.find_all("a", href=True):
-            href = a.get("href", "")
-            if "Week_" in href and "archives" not in href.lower() and "Preseason" not in href:
-                first_week_link = href
-                break
-        if not first_week_link:
-            # Fallback: try direct week URL pattern (may drift as season progresses)
-            first_week_link = f"https://www.njcaa.org/sports/mbkb/{get_current_season_slug()}/div1/rankings/Week_12"
+def njcaa_fallback_week_url() -> str:
+    """Direct week URL for when the index links no poll and there is no snapshot (may drift as season progresses)."""
+    return f"https://www.njcaa.org/sports/mbkb/{get_current_season_slug()}/div1/rankings/Week_12"
 
-        if first_week_link.startswith("/"):
-            first_week_link = "https://www.njcaa.org" + first_week_link
 
-        soup, err = await fetch_html(session, first_week_link)
+@instrumented
+async def fetch_njcaa_rankings(session: aiohttp.ClientSession) -> RankIndex:
+    """NJCAA DI top 25, indexed by school name, served from the "njcaa" snapshot.
+
+    Once the snapshot is due for a check the rankings index is requested conditionally.
+    The week page is only fetched when the index links a poll the snapshot doesn't hold.
+    """
+    snapshot = load_rankings_snapshots().get("njcaa")
+    if snapshot_is_current(snapshot, "njcaa"):
+        return RankIndex(snapshot["table"], NJCAA_ALIASES)
+    try:
+        validators = {"etag": snapshot.get("etag"), "last_modified": snapshot.get("last_modified")} if snapshot else {}
+        html, err = await fetch_page(session, get_njcaa_rankings_index_url(), validators=validators)
         if err:
-            return result
-
-        # Parse table: Place | Name | Record | Points | 1st | Prev
-        table = soup.find("table")
-        if table:
-            tbody = table.find("tbody") or table
-            for tr in tbody.find_all("tr"):
-                tds = tr.find_all("td")
-                if len(tds) >= 2:
-                    rank_cell = tds[0].get_text(strip=True)
-                    school_cell = tds[1].get_text(strip=True)
-                    if rank_cell.isdigit() and school_cell:
-                        result[school_cell] = int(rank_cell)
-        if not result:
-            text = soup.get_text()
-            for m in re.finditer(r'\|\s*(\d+)\s*\|\s*([^|]+?)\s*\|', text):
-                rank_str, school = m.group(1), m.group(2).strip()
-                if rank_str.isdigit() and school and school not in ("Place", "Name", "---"):
-                    result[school] = int(rank_str)
+            raise LookupError(err)
+
+        week_url = None
+        if not validators.get("not_modified"):
+            week_url = find_njcaa_week_url(BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer("a", href=True)))
+            if not week_url and not snapshot:
+                week_url = njcaa_fallback_week_url()
+        if snapshot and week_url in (None, snapshot["edition"]):
+            # Same poll as last time: only the check is recorded
+            snapshot = mark_snapshot_checked("njcaa", snapshot, validators)
+        elif week_url:
+            week_html, err = await fetch_page(session, week_url)
+            if err:
+                raise LookupError(err)
+            # Table columns: Place | Name | Record | Points | 1st | Prev
+            with timed_parse("njcaa_rankings"):
+                table = parse_rankings_table(BeautifulSoup(week_html, HTML_PARSER), ("Place", "Name", "---"))
+            if table:
+                snapshot = mark_snapshot_checked("njcaa", {"edition": week_url, "table": table}, validators)
     except Exception:
         pass
-    return result
+    # A failed check keeps whatever snapshot we have, however old
+    return RankIndex(snapshot["table"], NJCAA_ALIASES) if snapshot else RankIndex()
 
 
-def match_school_to_njcaa_rank(school_name: Optional[str], njcaa_rankings: dict[str, int]) -> Optional[int]:
+def match_school_to_njcaa_rank(school_name: Optional[str], njcaa_index: RankIndex) -> Optional[int]:
     """Match a community college name to NJCAA ranking. Handles name variations."""
-    if not school_name or not njcaa_rankings:
+    if not school_name or not njcaa_index:
         return None
-    name = school_name.strip()
-    name_lower = name.lower()
-    aliases = {
-        "swic": "Southwestern Illinois College",
-        "vincennes": "Vincennes University",
+    return njcaa_index.lookup(school_name) or njcaa_index.prefixed_by(school_name)
+
+
+def parse_past_game_scores(cell_text: str) -> tuple[Optional[str], Optional[str]]:
+    """Result and score ("W", "65-58") from a schedule row's result cell, or (None, None) until it's posted.
+
+    MaxPreps' Game Info cell and ESPN's Schedule__Score both read "W 65-58" once a game is final.
+    """
+    match = SCORE_CELL_RE.match(cell_text.strip())
+    return (match.group(1), match.group(2)) if match else (None, None)
+
+
+# --- SCHEDULE STORE ---
+GameKey = tuple[str, str]
+
+
+def game_key(game_date: datetime, opponent: str) -> GameKey:
+    return game_date.date().isoformat(), opponent.strip().upper()
+
+
+def game_to_dict(g: Game) -> dict:
+    return {
+        "date": g.date.isoformat(),
+        "home_away": g.home_away,
+        "opponent": g.opponent,
+        "tipoff_time": g.tipoff_time.isoformat() if g.tipoff_time else None,
+        "game_url": g.game_url,
+        "result": g.result,
+        "score": g.score,
     }
-    if name_lower in aliases and aliases[name_lower] in njcaa_rankings:
-        return njcaa_rankings[aliases[name_lower]]
-    if name in njcaa_rankings:
-        return njcaa_rankings[name]
-    for njcaa_name, rank in njcaa_rankings.items():
-        if njcaa_name.lower() == name_lower:
-            return rank
-        # Only match when our short name is start of NJCAA name (e.g. "Vincennes" -> "Vincennes University")
-        if njcaa_name.lower().startswith(name_lower + " ") or njcaa_name.lower().startswith(name_lower):
-            return rank
-    return None
 
 
-async def parse_past_game_scores(session: aiohttp.ClientSession, game_url: str) -> tuple[Optional[str], Optional[str]]:
-    """Parse game result and score from MaxPreps box score page. Returns (result, score)."""
-    if not game_url or game_url.startswith("http") is False:
-        return None, None
-    
+def game_from_dict(d: dict) -> Game:
+    return Game(
+        date=datetime.fromisoformat(d["date"]),
+        home_away=d["home_away"],
+        opponent=d["opponent"],
+        tipoff_time=datetime.fromisoformat(d["tipoff_time"]) if d.get("tipoff_time") else None,
+        game_url=d.get("game_url"),
+        result=d.get("result"),
+        score=d.get("score"),
+    )
+
+
+def load_schedule_store() -> dict[str, dict]:
+    """Stored schools keyed by school URL."""
     try:
-        soup, error = await fetch_html(session, game_url)
-        if error:
-            return None, None
-        
-        # Look for score elements in MaxPreps box score page
-        # Format varies, but typically has team scores in specific divs
-        score_divs = soup.select('.score')
-        if len(score_divs) >= 2:
-            team_score = score_divs[0].text.strip()
-            opp_score = score_divs[1].text.strip()
-            
-            if team_score.isdigit() and opp_score.isdigit():
-                result = "W" if int(team_score) > int(opp_score) else "L"
-                score = f"{team_score}-{opp_score}"
-                return result, score
-        
-        # Alternative: Check for win/loss text indicators
-        result_text = soup.get_text()
-        if "Win" in result_text or "Victory" in result_text:
-            return "W", None
-        elif "Loss" in result_text or "Defeat" in result_text:
-            return "L", None
-            
-    except Exception:
+        with open(SCHEDULE_STORE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_schedule_store(store: dict[str, dict], schools: list[School]) -> None:
+    """Record every school that fetched cleanly this run; keep the last good entry for the rest."""
+    for s in schools:
+        if s.fetch_error or not s.last_successful_update:
+            continue
+        store[s.url] = {
+            "name": s.name,
+            "record": s.record,
+            "streak": s.streak,
+            "streak_type": s.streak_type,
+            "ranking": s.ranking,
+            "rankings_tooltip": s.rankings_tooltip,
+            "saved_at": s.last_successful_update.isoformat(),
+            "games": [game_to_dict(g) for g in s.schedule],
+        }
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{SCHEDULE_STORE}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(store, f)
+        os.replace(tmp, SCHEDULE_STORE)
+    except OSError:
         pass
-    
-    return None, None
+
+
+def frozen_games(store: dict[str, dict], url: str) -> dict[GameKey, Game]:
+    """Completed games already stored for a school; parsers reuse these instead of re-parsing the row.
+
+    Only games with a score count: every parser reads result and score together, so a bare
+    result (from older runs' page-text guesses) is re-read from the schedule row instead of kept.
+    """
+    entry = store.get(url) or {}
+    games = (game_from_dict(d) for d in entry.get("games", []) if d.get("result") and d.get("score"))
+    return {game_key(g.date, g.opponent): g for g in games}
+
+
+def restore_from_store(school: School, store: dict[str, dict]) -> None:
+    """Fill a school that failed this run from its last good run. The fetch error is kept for the ⚠️."""
+    entry = store.get(school.url)
+    if not entry:
+        return
+    school.name = school.name or entry.get("name")
+    school.record = school.record or entry.get("record")
+    school.streak = school.streak or entry.get("streak")
+    school.streak_type = school.streak_type or entry.get("streak_type")
+    school.ranking = school.ranking or entry.get("ranking")
+    school.rankings_tooltip = school.rankings_tooltip or entry.get("rankings_tooltip")
+    school.schedule = [game_from_dict(d) for d in entry.get("games", [])]
+    school.last_successful_update = datetime.fromisoformat(entry["saved_at"])
+
+
+async def with_deadline(coro, url: str) -> School:
+    """Give up on a school after SCHOOL_DEADLINE so main can render it from the store."""
+    started = time.perf_counter()
+    try:
+        return await asyncio.wait_for(coro, SCHOOL_DEADLINE)
+    except asyncio.TimeoutError:
+        record_event("task", "deadline", started, key=url, error="Timeout")
+        return School(url=url, last_updated=datetime.now(), fetch_error="Timeout")
 
 
 # --- MAXPREPS LOGIC ---
-async def process_school(session: aiohttp.ClientSession, schedule_url: str) -> School:
+def parse_maxpreps_schedule(soup_sched: BeautifulSoup,
+                            frozen: Optional[dict[GameKey, Game]] = None) -> Optional[list[Game]]:
+    """Walk the MaxPreps schedule table. Returns None when the page has no schedule table.
+
+    Rows matching a frozen (completed, stored) game reuse it without parsing the rest of the row.
+    """
+    all_tables = soup_sched.select("table tbody")
+    schedule_table = all_tables[1] if len(all_tables) > 1 else (all_tables[0] if all_tables else None)
+    if not schedule_table:
+        return None
+
+    games = []
+    for tr in schedule_table.find_all('tr'):
+        tds = tr.find_all('td')
+        if not tds or len(tds) < 4:
+            continue
+
+        try:
+            game_date = datetime.strptime(tds[0].text.strip(), '%m/%d').replace(
+                year=get_basketball_season_year(tds[0].text.strip()))
+            opp = tds[1].find('span', class_="name").text.rstrip('*').strip() if tds[1].find('span', class_="name") else ""
+            if frozen and game_key(game_date, opp) in frozen:
+                games.append(frozen[game_key(game_date, opp)])
+                continue
+            ha = parse_home_away(tds[1].text)
+            tipoff = parse_tipoff_time(tds[2].text.strip())
+            g_url = tds[2].find('a')['href'] if tds[2].find('a') else ""
+
+            # Check if game is in the past - parse score if available
+            result = None
+            score = None
+            if len(tds) >= 4 and game_date.date() < datetime.now().date():
+                result, score = parse_past_game_scores(tds[3].text)
+
+            games.append(Game(
+                date=game_date,
+                home_away=ha,
+                opponent=opp,
+                tipoff_time=tipoff,
+                game_url=g_url,
+                result=result,
+                score=score
+            ))
+        except (ValueError, AttributeError):
+            continue
+    return games
+
+
+def extract_next_data(html: str) -> Optional[dict]:
+    """Pull the __NEXT_DATA__ JSON straight out of the page text, without building a DOM."""
+    match = MAXPREPS_NEXT_DATA_RE.search(html)
+    if not match:
+        return None
+    try:
+        return json.loads(match.group(1))
+    except ValueError:
+        return None
+
+
+def maxpreps_team_context(data: dict) -> dict:
+    page_props = data.get('props', {}).get('pageProps', {})
+    return page_props.get('teamContext', {}) or page_props.get('team', {})
+
+
+def parse_maxpreps_team(html: str, school: School) -> None:
+    """Fill in name, record and streak from the schedule page header and its __NEXT_DATA__ JSON."""
+    title = MAXPREPS_TITLE_RE.search(html)
+    if title:
+        school.name = unescape(title.group(1))
+    else:
+        # Title has nested markup; build just that element
+        title_el = BeautifulSoup(html, HTML_PARSER, parse_only=MAXPREPS_TITLE_STRAINER).find()
+        school.name = title_el.text if title_el else None
+
+    data = extract_next_data(html)
+    if data:
+        overall_standing = maxpreps_team_context(data).get('standingsData', {}).get('overallStanding', {})
+        school.record = overall_standing.get('overallWinLossTies')
+        school.streak = overall_standing.get('streak')
+        school.streak_type = overall_standing.get('streakResult')
+
+
+def parse_maxpreps_rankings(html: str, school: School, state_abbrev: str) -> None:
+    """Fill in the state ranking and rankings tooltip from the MaxPreps rankings page."""
+    # We need the full rankings data which is usually better populated on the Rankings page
+    data = extract_next_data(html)
+
+    state_rank = "NR"
+    div_rank = "NR"
+    stl_rank = "NR"
+
+    found_data = False
+
+    if data:
+        try:
+            rank_list = maxpreps_team_context(data).get('rankingsData', {}).get('data', [])
+
+            for r in rank_list:
+                # 1. State Rank (Type 1)
+                if r.get('rankingType') == 1:
+                    val = r.get('rank', 'NR')
+                    state_rank = val
+                    school.ranking = val  # Use State rank for sorting
+
+                # 2. Other Ranks (Check contextName, not name)
+                context_name = r.get('contextName', '')
+                val = r.get('rank', 'NR')
+
+                if 'Division' in context_name or 'Class' in context_name:
+                    div_rank = val
+                elif 'St. Louis' in context_name:
+                    stl_rank = val
+
+            found_data = True
+        except (KeyError, ValueError, AttributeError):
+            pass
+
+    # Fallback: Scrape HTML if JSON fails
+    if not found_data:
+        # Simple text search over the page with tags stripped
+        text = unescape(TAG_RE.sub(' ', html))
+        # Try to find state ranking (Illinois or Missouri)
+        state_pattern = r'(Illinois|Missouri)\s+#(\d+)'
+        state_match = re.search(state_pattern, text)
+        if state_match:
+            state_rank = state_match.group(2)
+            school.ranking = int(state_match.group(2))
+
+        # Try to find "St. Louis #5"
+        stl_match = re.search(r'St\. Louis\s+#(\d+)', text)
+        if stl_match: stl_rank = stl_match.group(1)
+
+    # Build formatted tooltip with state-specific labels
+    tooltip_parts = []
+    if state_rank != "NR": tooltip_parts.append(f"{state_abbrev}# {state_rank}")
+    if div_rank != "NR": tooltip_parts.append(f"{state_abbrev} Div# {div_rank}")
+    if stl_rank != "NR": tooltip_parts.append(f"STL# {stl_rank}")
+
+    if tooltip_parts:
+        school.rankings_tooltip = " | ".join(tooltip_parts)
+
+
+def load_rankings_cache() -> dict[str, dict]:
+    try:
+        with open(MAXPREPS_RANKINGS_CACHE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_rankings_entry(rankings_url: str, entry: dict) -> None:
+    cache = load_rankings_cache()
+    cache[rankings_url] = entry
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{MAXPREPS_RANKINGS_CACHE}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp, MAXPREPS_RANKINGS_CACHE)
+    except OSError:
+        pass
+
+
+async def get_maxpreps_rankings(session: aiohttp.ClientSession, schedule_url: str) -> tuple[Optional[dict], Optional[str]]:
+    """Parsed rankings ({"ranking", "tooltip"}) for a school, and an error if none could be had.
+
+    Served from MAXPREPS_RANKINGS_CACHE while fresh, so most runs make no rankings request.
+    When a refresh fails the stale copy is used without an error; the tooltip can lag a week.
+    """
+    rankings_url = schedule_url.replace('/schedule/', '/rankings/')
+    entry = load_rankings_cache().get(rankings_url)
+    if entry and time.time() - entry["fetched_at"] < MAXPREPS_RANKINGS_TTL:
+        return entry, None
+
+    html_rank, err_rank = await fetch_page(session, rankings_url)
+    if err_rank:
+        return entry, None if entry else err_rank
+
+    # Detect state from URL for proper labeling
+    state_abbrev = "IL" if "/il/" in schedule_url.lower() else "MO" if "/mo/" in schedule_url.lower() else "IL"
+    ranked = School(url=schedule_url, last_updated=datetime.now())
+    with timed_parse("maxpreps_rankings", schedule_url):
+        parse_maxpreps_rankings(html_rank, ranked, state_abbrev)
+    entry = {"ranking": ranked.ranking, "tooltip": ranked.rankings_tooltip, "fetched_at": time.time()}
+    save_rankings_entry(rankings_url, entry)
+    return entry, None
+
+
+@instrumented
+async def process_school(session: aiohttp.ClientSession, schedule_url: str,
+                         frozen: Optional[dict[GameKey, Game]] = None) -> School:
     school = School(url=schedule_url, last_updated=datetime.now())
     errors = []
     
     try:
-        # 1. Fetch Schedule Page AND Rankings Page in parallel
-        rankings_url = schedule_url.replace('/schedule/', '/rankings/')
-
-        (soup_sched, err_sched), (soup_rank, err_rank) = await asyncio.gather(
-            fetch_html(session, schedule_url),
-            fetch_html(session, rankings_url)
+        # 1. Fetch Schedule Page; the Rankings Page only if its cached result is stale
+        (html_sched, err_sched), (rankings, err_rank) = await asyncio.gather(
+            fetch_page(session, schedule_url, page_type="schedule"),
+            get_maxpreps_rankings(session, schedule_url)
         )
         
         if err_sched:
@@ -388,132 +1177,25 @@ async def process_school(session: aiohttp.ClientSession, schedule_url: str) -> S
         if err_rank:
             errors.append(f"Rankings: {err_rank}")
 
-        # --- PARSE SCHEDULE (from Schedule Soup) ---
-        all_tables = soup_sched.select("table tbody")
-        schedule_table = all_tables[1] if len(all_tables) > 1 else (all_tables[0] if all_tables else None)
-        if schedule_table and not err_sched:
-            games = []
-            for tr in schedule_table.find_all('tr'):
-                tds = tr.find_all('td')
-                if not tds or len(tds) < 4:
-                    continue
-                    
-                try:
-                    game_date = datetime.strptime(tds[0].text.strip(), '%m/%d').replace(
-                        year=get_basketball_season_year(tds[0].text.strip()))
-                    ha = parse_home_away(tds[1].text)
-                    opp = tds[1].find('span', class_="name").text.rstrip('*').strip() if tds[1].find('span', class_="name") else ""
-                    tipoff = parse_tipoff_time(tds[2].text.strip())
-                    g_url = tds[2].find('a')['href'] if tds[2].find('a') else ""
-                    
-                    # Check if game is in the past - parse score if available
-                    result = None
-                    score = None
-                    if len(tds) >= 4 and game_date.date() < datetime.now().date():
-                        score_cell = tds[3].text.strip()
-                        # MaxPreps shows "W 65-58" or "L 58-65" format
-                        score_match = re.match(r'^([WL])\s*(\d+-\d+)', score_cell)
-                        if score_match:
-                            result = score_match.group(1)
-                            score = score_match.group(2)
-                    
-                    games.append(Game(
-                        date=game_date,
-                        home_away=ha,
-                        opponent=opp,
-                        tipoff_time=tipoff,
-                        game_url=g_url,
-                        result=result,
-                        score=score
-                    ))
-                except (ValueError, AttributeError):
-                    continue
-            
+        # --- PARSE SCHEDULE (table-only tree) ---
+        games = None
+        if not err_sched:
+            with timed_parse("maxpreps_schedule", schedule_url):
+                soup_sched = BeautifulSoup(html_sched, HTML_PARSER, parse_only=MAXPREPS_TABLE_STRAINER)
+                games = parse_maxpreps_schedule(soup_sched, frozen)
+        # Name, Record and Streak (from Schedule page text)
+        with timed_parse("maxpreps_team", schedule_url):
+            parse_maxpreps_team(html_sched, school)
+
+        if games is not None:
             school.schedule = games
             if not errors:
                 school.last_successful_update = datetime.now()
 
-        # Name & Record (from Schedule Soup)
-        title = soup_sched.select_one('.sub-title')
-        school.name = title.text if title else None
-
-        # Get Record and Streak from Schedule Header JSON
-        import json
-        script_sched = soup_sched.find('script', id='__NEXT_DATA__')
-        if script_sched:
-            data = json.loads(script_sched.string)
-            team_ctx = data.get('props', {}).get('pageProps', {}).get('teamContext', {}) or data.get('props', {}).get(
-                'pageProps', {}).get('team', {})
-            overall_standing = team_ctx.get('standingsData', {}).get('overallStanding', {})
-            school.record = overall_standing.get('overallWinLossTies')
-            school.streak = overall_standing.get('streak')
-            school.streak_type = overall_standing.get('streakResult')
-
-        # --- PARSE RANKINGS (from Rankings Soup) ---
-        # Detect state from URL for proper labeling
-        state_abbrev = "IL" if "/il/" in schedule_url.lower() else "MO" if "/mo/" in schedule_url.lower() else "IL"
-        
-        # We need the full rankings data which is usually better populated on the Rankings page
-        script_rank = soup_rank.find('script', id='__NEXT_DATA__')
-
-        state_rank = "NR"
-        div_rank = "NR"
-        stl_rank = "NR"
-
-        found_data = False
-
-        if script_rank:
-            try:
-                r_data = json.loads(script_rank.string)
-                # Navigate deep into rankings data
-                rank_ctx = r_data.get('props', {}).get('pageProps', {}).get('teamContext', {}) or r_data.get('props',
-                                                                                                             {}).get(
-                    'pageProps', {}).get('team', {})
-                rank_list = rank_ctx.get('rankingsData', {}).get('data', [])
-
-                for r in rank_list:
-                    # 1. State Rank (Type 1)
-                    if r.get('rankingType') == 1:
-                        val = r.get('rank', 'NR')
-                        state_rank = val
-                        school.ranking = val  # Use State rank for sorting
-
-                    # 2. Other Ranks (Check contextName, not name)
-                    context_name = r.get('contextName', '')
-                    val = r.get('rank', 'NR')
-
-                    if 'Division' in context_name or 'Class' in context_name:
-                        div_rank = val
-                    elif 'St. Louis' in context_name:
-                        stl_rank = val
-
-                found_data = True
-            except (KeyError, ValueError, AttributeError):
-                pass
-
-        # Fallback: Scrape HTML if JSON fails
-        if not found_data:
-            # Simple text search fallback for the soup
-            text = soup_rank.get_text()
-            # Try to find state ranking (Illinois or Missouri)
-            state_pattern = r'(Illinois|Missouri)\s+#(\d+)'
-            state_match = re.search(state_pattern, text)
-            if state_match:
-                state_rank = state_match.group(2)
-                school.ranking = int(state_match.group(2))
-
-            # Try to find "St. Louis #5"
-            stl_match = re.search(r'St\. Louis\s+#(\d+)', text)
-            if stl_match: stl_rank = stl_match.group(1)
-
-        # Build formatted tooltip with state-specific labels
-        tooltip_parts = []
-        if state_rank != "NR": tooltip_parts.append(f"{state_abbrev}# {state_rank}")
-        if div_rank != "NR": tooltip_parts.append(f"{state_abbrev} Div# {div_rank}")
-        if stl_rank != "NR": tooltip_parts.append(f"STL# {stl_rank}")
-
-        if tooltip_parts:
-            school.rankings_tooltip = " | ".join(tooltip_parts)
+        # --- RANKINGS (parsed and cached separately) ---
+        if rankings:
+            school.ranking = rankings["ranking"]
+            school.rankings_tooltip = rankings["tooltip"]
         
         # Store any errors encountered
         if errors:
@@ -528,19 +1210,20 @@ async def process_school(session: aiohttp.ClientSession, schedule_url: str) -> S
 
 
 # --- SWIC LOGIC ---
+@instrumented
 async def extract_future_swic_games(session: aiohttp.ClientSession):
     school = School(name="SWIC", url=SWIC_URL, last_updated=datetime.now())
     errors = []
     
     try:
-        soup, err_schedule = await fetch_html(session, SWIC_URL)
+        soup, err_schedule = await fetch_html(session, SWIC_URL, page_type="schedule")
         if err_schedule:
             errors.append(f"Schedule: {err_schedule}")
         
         record_url = get_swic_record_url()
 
         # Get Record (Robust Regex)
-        record_soup, err_record = await fetch_html(session, record_url)
+        record_soup, err_record = await fetch_html(session, record_url, page_type="schedule")
         if err_record:
             errors.append(f"Record: {err_record}")
         
@@ -605,6 +1288,7 @@ async def extract_future_swic_games(session: aiohttp.ClientSession):
 
 
 # --- VINCENNES LOGIC ---
+@instrumented
 async def extract_future_vincennes_games(session: aiohttp.ClientSession):
     """Extract Vincennes University home games from govutrailblazers.com schedule."""
     season = get_current_season_slug()
@@ -614,11 +1298,11 @@ async def extract_future_vincennes_games(session: aiohttp.ClientSession):
     errors = []
 
     try:
-        soup, err_schedule = await fetch_html(session, schedule_url)
+        soup, err_schedule = await fetch_html(session, schedule_url, page_type="schedule")
         if err_schedule:
             errors.append(f"Schedule: {err_schedule}")
 
-        record_soup, err_record = await fetch_html(session, record_url)
+        record_soup, err_record = await fetch_html(session, record_url, page_type="schedule")
         if err_record:
             errors.append(f"Record: {err_record}")
 
@@ -707,75 +1391,314 @@ async def extract_future_vincennes_games(session: aiohttp.ClientSession):
 
 
 # --- COLLEGE LOGIC ---
-async def process_single_college(session: aiohttp.ClientSession, url: str) -> School:
+def parse_espn_team(soup: BeautifulSoup, school: School,
+                    frozen: Optional[dict[GameKey, Game]] = None) -> None:
+    """Fill in name, record, AP ranking and schedule from an ESPN team page.
+
+    Games matching a frozen (completed, stored) game reuse it without parsing the rest of the tile.
+    """
+    name_el = soup.find('span', class_='db pr3 nowrap fw-bold')
+    school.name = name_el.text if name_el else None
+
+    rec_ul = soup.find('ul', class_='ClubhouseHeader__Record')
+    if rec_ul:
+        lis = rec_ul.find_all('li')
+        if len(lis) > 0: school.record = lis[0].text
+        if len(lis) > 1:
+            match = re.search(r'#(\d+)', lis[1].text)
+            if match: school.ranking = int(match.group(1))
+
+    games = []
+    for a in soup.find_all('a', class_='Schedule__Game', href=True):
+        if a.find('span', class_='Schedule__Time'):
+            try:
+                d_txt = a.find('span', class_='Schedule__Time').text.strip()
+                parsed_dt = datetime.strptime(f"{d_txt}/{get_basketball_season_year(d_txt)}", '%m/%d/%Y')
+                opponent = a.find('span', class_='Schedule__Team').text.strip().upper()
+                if frozen and game_key(parsed_dt, opponent) in frozen:
+                    games.append(frozen[game_key(parsed_dt, opponent)])
+                    continue
+
+                ha_span = a.find('span', class_='Schedule_atVs')
+                ha = parse_home_away(ha_span.text) if ha_span else "Neutral"
+
+                times = a.find_all('span', class_='Schedule__Time')
+                t_str = times[1].text.strip().upper() if len(times) > 1 else None
+                tipoff = datetime.strptime(t_str, "%I:%M %p") if (
+                            ha == "Home" and t_str and parsed_dt >= datetime.now()) else None
+
+                # Check for score/result if game is in past
+                result = None
+                score = None
+                if parsed_dt.date() < datetime.now().date():
+                    score_div = a.find('div', class_='Schedule__Score')
+                    if score_div:
+                        result, score = parse_past_game_scores(score_div.text)
+
+                games.append(Game(
+                    date=parsed_dt,
+                    home_away=ha,
+                    opponent=opponent,
+                    tipoff_time=tipoff,
+                    game_url=a['href'],
+                    result=result,
+                    score=score
+                ))
+            except (ValueError, AttributeError):
+                continue
+
+    school.schedule = games
+
+
+def espn_schedule_api_url(team_url: str) -> Optional[str]:
+    match = ESPN_TEAM_ID_RE.search(team_url)
+    return ESPN_SCHEDULE_API.format(team_id=match.group(1)) if match else None
+
+
+def parse_espn_schedule(data: dict, school: School,
+                        frozen: Optional[dict[GameKey, Game]] = None) -> None:
+    """Fill in name, record, AP ranking and schedule from ESPN's team schedule API.
+
+    Produces the same fields as parse_espn_team: the name is the team's location ("Saint Louis"),
+    opponents are upper-cased locations, and scores read winner first ("75-60").
+    """
+    team = data.get("team") or {}
+    team_id = team.get("id")
+    school.name = team.get("location")
+    school.record = team.get("recordSummary")
+
+    games = []
+    for event in data.get("events", []):
+        try:
+            competition = event["competitions"][0]
+            ours = next(c for c in competition["competitors"] if c.get("id") == team_id)
+            theirs = next(c for c in competition["competitors"] if c.get("id") != team_id)
+            # Event times are UTC; the local date is what the page shows
+            start = datetime.fromisoformat(event["date"].replace("Z", "+00:00")).astimezone().replace(tzinfo=None)
+            game_date = start.replace(hour=0, minute=0, second=0, microsecond=0)
+            opponent = theirs["team"]["location"].strip().upper()
+
+            if ours.get("curatedRank"):
+                # Events are in date order, so the latest poll wins; unranked teams are 99
+                rank = ours["curatedRank"].get("current")
+                school.ranking = rank if rank and 1 <= rank <= 25 else None
+            if frozen and game_key(game_date, opponent) in frozen:
+                games.append(frozen[game_key(game_date, opponent)])
+                continue
+
+            ha = "Away" if ours.get("homeAway") == "away" else "Home"
+            tipoff = start if (ha == "Home" and competition.get("timeValid") and start >= datetime.now()) else None
+
+            result = None
+            score = None
+            if competition.get("status", {}).get("type", {}).get("completed"):
+                points = sorted((int(c["score"]["value"]) for c in (ours, theirs)), reverse=True)
+                result = "W" if ours.get("winner") else "L"
+                score = f"{points[0]}-{points[1]}"
+
+            links = event.get("links") or [{}]
+            games.append(Game(
+                date=game_date,
+                home_away=ha,
+                opponent=opponent,
+                tipoff_time=tipoff,
+                game_url=links[0].get("href"),
+                result=result,
+                score=score
+            ))
+        except (KeyError, IndexError, StopIteration, TypeError, ValueError):
+            continue
+
+    school.schedule = games
+
+
+@instrumented
+async def process_single_college(session: aiohttp.ClientSession, url: str,
+                                 frozen: Optional[dict[GameKey, Game]] = None) -> School:
+    """Fill a school from ESPN's schedule API, falling back to walking the team page."""
     school = School(url=url, last_updated=datetime.now())
     try:
-        soup, error = await fetch_html(session, url)
+        api_url = espn_schedule_api_url(url)
+        if api_url:
+            text, error = await fetch_page(session, api_url, page_type="schedule")
+            if not error:
+                try:
+                    with timed_parse("espn_schedule_json", url):
+                        parse_espn_schedule(json.loads(text), school, frozen)
+                except ValueError:
+                    pass
+
+        if not (school.name and school.schedule):
+            school = School(url=url, last_updated=datetime.now())
+            soup, error = await fetch_html(session, url, page_type="schedule")
+            if error:
+                school.fetch_error = error
+                return school
+
+            with timed_parse("espn_team", url):
+                parse_espn_team(soup, school, frozen)
+        if school.name and school.schedule:
+            school.last_successful_update = datetime.now()
+            
+    except Exception as e:
+        school.fetch_error = f"Parse error: {type(e).__name__}"
+    
+    return school
+
+
+# --- SIDEARM LOGIC ---
+def parse_sidearm_schedule(soup: BeautifulSoup, schedule_url: str) -> list[Game]:
+    """Parse a Sidearm Sports schedule page (li.sidearm-schedule-game tiles)."""
+    games = []
+    for li in soup.select("li.sidearm-schedule-game"):
+        classes = li.get("class") or []
+        ha = ("Home" if "sidearm-schedule-home-game" in classes
+              else "Away" if "sidearm-schedule-away-game" in classes else "Neutral")
+
+        opp_el = li.select_one(".sidearm-schedule-game-opponent-name")
+        date_spans = li.select(".sidearm-schedule-game-opponent-date span")
+        if not opp_el or not date_spans:
+            continue
+
+        # "Nov 5 (Tue)" / "Sept. 30"
+        m = re.match(r'([A-Za-z]{3})[a-z]*\.?\s+(\d{1,2})', date_spans[0].get_text(strip=True))
+        if not m:
+            continue
+        try:
+            dt = datetime.strptime(f"{m.group(1)} {m.group(2)} {get_basketball_season_year(m.group(1))}", "%b %d %Y")
+        except ValueError:
+            continue
+
+        tipoff = None
+        if len(date_spans) > 1:
+            # "7 p.m." -> "7:00 PM"
+            time_txt = date_spans[1].get_text(strip=True).replace(".", "").upper()
+            tipoff = parse_tipoff_time(re.sub(r'^(\d{1,2})\s*([AP]M)$', r'\1:00 \2', time_txt))
+
+        result, score = None, None
+        result_el = li.select_one(".sidearm-schedule-game-result")
+        if result_el:
+            score_match = re.search(r'([WL])\W*(\d+-\d+)', result_el.get_text(" ", strip=True))
+            if score_match:
+                result, score = score_match.group(1), score_match.group(2)
+
+        games.append(Game(
+            date=dt,
+            home_away=ha,
+            opponent=opp_el.get_text(" ", strip=True),
+            tipoff_time=tipoff,
+            game_url=schedule_url,
+            result=result,
+            score=score
+        ))
+    return games
+
+
+@instrumented
+async def process_sidearm_team(session: aiohttp.ClientSession, team: Team) -> School:
+    school = School(name=team.name, url=team.url, last_updated=datetime.now())
+    try:
+        soup, error = await fetch_html(session, team.url, page_type="schedule")
         if error:
-            school.fetch_error = error
+            school.fetch_error = f"Schedule: {error}"
             return school
-        
-        name_el = soup.find('span', class_='db pr3 nowrap fw-bold')
-        school.name = name_el.text if name_el else None
+        with timed_parse("sidearm_schedule", team.url):
+            school.schedule = parse_sidearm_schedule(soup, team.url)
 
-        rec_ul = soup.find('ul', class_='ClubhouseHeader__Record')
-        if rec_ul:
-            lis = rec_ul.find_all('li')
-            if len(lis) > 0: school.record = lis[0].text
-            if len(lis) > 1:
-                match = re.search(r'#(\d+)', lis[1].text)
-                if match: school.ranking = int(match.group(1))
+        if team.record_url:
+            record_soup, err_record = await fetch_html(session, team.record_url, page_type="schedule")
+            record_match = re.search(r'Overall\s*:?\s*(\d+-\d+)', record_soup.get_text(), re.IGNORECASE)
+            school.record = record_match.group(1) if record_match else None
+            if err_record:
+                school.fetch_error = f"Record: {err_record}"
 
-        games = []
-        for a in soup.find_all('a', class_='Schedule__Game', href=True):
-            if a.find('span', class_='Schedule__Time'):
-                try:
-                    d_txt = a.find('span', class_='Schedule__Time').text.strip()
-                    parsed_dt = datetime.strptime(f"{d_txt}/{get_basketball_season_year(d_txt)}", '%m/%d/%Y')
-
-                    ha_span = a.find('span', class_='Schedule_atVs')
-                    ha = parse_home_away(ha_span.text) if ha_span else "Neutral"
-
-                    times = a.find_all('span', class_='Schedule__Time')
-                    t_str = times[1].text.strip().upper() if len(times) > 1 else None
-                    tipoff = datetime.strptime(t_str, "%I:%M %p") if (
-                                ha == "Home" and t_str and parsed_dt >= datetime.now()) else None
-
-                    # Check for score/result if game is in past
-                    result = None
-                    score = None
-                    if parsed_dt.date() < datetime.now().date():
-                        score_div = a.find('div', class_='Schedule__Score')
-                        if score_div:
-                            # ESPN typically shows "W 75-60" or "L 60-75"
-                            score_text = score_div.text.strip()
-                            score_match = re.match(r'^([WL])\s*(\d+-\d+)', score_text)
-                            if score_match:
-                                result = score_match.group(1)
-                                score = score_match.group(2)
-
-                    games.append(Game(
-                        date=parsed_dt,
-                        home_away=ha,
-                        opponent=a.find('span', class_='Schedule__Team').text.strip().upper(),
-                        tipoff_time=tipoff,
-                        game_url=a['href'],
-                        result=result,
-                        score=score
-                    ))
-                except (ValueError, AttributeError):
-                    continue
-        
-        school.schedule = games
-        if school.name and games:
+        if school.schedule and not school.fetch_error:
             school.last_successful_update = datetime.now()
-            
     except Exception as e:
         school.fetch_error = f"Parse error: {type(e).__name__}"
-    
     return school
 
 
+# --- TEAM REGISTRY ---
+CUSTOM_SCRAPERS = {
+    "swic": extract_future_swic_games,
+    "vincennes": extract_future_vincennes_games,
+}
+# The schedule page each custom scraper fetches; its School, store entry and deadline are keyed on it
+CUSTOM_SCRAPER_URLS = {
+    "swic": lambda: SWIC_URL,
+    "vincennes": lambda: VINCENNES_SCHEDULE_URL.format(season=get_current_season_slug()),
+}
+
+
+def default_registry() -> list[Team]:
+    """The built-in teams: the URL dicts above plus the bespoke community college scrapers."""
+    teams = [Team(name, "maxpreps", "il_hs", url) for name, url in il_school_urls.items()]
+    teams += [Team(name, "maxpreps", "mo_hs", url) for name, url in mo_school_urls.items()]
+    teams += [Team(name, "espn", "d1", url) for name, url in college_urls.items()]
+    teams += [
+        Team("SWIC", "custom", "cc", CUSTOM_SCRAPER_URLS["swic"](), scraper="swic"),
+        Team("Vincennes", "custom", "cc", CUSTOM_SCRAPER_URLS["vincennes"](), scraper="vincennes"),
+    ]
+    return teams
+
+
+def load_registry() -> list[Team]:
+    """Teams from REGISTRY_PATH, or the built-in defaults. Also applies its host_concurrency overrides."""
+    try:
+        with open(REGISTRY_PATH) as f:
+            cfg = json.load(f)
+    except (OSError, ValueError):
+        return default_registry()
+
+    HOST_CONCURRENCY.update(cfg.get("host_concurrency", {}))
+    HOST_RATES.update(cfg.get("host_rates", {}))
+    global SHOW_DIAGNOSTICS
+    SHOW_DIAGNOSTICS = SHOW_DIAGNOSTICS or bool(cfg.get("diagnostics"))
+    teams = []
+    for entry in cfg.get("teams", []):
+        try:
+            team = Team(**entry)
+        except TypeError:
+            continue
+        if team.section not in SECTIONS:
+            continue
+        if team.source == "custom":
+            if team.scraper not in CUSTOM_SCRAPERS:
+                continue
+            # The scraper fetches its own page, so any configured url would key the store on the wrong page
+            team.url = CUSTOM_SCRAPER_URLS[team.scraper]()
+        if team.source in ("maxpreps", "espn", "sidearm") and not team.url:
+            continue
+        teams.append(team)
+    return teams or default_registry()
+
+
+async def process_team(session: aiohttp.ClientSession, team: Team, store: dict[str, dict]) -> School:
+    """Fetch one registry team, or render it from the store while it is within its refresh_hours."""
+    entry = store.get(team.url)
+    if team.refresh_hours and entry:
+        age = datetime.now() - datetime.fromisoformat(entry["saved_at"])
+        if age.total_seconds() < team.refresh_hours * HOUR:
+            school = School(url=team.url, last_updated=datetime.now())
+            restore_from_store(school, store)
+            return school
+
+    if team.source == "maxpreps":
+        coro = process_school(session, team.url, frozen_games(store, team.url))
+    elif team.source == "espn":
+        coro = process_single_college(session, team.url, frozen_games(store, team.url))
+    elif team.source == "sidearm":
+        coro = process_sidearm_team(session, team)
+    else:
+        coro = CUSTOM_SCRAPERS[team.scraper](session)
+    return await with_deadline(coro, team.url)
+
+
+async def no_rankings() -> RankIndex:
+    return RankIndex()
+
+
 # --- DISPLAY ---
 def generate_swiftbar_menu(schools: list[School], rank_scope: str = "", section_header: str = "", games_with_fantastical: set = None) -> None:
     """Generate SwiftBar menu. games_with_fantastical is a set of game IDs that should show Fantastical links."""
@@ -896,36 +1819,48 @@ def generate_swiftbar_menu(schools: list[School], rank_scope: str = "", section_
 
 # --- MAIN ---
 async def main():
-    connector = aiohttp.TCPConnector(limit_per_host=FETCH_LIMIT_PER_HOST)
+    started = time.perf_counter()
+    prune_page_cache()
+    teams = load_registry()
+    store = load_schedule_store()
+    connector = aiohttp.TCPConnector(limit=CONNECTION_LIMIT)
     async with aiohttp.ClientSession(connector=connector) as session:
-        il_hs_tasks = [process_school(session, u) for u in il_school_urls.values()]
-        mo_hs_tasks = [process_school(session, u) for u in mo_school_urls.values()]
-        coll_tasks = [process_single_college(session, u) for u in college_urls.values()]
-
-        il_hs_res, mo_hs_res, coll_res, swic_res, vincennes_res, net_rankings, njcaa_rankings = await asyncio.gather(
-            asyncio.gather(*il_hs_tasks, return_exceptions=True),
-            asyncio.gather(*mo_hs_tasks, return_exceptions=True),
-            asyncio.gather(*coll_tasks, return_exceptions=True),
-            extract_future_swic_games(session),
-            extract_future_vincennes_games(session),
-            fetch_ncaa_net_rankings(session),
-            fetch_njcaa_rankings(session)
+        # Every team fans out at once; HOST_CONCURRENCY keeps each host to its own budget
+        ranked = {SECTIONS[t.section][2] for t in teams}
+        team_res, net_index, njcaa_index = await asyncio.gather(
+            asyncio.gather(*(process_team(session, t, store) for t in teams), return_exceptions=True),
+            fetch_ncaa_net_rankings(session) if "net" in ranked else no_rankings(),
+            fetch_njcaa_rankings(session) if "njcaa" in ranked else no_rankings()
         )
 
-        valid_il_hs = [r for r in il_hs_res if isinstance(r, School)]
-        valid_mo_hs = [r for r in mo_hs_res if isinstance(r, School)]
-        valid_coll = [r for r in coll_res if isinstance(r, School)]
-        valid_cc = [r for r in (swic_res, vincennes_res) if isinstance(r, School)]
-
-        # Apply NCAA NET rankings to college schools
-        for s in valid_coll:
-            s.net_rank = match_school_to_net_rank(s.name, net_rankings)
-
-        # Apply NJCAA rankings to community colleges (top 25 only)
-        for s in valid_cc:
-            rank = match_school_to_njcaa_rank(s.name, njcaa_rankings)
-            if rank is not None:
-                s.ranking = rank
+        sections: dict[str, list[School]] = {key: [] for key in SECTIONS}
+        for team, res in zip(teams, team_res):
+            if isinstance(res, BaseException):
+                # A scraper bug shouldn't drop the team silently: log it and render it from the store
+                error = f"{type(res).__name__}: {res}"
+                record_event("task", "process_team", started, key=team.url, error=error)
+                res = School(url=team.url, last_updated=datetime.now(), fetch_error=error)
+                restore_from_store(res, store)
+                res.name = res.name or team.name
+            sections[team.section].append(res)
+
+        # Render anything that failed or timed out from its last good run, then remember this run
+        all_schools = [s for schools in sections.values() for s in schools]
+        for s in all_schools:
+            if s.fetch_error and not s.schedule:
+                restore_from_store(s, store)
+        save_schedule_store(store, all_schools)
+
+        for key, (_, _, rankings) in SECTIONS.items():
+            for s in sections[key]:
+                if rankings == "net":
+                    # Apply NCAA NET rankings to college schools
+                    s.net_rank = match_school_to_net_rank(s.name, net_index)
+                elif rankings == "njcaa":
+                    # Apply NJCAA rankings to community colleges (top 25 only)
+                    rank = match_school_to_njcaa_rank(s.name, njcaa_index)
+                    if rank is not None:
+                        s.ranking = rank
 
         # -- MENU BAR LOGIC --
         # Always show SF Symbol in menu bar (no game details)
@@ -936,7 +1871,7 @@ async def main():
         MAX_FANTASTICAL_LINKS = 5
         games_for_fantastical = []
 
-        for s in valid_il_hs + valid_mo_hs + valid_coll + valid_cc:
+        for s in all_schools:
             for g in s.schedule:
                 if g.home_away == "Home" and g.date.date() >= datetime.now().date() and g.tipoff_time:
                     games_for_fantastical.append((s.name, g.date, g.opponent))
@@ -945,10 +1880,12 @@ async def main():
         games_for_fantastical.sort(key=lambda x: x[1])
         games_with_fantastical = set(games_for_fantastical[:MAX_FANTASTICAL_LINKS])
 
-        generate_swiftbar_menu(valid_il_hs, "IL", "ILLINOIS HIGH SCHOOLS", games_with_fantastical)
-        generate_swiftbar_menu(valid_mo_hs, "MO", "MISSOURI HIGH SCHOOLS", games_with_fantastical)
-        if valid_cc: generate_swiftbar_menu(valid_cc, "", "COMMUNITY COLLEGE", games_with_fantastical)
-        generate_swiftbar_menu(valid_coll, "", "DIVISION I", games_with_fantastical)
+        for key, (rank_scope, header, _) in SECTIONS.items():
+            generate_swiftbar_menu(sections[key], rank_scope, header, games_with_fantastical)
+
+    history = save_run_log((time.perf_counter() - started) * 1000)
+    if SHOW_DIAGNOSTICS:
+        render_diagnostics(history)
 
 
 if __name__ == '__main__':
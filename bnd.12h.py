@@ -16,9 +16,25 @@ from datetime import datetime
 from typing import Optional, Set
 
 import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from requests.adapters import HTTPAdapter, Retry
 
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+
+def has_class(name: str) -> re.Pattern:
+    """Strainer filter for one CSS class; strainers see the raw, space-separated class attribute."""
+    return re.compile(rf'(^|\s){re.escape(name)}(\s|$)')
+
+
+# Only the main grid and the latest-news rail are ever read
+GRID_STRAINER = SoupStrainer('section', attrs={'class': has_class('grid')})
+LATEST_STRAINER = SoupStrainer('div', attrs={'data-tb-region': 'latest'})
+
 
 @dataclass
 class Article:
@@ -129,7 +145,7 @@ class BNDScraper:
             response = self.session.get("https://www.bnd.com", timeout=20, verify=True)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER, parse_only=GRID_STRAINER)
             articles = []
 
             # Get main grid articles
@@ -140,7 +156,8 @@ class BNDScraper:
                             articles.append(article)
 
             # Get latest news articles
-            if latest_section := soup.find('div', attrs={'data-tb-region': 'latest'}):
+            latest_soup = BeautifulSoup(response.text, HTML_PARSER, parse_only=LATEST_STRAINER)
+            if latest_section := latest_soup.find('div', attrs={'data-tb-region': 'latest'}):
                 for article_elem in latest_section.find_all('div', class_='package'):
                     if article := self._extract_article_from_element(article_elem, category='Latest News'):
                         articles.append(article)
@@ -14,6 +14,7 @@
 # <swiftbar.schedule>3600</swiftbar.schedule>
 
 import os
+import pickle
 import re
 import sys
 import time
@@ -29,6 +30,9 @@ FEED_URL = "https://chiefpilotsforum.com/forums/forum/5-chief-pilots-roundtable.
 # Set to True to enable debug mode (saves content to file and prints debug info)
 DEBUG = False
 
+# Parsed entries plus the feed's ETag/Last-Modified, so an unchanged feed (304) isn't re-parsed
+CACHE_FILE = os.path.expanduser("~/.cache/swiftbar_cprt.pickle")
+
 
 class MLStripper(HTMLParser):
     """Simple HTML Parser to strip HTML tags from content"""
@@ -94,15 +98,52 @@ class ForumEntry:
         return f"{self.title} ({date_str})"
 
 
-def fetch_forum_content():
-    """Fetch the forum content using requests."""
+def load_feed_cache():
+    """Load the previous run's parsed entries and validators, if any."""
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def save_feed_cache(response, entries):
+    """Store parsed entries with the response's validators for the next conditional request."""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not (etag or last_modified):
+        return
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        tmp_file = f"{CACHE_FILE}.tmp"
+        with open(tmp_file, "wb") as f:
+            pickle.dump(
+                {"etag": etag, "last_modified": last_modified, "entries": entries}, f
+            )
+        os.replace(tmp_file, CACHE_FILE)
+    except Exception:
+        pass
+
+
+def fetch_forum_content(cache=None):
+    """Fetch the forum feed using requests, conditionally when a cached copy exists.
+
+    Returns the response (200 or 304), or None on failure.
+    """
     try:
         headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36"
         }
+        if cache:
+            if cache.get("etag"):
+                headers["If-None-Match"] = cache["etag"]
+            if cache.get("last_modified"):
+                headers["If-Modified-Since"] = cache["last_modified"]
         response = requests.get(FEED_URL, headers=headers, timeout=15)
 
-        if response.status_code == 200:
+        if response.status_code == 304:
+            return response
+        elif response.status_code == 200:
             content = response.text
 
             # Save the content for debugging
@@ -115,7 +156,7 @@ def fetch_forum_content():
                 print(f"Fetched content length: {len(content)} bytes")
                 print(f"First 100 characters: {content[:100]}")
 
-            return content
+            return response
         else:
             print(f"Error: Failed to fetch data (Status code: {response.status_code})")
             return None
@@ -190,14 +231,24 @@ def parse_rss_feed(content):
     return entries
 
 
+def get_entries():
+    """Fetch the feed, reusing the cached parse when the server reports it unchanged."""
+    cache = load_feed_cache()
+    response = fetch_forum_content(cache)
+
+    if response is None:
+        return []
+    if response.status_code == 304 and cache:
+        return cache["entries"]
+
+    entries = parse_rss_feed(response.text)
+    save_feed_cache(response, entries)
+    return entries
+
+
 def main():
     # Fetch and parse the forum content
-    content = fetch_forum_content()
-
-    if content:
-        entries = parse_rss_feed(content)
-    else:
-        entries = []
+    entries = get_entries()
 
     # Count total entries
     total_entries = len(entries)
@@ -5,7 +5,7 @@
 #     "aiohttp>=3.8.0",
 #     "beautifulsoup4>=4.9.0",
 #     "feedparser>=6.0.0",
-#     "requests>=2.25.0",
+#     "lxml>=5.0.0",
 # ]
 # ///
 
@@ -14,62 +14,181 @@
 # <swiftbar.author>Derrick Hodges</swiftbar.author>
 # <swiftbar.author.github>hodgesd</swiftbar.author.github>
 # <swiftbar.desc>Combines Techmeme, Hacker News, Lobste.rs, Simon Willison, STLToday, BND, STL PR, MidAmerica Airport, and Mascoutah News in one dropdown</swiftbar.desc>
-# <swiftbar.dependencies>uv, beautifulsoup4, aiohttp, requests</swiftbar.dependencies>
+# <swiftbar.dependencies>uv, beautifulsoup4, aiohttp, feedparser</swiftbar.dependencies>
 
 import asyncio
 import datetime
+import email.utils
 import re
-from dataclasses import dataclass
-from typing import Optional
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Awaitable, Callable, Optional
 
 import aiohttp
 import feedparser
-import requests
 from aiohttp import ClientTimeout
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:  # Fall back to the slower stdlib parser
+    HTML_PARSER = 'html.parser'
 import json
 import os
+import sqlite3
 import subprocess
+import sys
+import time
 
 # Cache directory for HN comment summaries
 CACHE_DIR = os.path.expanduser("~/.cache/swiftbar_hn_summaries")
 os.makedirs(CACHE_DIR, exist_ok=True)
 
+HN_CACHE_DB = os.path.join(CACHE_DIR, "summaries.db")
+HN_CACHE_MAX_AGE = 7 * 24 * 3600  # Evict summaries older than a week
+HN_CACHE_MAX_ENTRIES = 500  # Keep at most this many summaries on disk
+HN_STALE_AFTER = 6 * 3600  # Re-summarize an active thread after this many seconds
+HN_STALE_GROWTH = 2.0  # ...or sooner once comments/points have doubled
+HN_STALE_MIN_NEW_COMMENTS = 20  # Ignore growth on tiny threads (5 -> 10 comments)
+HN_REFRESH_LOCK = os.path.join(CACHE_DIR, ".refresh.lock")
+HN_REFRESH_LOCK_MAX_AGE = 300  # Treat a lock older than this as abandoned
+
+
+def open_summary_db() -> sqlite3.Connection:
+    """Open the summary store for this run, creating the schema and importing legacy JSON files on first use."""
+    conn = sqlite3.connect(HN_CACHE_DB, timeout=5)
+    conn.row_factory = sqlite3.Row
+    # WAL lets the background refresher write while a foreground run reads
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS summaries ("
+        " story_id TEXT PRIMARY KEY,"
+        " summary TEXT NOT NULL,"
+        " num_comments INTEGER NOT NULL DEFAULT 0,"
+        " points INTEGER NOT NULL DEFAULT 0,"
+        " created_at REAL NOT NULL)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS summaries_created_at ON summaries (created_at)")
+    if conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+        migrate_json_cache(conn)
+        conn.execute("PRAGMA user_version = 1")
+    return conn
 
-def get_cached_summary(story_id: str) -> Optional[str]:
-    """Retrieve cached summary for a HN story."""
-    cache_file = os.path.join(CACHE_DIR, f"{story_id}.json")
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-                return data.get('summary')
-        except Exception:
-            return None
-    return None
 
+def migrate_json_cache(conn: sqlite3.Connection) -> None:
+    """Move summaries from the old one-file-per-story layout into the database."""
+    legacy = [name for name in os.listdir(CACHE_DIR) if name.endswith('.json')]
+    if not legacy:
+        return
+    with conn:
+        for name in legacy:
+            path = os.path.join(CACHE_DIR, name)
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+                if data.get('summary'):
+                    created_at = datetime.datetime.fromisoformat(data['timestamp']).timestamp()
+                    conn.execute(
+                        "INSERT OR IGNORE INTO summaries VALUES (?, ?, ?, ?, ?)",
+                        (name[:-5], data['summary'], data.get('num_comments', 0), data.get('points', 0), created_at),
+                    )
+                os.remove(path)
+            except Exception:
+                continue
 
-def save_summary_cache(story_id: str, summary: str) -> None:
-    """Save summary to cache."""
-    cache_file = os.path.join(CACHE_DIR, f"{story_id}.json")
+
+def get_cached_entries(conn: sqlite3.Connection, story_ids: list[str]) -> dict[str, dict]:
+    """Look up cached records (summary plus the stats it was made from) for many stories in one query."""
+    if not story_ids:
+        return {}
     try:
-        with open(cache_file, 'w') as f:
-            json.dump({
-                'story_id': story_id,
-                'summary': summary,
-                'timestamp': datetime.datetime.now().isoformat()
-            }, f)
-    except Exception as e:
+        placeholders = ','.join('?' * len(story_ids))
+        rows = conn.execute(
+            f"SELECT * FROM summaries WHERE story_id IN ({placeholders})", story_ids
+        ).fetchall()
+        return {row['story_id']: dict(row) for row in rows}
+    except sqlite3.Error:
+        return {}
+
+
+def save_summary_cache(conn: sqlite3.Connection, story_id: str, summary: str,
+                       num_comments: int = 0, points: int = 0) -> None:
+    """Save summary to cache along with the thread stats it was generated from."""
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?)",
+                (story_id, summary, num_comments, points, time.time()),
+            )
+    except sqlite3.Error:
         pass  # Silently fail on cache write
 
 
-def get_hn_discussion_summary(story_id: str) -> str:
-    """Fetch HN discussion summary using LLM with caching."""
-    # Check cache first
-    cached = get_cached_summary(story_id)
-    if cached:
-        return cached
+def is_summary_stale(entry: dict, hit: dict) -> bool:
+    """True when the thread has grown enough since it was summarized to warrant a refresh."""
+    cached_comments = entry.get('num_comments', 0)
+    cached_points = entry.get('points', 0)
+    num_comments = hit.get('num_comments') or 0
+    points = hit.get('points') or 0
+
+    new_comments = num_comments - cached_comments
+    if new_comments >= HN_STALE_MIN_NEW_COMMENTS and num_comments >= cached_comments * HN_STALE_GROWTH:
+        return True
+    if cached_points and points >= cached_points * HN_STALE_GROWTH:
+        return True
+
+    age = time.time() - entry.get('created_at', 0)
+    return age > HN_STALE_AFTER and new_comments > 0
+
+
+def prune_summary_cache(conn: sqlite3.Connection) -> None:
+    """Drop summaries past HN_CACHE_MAX_AGE, then the oldest beyond HN_CACHE_MAX_ENTRIES."""
+    try:
+        with conn:
+            conn.execute("DELETE FROM summaries WHERE created_at < ?", (time.time() - HN_CACHE_MAX_AGE,))
+            conn.execute(
+                "DELETE FROM summaries WHERE story_id NOT IN "
+                "(SELECT story_id FROM summaries ORDER BY created_at DESC LIMIT ?)",
+                (HN_CACHE_MAX_ENTRIES,),
+            )
+    except sqlite3.Error:
+        pass
+
+
+def schedule_background_refresh(hits: list[dict]) -> None:
+    """Re-summarize stale stories in a detached process so this run isn't held up.
+
+    The refreshed summaries land in the cache and are served on the next run.
+    """
+    try:
+        if time.time() - os.path.getmtime(HN_REFRESH_LOCK) < HN_REFRESH_LOCK_MAX_AGE:
+            return  # A previous run is still refreshing
+    except OSError:
+        pass
+
+    args = [f"{hit.get('objectID')}:{hit.get('num_comments') or 0}:{hit.get('points') or 0}" for hit in hits]
+    try:
+        with open(HN_REFRESH_LOCK, 'w') as f:
+            f.write(str(os.getpid()))
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--refresh-hn", *args],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except Exception:
+        pass  # Refresh is best-effort; the stale summary is still shown
+
+
+async def get_hn_discussion_summary(story_id: str) -> str:
+    """Fetch HN discussion summary using LLM; the caller caches it.
 
+    llm runs as an asyncio subprocess rather than in a worker thread, so a
+    timeout or cancellation kills it instead of leaving a thread that
+    asyncio.run has to wait for at shutdown.
+    """
     try:
         # Run llm command with HN plugin (use absolute path for SwiftBar compatibility)
         cmd = [
@@ -81,31 +200,125 @@ def get_hn_discussion_summary(story_id: str) -> str:
             "summarize this discussion. 2 structured paragraphs max. focus on key insights and disagreements.",
         ]
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=15,  # Gemini 2.5 Flash: 1-3s typical, 15s allows generous buffer
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
         )
-
-        if result.returncode == 0:
-            summary = result.stdout.strip()
-            # Cache the result
-            save_summary_cache(story_id, summary)
-            return summary
+        try:
+            # Gemini 2.5 Flash: 1-3s typical, 15s allows generous buffer
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=15)
+        except BaseException:
+            # Timed out or cancelled: don't leave llm running past this run
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
+
+        if proc.returncode == 0:
+            return stdout.decode(errors="replace").strip()
         else:
             return "See HN discussion"
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return "See HN discussion"
     except FileNotFoundError:
         return "See HN discussion"  # Fallback when llm not installed
     except Exception as e:
         return "See HN discussion"
 
-import time
-from io import StringIO
-from requests.adapters import HTTPAdapter, Retry
+# LLM summaries run in parallel up to this many at once (override with HN_SUMMARY_CONCURRENCY)
+HN_SUMMARY_CONCURRENCY = int(os.environ.get("HN_SUMMARY_CONCURRENCY", "4"))
+HN_SUMMARY_TIMEOUT = 18.0  # Allow time for 15s subprocess + overhead
+HN_MAX_CONSECUTIVE_FAILURES = 3  # Stop calling the LLM after this many failures in a row
+
+
+async def summarize_hn_stories(hits: list[dict], refresh: bool = False) -> dict[str, str]:
+    """Summarize HN discussions concurrently, returning {story_id: summary}.
+
+    Cached summaries are served directly, even when stale; stale ones are
+    re-summarized in the background for the next run. The rest fan out to a
+    bounded pool. A shared circuit breaker stops launching new LLM calls once
+    too many have failed in a row (bad connection), falling back to a comment
+    count. With refresh=True every hit is re-summarized regardless of cache.
+    One cache connection serves the whole run; it and the llm subprocesses
+    are all driven from the event loop.
+    """
+    try:
+        conn = open_summary_db()
+    except sqlite3.Error:
+        conn = None  # No cache this run; summaries are still generated
+    try:
+        return await _summarize_hn_stories(conn, hits, refresh)
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+async def _summarize_hn_stories(conn: Optional[sqlite3.Connection], hits: list[dict], refresh: bool) -> dict[str, str]:
+    summaries = {}
+    pending = []
+    stale = []
+    # One batched lookup for the whole front page
+    cached = {} if refresh or conn is None else get_cached_entries(conn, [hit.get("objectID") for hit in hits])
+    for hit in hits:
+        story_id = hit.get("objectID")
+        entry = cached.get(story_id)
+        if entry:
+            summaries[story_id] = entry['summary']
+            if is_summary_stale(entry, hit):
+                stale.append(hit)
+        else:
+            pending.append(hit)
+
+    semaphore = asyncio.Semaphore(max(1, HN_SUMMARY_CONCURRENCY))
+    consecutive_failures = 0
+
+    async def summarize(hit: dict) -> None:
+        nonlocal consecutive_failures
+        story_id = hit.get("objectID")
+        fallback = f"{hit.get('num_comments', 0)} comments"
+        async with semaphore:
+            if consecutive_failures >= HN_MAX_CONSECUTIVE_FAILURES:
+                summaries[story_id] = fallback
+                return
+            try:
+                summary = await asyncio.wait_for(get_hn_discussion_summary(story_id), timeout=HN_SUMMARY_TIMEOUT)
+                # Reset failure counter on success
+                if summary != "See HN discussion":
+                    consecutive_failures = 0
+                    if conn is not None:
+                        save_summary_cache(conn, story_id, summary, hit.get('num_comments') or 0, hit.get('points') or 0)
+                else:
+                    consecutive_failures += 1
+            except Exception:
+                consecutive_failures += 1
+                summary = fallback
+            summaries[story_id] = summary
+
+    await asyncio.gather(*(summarize(hit) for hit in pending))
+    if pending and conn is not None:
+        prune_summary_cache(conn)
+    if stale:
+        schedule_background_refresh(stale)
+    return summaries
+
+
+async def refresh_hn_summaries(args: list[str]) -> None:
+    """Entry point for the detached refresher: args are story_id:num_comments:points."""
+    hits = []
+    for arg in args:
+        story_id, num_comments, points = arg.split(':')
+        hits.append({'objectID': story_id, 'num_comments': int(num_comments), 'points': int(points)})
+    try:
+        await summarize_hn_stories(hits, refresh=True)
+    finally:
+        try:
+            os.remove(HN_REFRESH_LOCK)
+        except OSError:
+            pass
+
 
 def format_hn_tooltip(summary: str) -> str:
     """Format HN discussion summary with multiline tooltip support."""
@@ -141,6 +354,42 @@ MIDAMERICA_API = "https://ws.iadsnetwork.com/rssfeeds.svc/GetRSSItems"
 REQUEST_TIMEOUT = 10
 MAX_HEADLINES = 15
 TRIM_LENGTH = 100  # Character limit for headlines
+CONNECTION_LIMIT = 20  # Total pooled connections across all sources
+CONNECTION_LIMIT_PER_HOST = 4  # Keep any one site from hogging the pool
+DNS_CACHE_TTL = 300  # Seconds to reuse resolved addresses within a run
+KEEPALIVE_TIMEOUT = 30  # Seconds an idle connection stays open for reuse
+SCRAPE_TIMEOUT = 20  # Newspaper front pages are slow; give them longer than the default
+FETCH_RETRIES = 3
+RETRY_BACKOFF = 0.5  # Base delay in seconds, doubled after each failed attempt
+MAX_RETRY_AFTER = 10  # Never wait longer than this on a server-supplied Retry-After
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Browser-like headers for the newspaper sites, which reject obvious bots
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'max-age=0',
+    'Referer': 'https://www.google.com/',
+    'Origin': 'https://www.bnd.com',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'cross-site'
+}
+
+# Last-good article snapshots per source, used for fallback and to skip slow-changing sources
+SNAPSHOT_DIR = os.path.expanduser("~/.cache/swiftbar_daily_news")
+os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+SECTION_DEADLINE = 15  # Seconds before a section falls back to its last-good snapshot
+SECTION_DEADLINES = {
+    'hn': 45,  # LLM summaries
+    'bnd': 30,  # Frequently throttled, retries take a while
+}
+# Sections that miss their deadline are re-fetched by a detached process (--refresh-sections)
+# so their snapshot is fresh next run; this bounds how long that process may take
+SECTION_REFRESH_TIMEOUT = 120
 
 # STLToday configuration
 STL_EXCLUDED_CATEGORIES = {
@@ -177,12 +426,27 @@ BND_CATEGORY_ABBREVIATIONS = {
     'Latest News': '[Latest]'
 }
 
+def has_class(name: str) -> re.Pattern:
+    """Strainer filter for one CSS class; strainers see the raw, space-separated class attribute."""
+    return re.compile(rf'(^|\s){re.escape(name)}(\s|$)')
+
+
+# Parse only the parts of each page a scraper reads; the rest of the DOM is never built
+TECHMEME_STRAINER = SoupStrainer(attrs={'class': has_class('clus')})
+LOBSTERS_STRAINER = SoupStrainer('ol', attrs={'class': has_class('stories')})
+STL_STRAINER = SoupStrainer('section', attrs={'class': has_class('block')})
+BND_GRID_STRAINER = SoupStrainer('section', attrs={'class': has_class('grid')})
+BND_LATEST_STRAINER = SoupStrainer('div', attrs={'data-tb-region': 'latest'})
+STLPR_STRAINER = SoupStrainer('ps-promo')
+
+
 @dataclass
 class Article:
     headline: str
     link: str
     summary: str = ''
     category: str = ''
+    tags: list[str] = field(default_factory=list)
 
     def with_full_link(self, base_url: str) -> 'Article':
         if not self.link.startswith('http'):
@@ -190,54 +454,239 @@ class Article:
         return self
 
 
-async def getDOM(url):
-    timeout = ClientTimeout(total=REQUEST_TIMEOUT)
+def create_session() -> aiohttp.ClientSession:
+    """Create the pooled session shared by every fetcher in a run."""
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(timeout=ClientTimeout(total=REQUEST_TIMEOUT), connector=connector)
+
+
+class NotModified(Exception):
+    """Raised on HTTP 304 so the caller reuses its last parsed result instead of re-parsing."""
+
+
+@dataclass
+class ValidatorScope:
+    """ETag/Last-Modified validators for one source's fetch, keyed by URL.
+
+    `known` comes from the source's last snapshot and is sent as conditional
+    headers; `seen` collects validators from fresh 200 responses and is saved
+    with the new snapshot.
+    """
+    known: dict
+    seen: dict = field(default_factory=dict)
+
+
+# Set per source by render_section; fetchers outside a scope make plain requests
+validator_scope: ContextVar[Optional[ValidatorScope]] = ContextVar('validator_scope', default=None)
+
+
+def conditional_headers(url: str) -> dict:
+    scope = validator_scope.get()
+    validators = scope.known.get(url) if scope else None
+    if not validators:
+        return {}
+    headers = {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+
+def check_not_modified(url: str, response: aiohttp.ClientResponse) -> None:
+    """Raise NotModified on 304; otherwise remember the response's validators for next run."""
+    if response.status == 304:
+        raise NotModified(url)
+    scope = validator_scope.get()
+    if scope is None or response.status != 200:
+        return
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        scope.seen[url] = {'etag': etag, 'last_modified': last_modified}
+
+
+def retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+    """Seconds to wait before retrying, honouring Retry-After when the server sends one."""
+    backoff = RETRY_BACKOFF * (2 ** attempt)
+    retry_after = response.headers.get('Retry-After')
+    if not retry_after:
+        return backoff
+    if retry_after.isdigit():
+        return min(float(retry_after), MAX_RETRY_AFTER)
     try:
-        async with aiohttp.ClientSession(timeout=timeout, connector=aiohttp.TCPConnector(ssl=False)) as session:
-            async with session.get(url) as response:
-                response.raise_for_status()
-                return BeautifulSoup(await response.text(), 'html.parser')
-    except Exception as e:
-        return f"--⚠️ Error fetching {url}: {e} | color=red\n"
-
-
-def setup_sync_session() -> requests.Session:
-    """Setup requests session with retry logic and headers"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'DNT': '1',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Cache-Control': 'max-age=0',
-        'Referer': 'https://www.google.com/',
-        'Origin': 'https://www.bnd.com',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'cross-site'
-    }
-    session = requests.Session()
-    session.headers.update(headers)
-
-    retry_strategy = Retry(
-        total=5,
-        backoff_factor=1,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET", "HEAD"]
+        retry_at = email.utils.parsedate_to_datetime(retry_after)
+        wait = (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+        return min(max(wait, 0.0), MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return backoff
+
+
+async def fetch_text(session: aiohttp.ClientSession, url: str, headers=None, timeout=SCRAPE_TIMEOUT) -> str:
+    """GET a page on the shared session with exponential backoff on transient failures.
+
+    Raises NotModified when the server answers a conditional request with 304.
+    """
+    headers = {**(headers or {}), **conditional_headers(url)}
+    for attempt in range(FETCH_RETRIES + 1):
+        try:
+            async with session.get(url, headers=headers, timeout=ClientTimeout(total=timeout)) as response:
+                if response.status in RETRY_STATUSES and attempt < FETCH_RETRIES:
+                    delay = retry_delay(response, attempt)
+                else:
+                    check_not_modified(url, response)
+                    response.raise_for_status()
+                    return await response.text()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt >= FETCH_RETRIES:
+                raise
+            delay = RETRY_BACKOFF * (2 ** attempt)
+        await asyncio.sleep(delay)
+    raise RuntimeError(f"Retries exhausted for {url}")
+
+
+@dataclass
+class Snapshot:
+    articles: list[Article]
+    saved_at: float
+    validators: dict = field(default_factory=dict)
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.saved_at
+
+
+def snapshot_path(name: str) -> str:
+    return os.path.join(SNAPSHOT_DIR, f"{name}.json")
+
+
+def load_snapshot(name: str) -> Optional[Snapshot]:
+    """Return the last successfully fetched articles for a source, if any."""
+    try:
+        with open(snapshot_path(name), 'r') as f:
+            data = json.load(f)
+        return Snapshot([Article(**a) for a in data['articles']], data['saved_at'], data.get('validators', {}))
+    except Exception:
+        return None
+
+
+def save_snapshot(name: str, articles: list[Article], validators: dict) -> None:
+    """Atomically persist a source's articles and HTTP validators after a successful fetch."""
+    if not articles:
+        return  # Don't replace a good snapshot with an empty page
+    path = snapshot_path(name)
+    try:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'saved_at': time.time(),
+                'articles': [asdict(a) for a in articles],
+                'validators': validators,
+            }, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def format_age(seconds: float) -> str:
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)}h"
+    return f"{int(seconds // 86400)}d"
+
+
+def render_articles(source: 'Source', articles: list[Article], note: str = '') -> str:
+    lines = [f"{source.header}\n"]
+    if note:
+        lines.append(note)
+    if articles:
+        lines.extend(source.format(article) for article in articles)
+    elif not note:
+        lines.append("--⚠️ No articles available | color=gray\n")
+    return ''.join(lines)
+
+
+async def render_section(session: aiohttp.ClientSession, source: 'Source', late: list[str]) -> str:
+    """Render one source, falling back to its last-good snapshot on failure or timeout.
+
+    Sources whose snapshot is younger than their max_age aren't fetched at all,
+    and the fetch is conditional on the snapshot's validators so an unchanged
+    page (304) reuses the snapshot without being parsed. A fetch that misses
+    its deadline is cancelled and its source name added to `late`, for
+    schedule_section_refresh to fetch after this run has printed its menu.
+    """
+    snapshot = load_snapshot(source.name)
+    if snapshot and snapshot.age < source.max_age:
+        return render_articles(source, snapshot.articles)
+
+    # The task copies the current context, so the scope only applies to this source
+    scope = ValidatorScope(snapshot.validators if snapshot else {})
+    token = validator_scope.set(scope)
+    task = asyncio.create_task(source.fetch(session))
+    validator_scope.reset(token)
+    task.add_done_callback(
+        lambda t: save_snapshot(source.name, t.result(), scope.seen) if not t.cancelled() and not t.exception() else None
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount('https://', adapter)
-    session.mount('http://', adapter)
+    try:
+        articles = await asyncio.wait_for(asyncio.shield(task), SECTION_DEADLINES.get(source.name, SECTION_DEADLINE))
+        return render_articles(source, articles)
+    except NotModified:
+        # Unchanged since the snapshot: restamp it so max_age counts from now
+        save_snapshot(source.name, snapshot.articles, snapshot.validators)
+        return render_articles(source, snapshot.articles)
+    except asyncio.TimeoutError:
+        task.cancel()
+        late.append(source.name)
+        reason = "timed out"
+        error = "--⏱ Still loading, check back next refresh | color=gray\n"
+    except Exception as e:
+        reason = "fetch failed"
+        error = f"--⚠️ Error fetching {source.label}: {e} | color=red\n"
+
+    if snapshot is None:
+        return render_articles(source, [], note=error)
+    note = f"--⏱ Last good copy from {format_age(snapshot.age)} ago ({reason}) | color=gray\n"
+    return render_articles(source, snapshot.articles, note=note)
+
 
-    return session
+def schedule_section_refresh(names: list[str]) -> None:
+    """Re-fetch timed-out sections in a detached process so this run can exit and show its menu."""
+    try:
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--refresh-sections", *names],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except Exception:
+        pass  # Best-effort; the next run simply fetches the section again
+
+
+async def refresh_section(session: aiohttp.ClientSession, source: 'Source') -> None:
+    snapshot = load_snapshot(source.name)
+    scope = ValidatorScope(snapshot.validators if snapshot else {})
+    validator_scope.set(scope)  # Each gathered coroutine runs in its own context
+    try:
+        articles = await asyncio.wait_for(source.fetch(session), SECTION_REFRESH_TIMEOUT)
+    except NotModified:
+        save_snapshot(source.name, snapshot.articles, snapshot.validators)
+    except Exception:
+        pass
+    else:
+        save_snapshot(source.name, articles, scope.seen)
 
 
-async def fetch_and_buffer(scraper):
-    buffer = StringIO()
-    await scraper(buffer)
-    return buffer.getvalue()
+async def refresh_sections(names: list[str]) -> None:
+    """Entry point for the detached section refresher: args are source names."""
+    async with create_session() as session:
+        await asyncio.gather(*(refresh_section(session, source) for source in SOURCES if source.name in names))
 
 
 def format_headline(title, url, tags=None, summary=None):
@@ -320,17 +769,52 @@ def format_stlpr_headline(article: Article) -> str:
     return f"-- {display_headline} | href={article.link} tooltip=\"{tooltip_text}\"\n"
 
 
-async def fetch_techmeme(buffer=None):
-    if buffer is None:
-        buffer = StringIO()
-    result = await getDOM(TECHMEME_URL)
-    if isinstance(result, str):
-        buffer.write(result)
-        return
+def format_article_headline(article: Article) -> str:
+    """Format a Techmeme/Lobste.rs article using its tags and summary"""
+    return format_headline(article.headline, article.link, article.tags, article.summary)
+
+
+def format_hn_headline(article: Article) -> str:
+    """Format HN story (headline already carries points/comments) with its discussion summary"""
+    # Format summary with visual structure, then escape special characters
+    formatted_summary = format_hn_tooltip(article.summary)
+    tooltip_text = (
+        formatted_summary
+        .replace("\\", "\\\\")  # Escape backslashes first
+        .replace("\n", "\\n")   # Convert newlines to literal \n for SwiftBar
+        .replace('"', '\\"')    # Escape quotes
+        .replace("|", "\\|")    # Escape pipes
+    )
+    formatted_title_escaped = article.headline.replace("|", " ").replace(
+        '"', '\\"'
+    )
+    return f'-- {formatted_title_escaped} | href={article.link} tooltip="{tooltip_text}" trim=false\n'
+
+
+def format_simonwillison_headline(article: Article) -> str:
+    """Format Simon Willison entry showing two tags, with every tag in the tooltip"""
+    full_tags = ", ".join(article.tags) if article.tags else ""
+    tooltip = f"Tags: {full_tags} -- {article.summary}" if full_tags else article.summary
+    return format_headline(article.headline, article.link, tags=article.tags[:2], summary=tooltip)
+
+
+def format_heraldpubs_headline(article: Article) -> str:
+    """Format Herald Publications search result with its source as category"""
+    # Format headline with source as category
+    display_title = f"[{article.category}] {article.headline}" if article.category else article.headline
+
+    # Escape special characters
+    display_title = display_title.replace('|', ' ').replace('"', '\\"')
+    tooltip_text = article.headline.replace('\\', '\\\\').replace('"', '\\"')
 
-    stories = result.select('.clus')
-    buffer.write(f"Techmeme | href={TECHMEME_URL} color=#00C853\n")
-    for story in stories[:MAX_HEADLINES]:
+    return f'-- {display_title} | href={article.link} tooltip="{tooltip_text}"\n'
+
+
+def parse_techmeme(html: str) -> list[Article]:
+    """Extract the lead stories and their excerpts from the Techmeme front page."""
+    result = BeautifulSoup(html, HTML_PARSER, parse_only=TECHMEME_STRAINER)
+    articles = []
+    for story in result.select('.clus')[:MAX_HEADLINES]:
         try:
             story_link = story.select_one('.ourh')['href']
             story_title = story.select_one('.ourh').text
@@ -345,99 +829,53 @@ async def fetch_techmeme(buffer=None):
                     # Get everything after the closing </strong> tag
                     after_strong = ii_html.split('</strong>', 1)[1]
                     # Parse it to extract just the text
-                    temp_soup = BeautifulSoup(after_strong, 'html.parser')
+                    temp_soup = BeautifulSoup(after_strong, HTML_PARSER)
                     excerpt_text = temp_soup.get_text(separator=' ', strip=True)
                     # Clean up leading separators (nbsp, em dash, spaces, etc.)
                     excerpt_text = re.sub(r'^[\s\xa0—–\-]+', '', excerpt_text).strip()
                     if excerpt_text:
                         summary = excerpt_text
 
-            buffer.write(format_headline(story_title, story_link, summary=summary))
+            articles.append(Article(headline=story_title, link=story_link, summary=summary))
         except Exception:
             continue
+    return articles
 
 
-async def fetch_hnt(buffer=None):
-    if buffer is None:
-        buffer = StringIO()
-    # Use Algolia API for richer metadata in a single request
-    algolia_url = "https://hn.algolia.com/api/v1/search?tags=front_page&hitsPerPage=15"
-    buffer.write(f"Hacker News | href={HN_URL} color=#FF6600\n")
+async def fetch_techmeme(session: aiohttp.ClientSession) -> list[Article]:
+    return parse_techmeme(await fetch_text(session, TECHMEME_URL, timeout=REQUEST_TIMEOUT))
 
-    try:
-        timeout = ClientTimeout(total=REQUEST_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(algolia_url) as response:
-                response.raise_for_status()
-                data = await response.json()
-
-                # Track consecutive timeouts for early bailout on bad connections
-                consecutive_timeouts = 0
-                max_consecutive_timeouts = 3  # Stop trying after 3 consecutive timeouts
-
-                for hit in data.get("hits", [])[:MAX_HEADLINES]:
-                    title = hit.get("title", "Untitled")
-                    story_id = hit.get("objectID")
-                    points = hit.get("points", 0)
-                    num_comments = hit.get("num_comments", 0)
-                    author = hit.get("author", "unknown")
-
-                    # Format title with upvotes and comments
-                    formatted_title = f"[{points}↑] {title} ({num_comments}􀌪)"
-
-                    # Fetch discussion summary from LLM with timeout protection
-                    # Skip LLM calls if we've had too many consecutive timeouts (bad connection)
-                    if consecutive_timeouts >= max_consecutive_timeouts:
-                        summary = f"{num_comments} comments"
-                    else:
-                        try:
-                            summary = await asyncio.wait_for(
-                                asyncio.to_thread(get_hn_discussion_summary, story_id),
-                                timeout=18.0,  # Allow time for 15s subprocess + overhead
-                            )
-                            # Reset timeout counter on success
-                            if summary != "See HN discussion":
-                                consecutive_timeouts = 0
-                            else:
-                                consecutive_timeouts += 1
-                        except asyncio.TimeoutError:
-                            consecutive_timeouts += 1
-                            summary = f"{num_comments} comments"
-                        except Exception:
-                            consecutive_timeouts += 1
-                            summary = f"{num_comments} comments"
-
-                    # Format summary with visual structure, then escape special characters
-                    formatted_summary = format_hn_tooltip(summary)
-                    tooltip_text = (
-                        formatted_summary
-                        .replace("\\", "\\\\")  # Escape backslashes first
-                        .replace("\n", "\\n")   # Convert newlines to literal \n for SwiftBar
-                        .replace('"', '\\"')    # Escape quotes
-                        .replace("|", "\\|")    # Escape pipes
-                    )
-                    formatted_title_escaped = formatted_title.replace("|", " ").replace(
-                        '"', '\\"'
-                    )
-
-                    buffer.write(
-                        f'-- {formatted_title_escaped} | href={HN_URL}item?id={story_id} tooltip="{tooltip_text}" trim=false\n'
-                    )
-    except Exception as e:
-        buffer.write(f"-- Error fetching HN: {e} | color=red\n")
-
-async def fetch_lobsters(buffer=None):
-    if buffer is None:
-        buffer = StringIO()
-    result = await getDOM(LOBSTERS_URL)
-    if isinstance(result, str):
-        buffer.write(result)
-        return
-
-    stories = result.select("ol.stories > li")[:MAX_HEADLINES]
-    buffer.write(f"Lobste.rs | href={LOBSTERS_URL} color=#CC2200\n")
 
-    for story in stories:
+async def fetch_hnt(session: aiohttp.ClientSession) -> list[Article]:
+    # Use Algolia API for richer metadata in a single request
+    algolia_url = "https://hn.algolia.com/api/v1/search?tags=front_page&hitsPerPage=15"
+    async with session.get(algolia_url) as response:
+        response.raise_for_status()
+        data = await response.json()
+
+    hits = data.get("hits", [])[:MAX_HEADLINES]
+    summaries = await summarize_hn_stories(hits)
+
+    # Write results back in front-page order
+    articles = []
+    for hit in hits:
+        title = hit.get("title", "Untitled")
+        story_id = hit.get("objectID")
+        points = hit.get("points", 0)
+        num_comments = hit.get("num_comments", 0)
+
+        # Format title with upvotes and comments
+        formatted_title = f"[{points}↑] {title} ({num_comments}􀌪)"
+        summary = summaries.get(story_id, f"{num_comments} comments")
+        articles.append(Article(headline=formatted_title, link=f"{HN_URL}item?id={story_id}", summary=summary))
+    return articles
+
+
+def parse_lobsters(html: str) -> list[Article]:
+    """Extract stories, tags and descriptions from the Lobsters front page."""
+    result = BeautifulSoup(html, HTML_PARSER, parse_only=LOBSTERS_STRAINER)
+    articles = []
+    for story in result.select("ol.stories > li")[:MAX_HEADLINES]:
         try:
             title_elem = story.select_one(".link > a.u-url")
             if not title_elem:
@@ -452,461 +890,347 @@ async def fetch_lobsters(buffer=None):
             if desc_elem:
                 summary = desc_elem.text.strip()
 
-            buffer.write(format_headline(title, url, tags, summary))
+            articles.append(Article(headline=title, link=url, summary=summary, tags=tags))
         except Exception:
             continue
+    return articles
 
 
-async def fetch_stltoday(buffer=None):
-    if buffer is None:
-        buffer = StringIO()
+async def fetch_lobsters(session: aiohttp.ClientSession) -> list[Article]:
+    return parse_lobsters(await fetch_text(session, LOBSTERS_URL, timeout=REQUEST_TIMEOUT))
 
-    buffer.write(f"STLToday | href={STLTODAY_URL} color=#1E88E5\n")
 
-    def sync_fetch_stl():
-        try:
-            session = setup_sync_session()
-            response = session.get(STLTODAY_URL, timeout=20)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            articles = []
-
-            blocks = soup.select('section.block')
-            for block in blocks:
-                category_elem = block.select_one('div.block-title-inner h3')
-                category = category_elem.get_text(strip=True) if category_elem else 'Uncategorized'
-
-                if category in STL_EXCLUDED_CATEGORIES:
-                    continue
+def parse_stltoday(html: str) -> list[Article]:
+    """Extract categorized articles from the STLToday front page."""
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=STL_STRAINER)
+    articles = []
 
-                # Apply category abbreviation if available
-                category = STL_CATEGORY_ABBREVIATIONS.get(category, category)
+    blocks = soup.select('section.block')
+    for block in blocks:
+        category_elem = block.select_one('div.block-title-inner h3')
+        category = category_elem.get_text(strip=True) if category_elem else 'Uncategorized'
 
-                card_grid = block.select('article')
-                for article_elem in card_grid:
-                    try:
-                        title_elem = article_elem.select_one('.card-headline a, .tnt-headline a, .tnt-asset-link')
-                        if not title_elem:
-                            continue
+        if category in STL_EXCLUDED_CATEGORIES:
+            continue
 
-                        headline = title_elem.get('aria-label') if title_elem and title_elem.has_attr('aria-label') else title_elem.get_text(strip=True)
-                        link = title_elem['href'] if title_elem else ''
-                        summary_elem = article_elem.select_one('div.card-lead p')
-                        summary = summary_elem.get_text(strip=True) if summary_elem else "No summary"
+        # Apply category abbreviation if available
+        category = STL_CATEGORY_ABBREVIATIONS.get(category, category)
 
-                        article = Article(
-                            headline=headline,
-                            link=link,
-                            summary=summary,
-                            category=category
-                        ).with_full_link(STLTODAY_URL)
+        card_grid = block.select('article')
+        for article_elem in card_grid:
+            try:
+                title_elem = article_elem.select_one('.card-headline a, .tnt-headline a, .tnt-asset-link')
+                if not title_elem:
+                    continue
 
-                        articles.append(article)
+                headline = title_elem.get('aria-label') if title_elem and title_elem.has_attr('aria-label') else title_elem.get_text(strip=True)
+                link = title_elem['href'] if title_elem else ''
+                summary_elem = article_elem.select_one('div.card-lead p')
+                summary = summary_elem.get_text(strip=True) if summary_elem else "No summary"
 
-                        if len(articles) >= MAX_HEADLINES:
-                            break
+                article = Article(
+                    headline=headline,
+                    link=link,
+                    summary=summary,
+                    category=category
+                ).with_full_link(STLTODAY_URL)
 
-                    except Exception:
-                        continue
+                articles.append(article)
 
                 if len(articles) >= MAX_HEADLINES:
                     break
 
-            return articles[:MAX_HEADLINES]
-
-        except Exception as e:
-            return [f"Error fetching STLToday: {e}"]
-
-    try:
-        articles = await asyncio.to_thread(sync_fetch_stl)
-
-        if isinstance(articles, list) and articles and isinstance(articles[0], str):
-            # Error message
-            buffer.write(f"--⚠️ {articles[0]}\n")
-        else:
-            for article in articles:
-                buffer.write(format_stl_headline(article))
-
-    except Exception as e:
-        buffer.write(f"--⚠️ Error fetching STLToday: {e} | color=red\n")
+            except Exception:
+                continue
 
+        if len(articles) >= MAX_HEADLINES:
+            break
 
-async def fetch_bnd(buffer=None):
-    if buffer is None:
-        buffer = StringIO()
+    return articles[:MAX_HEADLINES]
 
-    buffer.write(f"BND | href={BND_URL} color=#1976D2\n")
 
-    def sync_fetch_bnd():
-        try:
-            session = setup_sync_session()
-            time.sleep(1)  # Be nice to the server
-            response = session.get(BND_URL, timeout=20, verify=True)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-            articles = []
-            seen_links = set()
-
-            def normalize_link(link: str) -> str:
-                """Normalize link by removing fragments and ensuring full URL"""
-                base_link = link.split('#')[0]
-                if not base_link.startswith('http'):
-                    base_link = f"{BND_URL}{base_link}"
-                return base_link
-
-            def clean_text(text: str) -> str:
-                """Clean whitespace and newlines from text"""
-                return re.sub(r'\s+', ' ', text).strip()
-
-            def extract_article_from_element(element: Tag, category: str = '') -> Optional[Article]:
-                """Extract article information from HTML element"""
-                headline_elem = element.find('h3')
-                if not headline_elem or not (link_elem := headline_elem.find('a')):
-                    return None
-
-                link = link_elem.get('href', '')
-                normalized_link = normalize_link(link)
-
-                if not link or normalized_link in seen_links:
-                    return None
-
-                seen_links.add(normalized_link)
-
-                if not category:
-                    kicker = element.find(class_='kicker')
-                    category = clean_text(kicker.text) if kicker else ''
-
-                # Extract summary/description if available
-                summary = ''
-                summary_elem = element.find('p', class_='blurb')
-                if not summary_elem:
-                    summary_elem = element.find('div', class_='summary')
-                if not summary_elem:
-                    summary_elem = element.find('p')
-                if summary_elem:
-                    summary = clean_text(summary_elem.text)
-
-                return Article(
-                    headline=clean_text(headline_elem.text),
-                    link=link,
-                    summary=summary,
-                    category=category
-                ).with_full_link(BND_URL)
-
-            # Get main grid articles
-            if content_area := soup.find('section', class_='grid'):
-                for article_elem in content_area.find_all('article', recursive=True):
-                    if not article_elem.find_parent(class_='partner-digest-group'):
-                        if article := extract_article_from_element(article_elem):
-                            articles.append(article)
-                            if len(articles) >= MAX_HEADLINES:
-                                break
-
-            # Get latest news articles if we need more
-            if len(articles) < MAX_HEADLINES:
-                if latest_section := soup.find('div', attrs={'data-tb-region': 'latest'}):
-                    for article_elem in latest_section.find_all('div', class_='package'):
-                        if article := extract_article_from_element(article_elem, category='Latest News'):
-                            articles.append(article)
-                            if len(articles) >= MAX_HEADLINES:
-                                break
-
-            return articles[:MAX_HEADLINES]
-
-        except Exception as e:
-            return [f"Error fetching BND: {e}"]
+async def fetch_stltoday(session: aiohttp.ClientSession) -> list[Article]:
+    return parse_stltoday(await fetch_text(session, STLTODAY_URL, headers=BROWSER_HEADERS))
 
-    try:
-        articles = await asyncio.to_thread(sync_fetch_bnd)
 
-        if isinstance(articles, list) and articles and isinstance(articles[0], str):
-            # Error message
-            buffer.write(f"--⚠️ {articles[0]}\n")
-        else:
-            for article in articles:
-                buffer.write(format_bnd_headline(article))
+def parse_bnd(html: str) -> list[Article]:
+    """Extract grid and latest-news articles from the BND front page."""
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=BND_GRID_STRAINER)
+    articles = []
+    seen_links = set()
 
-    except Exception as e:
-        buffer.write(f"--⚠️ Error fetching BND: {e} | color=red\n")
+    def normalize_link(link: str) -> str:
+        """Normalize link by removing fragments and ensuring full URL"""
+        base_link = link.split('#')[0]
+        if not base_link.startswith('http'):
+            base_link = f"{BND_URL}{base_link}"
+        return base_link
 
+    def clean_text(text: str) -> str:
+        """Clean whitespace and newlines from text"""
+        return re.sub(r'\s+', ' ', text).strip()
 
-async def fetch_stlpr(buffer=None):
-    if buffer is None:
-        buffer = StringIO()
+    def extract_article_from_element(element: Tag, category: str = '') -> Optional[Article]:
+        """Extract article information from HTML element"""
+        headline_elem = element.find('h3')
+        if not headline_elem or not (link_elem := headline_elem.find('a')):
+            return None
 
-    buffer.write(f"STL PR | href={STLPR_URL} color=#0D47A1\n")
+        link = link_elem.get('href', '')
+        normalized_link = normalize_link(link)
 
-    def sync_fetch_stlpr():
-        try:
-            session = setup_sync_session()
-            response = session.get(STLPR_URL, timeout=20)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            articles = []
-
-            # Find all ps-promo elements (custom web component)
-            promos = soup.find_all('ps-promo')
-
-            for promo in promos:
-                try:
-                    # Get all links in the promo
-                    links = promo.find_all('a', href=True)
-                    if len(links) < 3:
-                        continue
-
-                    # Link structure:
-                    # Link #0: Article link (empty text, has aria-label)
-                    # Link #1: Category link (has category name as text)
-                    # Link #2: Headline link (has the full headline as text)
-                    category = links[1].get_text(strip=True)
-                    headline = links[2].get_text(strip=True)
-                    link = links[2].get('href', '')
-
-                    if not link.startswith('http'):
-                        link = f"{STLPR_URL}{link}"
-
-                    # Get description from stripped strings
-                    # Format: [Author, '/', Publication, Category, Headline, Author (again), Description]
-                    # The description is the last item in the list (if it exists and is not metadata)
-                    all_text = list(promo.stripped_strings)
-                    summary = ''
-                    if len(all_text) > 0:
-                        # The description is typically the last item
-                        last_item = all_text[-1]
-                        # Filter out non-description items:
-                        # - Category, headline
-                        # - Publication names
-                        # - Time durations (e.g., "4:12", "40:16")
-                        # - Single-character items or forward slash
-                        # - Items that appear to be author names (in one of the link texts)
-                        link_texts = [link.get_text(strip=True) for link in links]
-                        is_link_text = last_item in link_texts
-                        is_duration = ':' in last_item and len(last_item) < 10  # e.g., "4:12"
-                        is_metadata = last_item in ['/', 'St. Louis Public Radio', 'Belleville News-Democrat', 'Nebraska Public Media']
-
-                        if (last_item != category and
-                            last_item != headline and
-                            not is_link_text and
-                            not is_duration and
-                            not is_metadata and
-                            len(last_item) > 10):  # Descriptions are usually longer than 10 chars
-                            summary = last_item
-
-                    article = Article(
-                        headline=headline,
-                        link=link,
-                        summary=summary,
-                        category=category if category else 'Uncategorized'
-                    )
+        if not link or normalized_link in seen_links:
+            return None
 
+        seen_links.add(normalized_link)
+
+        if not category:
+            kicker = element.find(class_='kicker')
+            category = clean_text(kicker.text) if kicker else ''
+
+        # Extract summary/description if available
+        summary = ''
+        summary_elem = element.find('p', class_='blurb')
+        if not summary_elem:
+            summary_elem = element.find('div', class_='summary')
+        if not summary_elem:
+            summary_elem = element.find('p')
+        if summary_elem:
+            summary = clean_text(summary_elem.text)
+
+        return Article(
+            headline=clean_text(headline_elem.text),
+            link=link,
+            summary=summary,
+            category=category
+        ).with_full_link(BND_URL)
+
+    # Get main grid articles
+    if content_area := soup.find('section', class_='grid'):
+        for article_elem in content_area.find_all('article', recursive=True):
+            if not article_elem.find_parent(class_='partner-digest-group'):
+                if article := extract_article_from_element(article_elem):
                     articles.append(article)
+                    if len(articles) >= MAX_HEADLINES:
+                        break
 
+    # Get latest news articles if we need more
+    if len(articles) < MAX_HEADLINES:
+        latest_soup = BeautifulSoup(html, HTML_PARSER, parse_only=BND_LATEST_STRAINER)
+        if latest_section := latest_soup.find('div', attrs={'data-tb-region': 'latest'}):
+            for article_elem in latest_section.find_all('div', class_='package'):
+                if article := extract_article_from_element(article_elem, category='Latest News'):
+                    articles.append(article)
                     if len(articles) >= MAX_HEADLINES:
                         break
 
-                except Exception:
-                    continue
+    return articles[:MAX_HEADLINES]
 
-            return articles[:MAX_HEADLINES]
 
-        except Exception as e:
-            return [f"Error fetching STL PR: {e}"]
+async def fetch_bnd(session: aiohttp.ClientSession) -> list[Article]:
+    return parse_bnd(await fetch_text(session, BND_URL, headers=BROWSER_HEADERS))
 
-    try:
-        articles = await asyncio.to_thread(sync_fetch_stlpr)
 
-        if isinstance(articles, list) and articles and isinstance(articles[0], str):
-            # Error message
-            buffer.write(f"--⚠️ {articles[0]}\n")
-        else:
-            for article in articles:
-                buffer.write(format_stlpr_headline(article))
+def parse_stlpr(html: str) -> list[Article]:
+    """Extract ps-promo articles from the STL Public Radio front page."""
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=STLPR_STRAINER)
+    articles = []
 
-    except Exception as e:
-        buffer.write(f"--⚠️ Error fetching STL PR: {e} | color=red\n")
+    # Find all ps-promo elements (custom web component)
+    promos = soup.find_all('ps-promo')
 
+    for promo in promos:
+        try:
+            # Get all links in the promo
+            links = promo.find_all('a', href=True)
+            if len(links) < 3:
+                continue
 
-async def fetch_simonwillison(buffer=None):
-    if buffer is None:
-        buffer = StringIO()
+            # Link structure:
+            # Link #0: Article link (empty text, has aria-label)
+            # Link #1: Category link (has category name as text)
+            # Link #2: Headline link (has the full headline as text)
+            category = links[1].get_text(strip=True)
+            headline = links[2].get_text(strip=True)
+            link = links[2].get('href', '')
+
+            if not link.startswith('http'):
+                link = f"{STLPR_URL}{link}"
+
+            # Get description from stripped strings
+            # Format: [Author, '/', Publication, Category, Headline, Author (again), Description]
+            # The description is the last item in the list (if it exists and is not metadata)
+            all_text = list(promo.stripped_strings)
+            summary = ''
+            if len(all_text) > 0:
+                # The description is typically the last item
+                last_item = all_text[-1]
+                # Filter out non-description items:
+                # - Category, headline
+                # - Publication names
+                # - Time durations (e.g., "4:12", "40:16")
+                # - Single-character items or forward slash
+                # - Items that appear to be author names (in one of the link texts)
+                link_texts = [link.get_text(strip=True) for link in links]
+                is_link_text = last_item in link_texts
+                is_duration = ':' in last_item and len(last_item) < 10  # e.g., "4:12"
+                is_metadata = last_item in ['/', 'St. Louis Public Radio', 'Belleville News-Democrat', 'Nebraska Public Media']
+
+                if (last_item != category and
+                    last_item != headline and
+                    not is_link_text and
+                    not is_duration and
+                    not is_metadata and
+                    len(last_item) > 10):  # Descriptions are usually longer than 10 chars
+                    summary = last_item
+
+            article = Article(
+                headline=headline,
+                link=link,
+                summary=summary,
+                category=category if category else 'Uncategorized'
+            )
+
+            articles.append(article)
+
+            if len(articles) >= MAX_HEADLINES:
+                break
 
-    buffer.write(f"Simon Willison | href=https://simonwillison.net/ color=#F5A623\n")
+        except Exception:
+            continue
 
-    def sync_fetch():
-        feed = feedparser.parse(SIMONWILLISON_FEED)
-        entries = []
-        for entry in feed.entries[:MAX_HEADLINES]:
-            title = entry.get("title", "Untitled")
-            link = entry.get("link", "").split("#")[0]
-            tags = [t.get("term", "") for t in entry.get("tags", [])]
-            summary_html = entry.get("summary", "")
-            summary_text = BeautifulSoup(summary_html, "html.parser").get_text(" ", strip=True)
-            entries.append((title, link, tags, summary_text))
-        return entries
+    return articles[:MAX_HEADLINES]
 
-    try:
-        entries = await asyncio.to_thread(sync_fetch)
-        for title, link, tags, summary_text in entries:
-            display_tags = tags[:2]
-            full_tags = ", ".join(tags) if tags else ""
-            tooltip = f"Tags: {full_tags} -- {summary_text}" if full_tags else summary_text
-            buffer.write(format_headline(title, link, tags=display_tags, summary=tooltip))
-    except Exception as e:
-        buffer.write(f"--⚠️ Error fetching Simon Willison: {e} | color=red\n")
 
+async def fetch_stlpr(session: aiohttp.ClientSession) -> list[Article]:
+    return parse_stlpr(await fetch_text(session, STLPR_URL, headers=BROWSER_HEADERS))
 
-async def fetch_midamerica(buffer=None):
-    if buffer is None:
-        buffer = StringIO()
 
-    buffer.write(f"MidAmerica Airport | href=https://www.heraldpubs.com/mid-america-airport/ color=#43A047\n")
+async def fetch_simonwillison(session: aiohttp.ClientSession) -> list[Article]:
+    feed = feedparser.parse(await fetch_text(session, SIMONWILLISON_FEED, timeout=REQUEST_TIMEOUT))
+    articles = []
+    for entry in feed.entries[:MAX_HEADLINES]:
+        title = entry.get("title", "Untitled")
+        link = entry.get("link", "").split("#")[0]
+        tags = [t.get("term", "") for t in entry.get("tags", [])]
+        summary_html = entry.get("summary", "")
+        summary_text = BeautifulSoup(summary_html, HTML_PARSER).get_text(" ", strip=True)
+        articles.append(Article(headline=title, link=link, summary=summary_text, tags=tags))
+    return articles
 
-    try:
-        timeout = ClientTimeout(total=REQUEST_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout, connector=aiohttp.TCPConnector(ssl=False)) as session:
-            params = {
-                'type': 'keyword',
-                'query': 'Mid America Airport St. Louis',
-                'count': str(MAX_HEADLINES)
-            }
-            async with session.get(MIDAMERICA_API, params=params) as response:
-                response.raise_for_status()
-                data = await response.json()
-
-                items = data.get('d', [])
-                if not items:
-                    buffer.write("--⚠️ No articles available | color=gray\n")
-                    return
-
-                for item in items:
-                    try:
-                        # Parse HTML content to extract link and title
-                        content_html = item.get('content', '')
-                        if not content_html:
-                            continue
-
-                        soup = BeautifulSoup(content_html, 'html.parser')
-                        link_elem = soup.find('a')
-                        if not link_elem:
-                            continue
-
-                        title = link_elem.get_text(strip=True)
-                        url = link_elem.get('href', '')
-
-                        # Extract source from font tag
-                        source_elem = soup.find('font')
-                        source = source_elem.get_text(strip=True) if source_elem else ''
-
-                        # Format headline with source as category
-                        display_title = f"[{source}] {title}" if source else title
-
-                        # Escape special characters
-                        display_title = display_title.replace('|', ' ').replace('"', '\\"')
-                        tooltip_text = title.replace('\\', '\\\\').replace('"', '\\"')
-
-                        buffer.write(f'-- {display_title} | href={url} tooltip="{tooltip_text}"\n')
-
-                    except Exception:
-                        continue
 
-    except Exception as e:
-        buffer.write(f"--⚠️ Error fetching MidAmerica Airport: {e} | color=red\n")
+async def fetch_heraldpubs(session: aiohttp.ClientSession, query: str) -> list[Article]:
+    """Search the Herald Publications news feed, used for MidAmerica Airport and Mascoutah."""
+    params = {
+        'type': 'keyword',
+        'query': query,
+        'count': str(MAX_HEADLINES)
+    }
+    # The Herald Publications feed host has only ever been fetched without certificate
+    # checks (its own ssl=False session before the shared one). Keep that exemption on
+    # this request alone; every other source on the pooled connector is verified.
+    async with session.get(MIDAMERICA_API, params=params, ssl=False) as response:
+        response.raise_for_status()
+        data = await response.json()
+
+    articles = []
+    for item in data.get('d', []):
+        try:
+            # Parse HTML content to extract link and title
+            content_html = item.get('content', '')
+            if not content_html:
+                continue
+
+            soup = BeautifulSoup(content_html, HTML_PARSER)
+            link_elem = soup.find('a')
+            if not link_elem:
+                continue
+
+            # Extract source from font tag
+            source_elem = soup.find('font')
+            articles.append(Article(
+                headline=link_elem.get_text(strip=True),
+                link=link_elem.get('href', ''),
+                category=source_elem.get_text(strip=True) if source_elem else '',
+            ))
+        except Exception:
+            continue
+    return articles
 
 
-async def fetch_mascoutah(buffer=None):
-    if buffer is None:
-        buffer = StringIO()
+async def fetch_midamerica(session: aiohttp.ClientSession) -> list[Article]:
+    return await fetch_heraldpubs(session, 'Mid America Airport St. Louis')
 
-    buffer.write(f"Mascoutah News | href=https://www.heraldpubs.com/ color=#8E24AA\n")
 
-    try:
-        timeout = ClientTimeout(total=REQUEST_TIMEOUT)
-        async with aiohttp.ClientSession(timeout=timeout, connector=aiohttp.TCPConnector(ssl=False)) as session:
-            params = {
-                'type': 'keyword',
-                'query': 'Mascoutah',
-                'count': str(MAX_HEADLINES)
-            }
-            async with session.get(MIDAMERICA_API, params=params) as response:
-                response.raise_for_status()
-                data = await response.json()
-
-                items = data.get('d', [])
-                if not items:
-                    buffer.write("--⚠️ No articles available | color=gray\n")
-                    return
-
-                for item in items:
-                    try:
-                        # Parse HTML content to extract link and title
-                        content_html = item.get('content', '')
-                        if not content_html:
-                            continue
-
-                        soup = BeautifulSoup(content_html, 'html.parser')
-                        link_elem = soup.find('a')
-                        if not link_elem:
-                            continue
-
-                        title = link_elem.get_text(strip=True)
-                        url = link_elem.get('href', '')
-
-                        # Extract source from font tag
-                        source_elem = soup.find('font')
-                        source = source_elem.get_text(strip=True) if source_elem else ''
-
-                        # Format headline with source as category
-                        display_title = f"[{source}] {title}" if source else title
-
-                        # Escape special characters
-                        display_title = display_title.replace('|', ' ').replace('"', '\\"')
-                        tooltip_text = title.replace('\\', '\\\\').replace('"', '\\"')
-
-                        buffer.write(f'-- {display_title} | href={url} tooltip="{tooltip_text}"\n')
-
-                    except Exception:
-                        continue
+async def fetch_mascoutah(session: aiohttp.ClientSession) -> list[Article]:
+    return await fetch_heraldpubs(session, 'Mascoutah')
 
-    except Exception as e:
-        buffer.write(f"--⚠️ Error fetching Mascoutah News: {e} | color=red\n")
+
+@dataclass
+class Source:
+    name: str  # Snapshot key
+    label: str  # Used in error messages
+    header: str  # Submenu title line
+    fetch: Callable[[aiohttp.ClientSession], Awaitable[list[Article]]]
+    format: Callable[[Article], str]
+    max_age: float = 0  # Seconds a snapshot is fresh enough to skip the fetch entirely
+
+
+# Sources in display order
+SOURCES = [
+    Source('techmeme', 'Techmeme', f"Techmeme | href={TECHMEME_URL} color=#00C853",
+           fetch_techmeme, format_article_headline),
+    Source('hn', 'HN', f"Hacker News | href={HN_URL} color=#FF6600",
+           fetch_hnt, format_hn_headline),
+    Source('lobsters', 'Lobste.rs', f"Lobste.rs | href={LOBSTERS_URL} color=#CC2200",
+           fetch_lobsters, format_article_headline),
+    Source('simonwillison', 'Simon Willison', "Simon Willison | href=https://simonwillison.net/ color=#F5A623",
+           fetch_simonwillison, format_simonwillison_headline),
+    Source('stltoday', 'STLToday', f"STLToday | href={STLTODAY_URL} color=#1E88E5",
+           fetch_stltoday, format_stl_headline),
+    Source('bnd', 'BND', f"BND | href={BND_URL} color=#1976D2",
+           fetch_bnd, format_bnd_headline),
+    Source('stlpr', 'STL PR', f"STL PR | href={STLPR_URL} color=#0D47A1",
+           fetch_stlpr, format_stlpr_headline),
+    Source('midamerica', 'MidAmerica Airport',
+           "MidAmerica Airport | href=https://www.heraldpubs.com/mid-america-airport/ color=#43A047",
+           fetch_midamerica, format_heraldpubs_headline, max_age=6 * 3600),
+    Source('mascoutah', 'Mascoutah News', "Mascoutah News | href=https://www.heraldpubs.com/ color=#8E24AA",
+           fetch_mascoutah, format_heraldpubs_headline, max_age=6 * 3600),
+]
 
 
 async def main():
+    start = time.time()
+    late = []
+
+    # One pooled session for every source so DNS lookups and TLS handshakes are reused.
+    # SwiftBar shows the menu only once the script exits, so the per-section deadlines
+    # are what bound the run; every section is printed together at the end.
+    async with create_session() as session:
+        sections = await asyncio.gather(*(render_section(session, source, late) for source in SOURCES))
+
     # Menubar Symbol
     print("􀤦")
     print("---")
 
-    start = time.time()
-
-    techmeme, hn, lobsters, simonwillison, stltoday, bnd, stlpr, midamerica, mascoutah = await asyncio.gather(
-        fetch_and_buffer(fetch_techmeme),
-        fetch_and_buffer(fetch_hnt),
-        fetch_and_buffer(fetch_lobsters),
-        fetch_and_buffer(fetch_simonwillison),
-        fetch_and_buffer(fetch_stltoday),
-        fetch_and_buffer(fetch_bnd),
-        fetch_and_buffer(fetch_stlpr),
-        fetch_and_buffer(fetch_midamerica),
-        fetch_and_buffer(fetch_mascoutah)
-    )
-
     # Print each section sequentially
-    print(techmeme)
-    print(hn)
-    print(lobsters)
-    print(simonwillison)
-    print(stltoday)
-    print(bnd)
-    print(stlpr)
-    print(midamerica)
-    print(mascoutah)
+    for section in sections:
+        print(section)
 
     end = time.time()
     print("---")
     print(f"Updated at {datetime.datetime.now().strftime('%I:%M %p')} (fetched in {round(end - start, 2)}s)")
     print("Refresh | refresh=true")
 
+    if late:
+        schedule_section_refresh(late)
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if len(sys.argv) > 1 and sys.argv[1] == "--refresh-hn":
+        asyncio.run(refresh_hn_summaries(sys.argv[2:]))
+    elif len(sys.argv) > 1 and sys.argv[1] == "--refresh-sections":
+        asyncio.run(refresh_sections(sys.argv[2:]))
+    else:
+        asyncio.run(main())
@@ -14,7 +14,7 @@
 # <swiftbar.hideLastUpdated>false</swiftbar.hideLastUpdated>
 # <swiftbar.hideDisablePlugin>true</swiftbar.hideDisablePlugin>
 # <swiftbar.hideSwiftBar>true</swiftbar.hideSwiftBar>
-# <swiftbar.environment>[REDFIN_ADDRESS:, REDFIN_CITY:, REDFIN_STATE:, REDFIN_ZIP:, REDFIN_LAT:, REDFIN_LON:, REDFIN_RADIUS:3, REDFIN_SOLD_DAYS:90]</swiftbar.environment>
+# <swiftbar.environment>[REDFIN_ADDRESS:, REDFIN_CITY:, REDFIN_STATE:, REDFIN_ZIP:, REDFIN_LAT:, REDFIN_LON:, REDFIN_RADIUS:3, REDFIN_SOLD_DAYS:90, REDFIN_NUM_HOMES:350]</swiftbar.environment>
 
 """
 Neighborhood Real Estate Monitor — SwiftBar Plugin
@@ -42,7 +42,8 @@ SETUP — pick ONE method:
       "lat":      39.7817,
       "lon":      -89.6501,
       "radius":   3,
-      "sold_days": 90
+      "sold_days": 90,
+      "num_homes": 350
     }
 
   Method 2: Environment variables (SwiftBar settings UI)
@@ -56,16 +57,27 @@ SETUP — pick ONE method:
     REDFIN_LON       = -89.6501
     REDFIN_RADIUS    = 3        (optional, default 3)
     REDFIN_SOLD_DAYS = 90       (optional, default 90)
+    REDFIN_NUM_HOMES = 350      (optional, default 350; rows per Redfin search)
 """
 
+import bisect
 import csv
+import hashlib
+import http.client
 import io
 import json
+import math
 import os
+import queue
+import re
+import sqlite3
 import sys
 import urllib.parse
-import urllib.request
-from datetime import datetime
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 
 # ─── Configuration (loaded from config file or env vars) ─────────────────
 
@@ -92,6 +104,7 @@ def load_config():
     lon = cfg.get("lon", os.environ.get("REDFIN_LON", ""))
     radius = cfg.get("radius", os.environ.get("REDFIN_RADIUS", "3"))
     sold_days = cfg.get("sold_days", os.environ.get("REDFIN_SOLD_DAYS", "90"))
+    num_homes = cfg.get("num_homes", os.environ.get("REDFIN_NUM_HOMES", "350"))
 
     missing = []
     if not address:
@@ -147,6 +160,7 @@ def load_config():
         "lon": float(lon),
         "radius": float(radius),
         "sold_days": int(sold_days),
+        "num_homes": int(num_homes),
     }
 
 
@@ -160,9 +174,28 @@ RADIUS_MILES = _cfg["radius"]
 HOME_LAT = _cfg["lat"]
 HOME_LON = _cfg["lon"]
 SOLD_DAYS = _cfg["sold_days"]
+NUM_HOMES = _cfg["num_homes"]
 
 CACHE_DIR = os.path.expanduser(f"~/.cache/swiftbar-plugins/{_PLUGIN_NAME}")
-CACHE_TTL_SEC = 3500  # slightly under 1h to stay fresh
+HOUR = 3600
+# Per-key freshness; each TTL is a little under its period so an on-schedule refresh isn't skipped
+CACHE_TTLS = {
+    "home_estimate.json": 24 * HOUR - 100,  # The AVM moves about daily
+    "sold.csv": 4 * HOUR - 100,
+    "active.csv": HOUR - 100,
+}
+
+# Listing history is data, not cache: it lives outside CACHE_DIR so "Clear Cache" keeps it
+DATA_DIR = os.path.expanduser(f"~/.local/share/swiftbar-plugins/{_PLUGIN_NAME}")
+HISTORY_DB = os.path.join(DATA_DIR, "history.sqlite3")
+DOM_TREND_SNAPSHOTS = 5
+HISTORY_RETENTION_DAYS = 180
+
+REDFIN_HOST = "www.redfin.com"
+REQUEST_TIMEOUT = 30
+# One keep-alive connection per concurrent branch: the AVM chain, active and sold listings
+POOL_SIZE = 3
+MAX_REDIRECTS = 3
 
 UA = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) "
@@ -236,61 +269,672 @@ def short_addr(full_addr):
     return full_addr.strip()[:28] if full_addr else "—"
 
 
-def haversine_miles(lat1, lon1, lat2, lon2):
-    """Quick haversine for filtering by radius."""
-    import math
+# ─── Redfin HTTP helpers ────────────────────────────────────────────────
 
-    R = 3958.8
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
-    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(
-        math.radians(lat2)
-    ) * math.sin(dlon / 2) ** 2
-    return R * 2 * math.asin(math.sqrt(a))
 
+_connections = queue.LifoQueue()
 
-# ─── Redfin HTTP helpers ────────────────────────────────────────────────
+
+@contextmanager
+def redfin_connection():
+    """Borrow a keep-alive connection to Redfin; it goes back to the pool unless it failed."""
+    try:
+        conn = _connections.get_nowait()
+    except queue.Empty:
+        conn = http.client.HTTPSConnection(REDFIN_HOST, timeout=REQUEST_TIMEOUT)
+    try:
+        yield conn
+    except BaseException:
+        conn.close()
+        raise
+    _connections.put(conn)
+
+
+def _request(path):
+    """One GET over a pooled connection. Returns (status, Location header, body)."""
+    headers = {
+        "User-Agent": UA,
+        "Accept": "text/csv,application/json,text/html,*/*",
+        "Referer": "https://www.redfin.com/",
+    }
+    for attempt in range(2):
+        with redfin_connection() as conn:
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # The server dropped an idle keep-alive connection; retry once, which reconnects
+                conn.close()
+                if attempt:
+                    raise
+                continue
+            body = resp.read()
+            return resp.status, resp.getheader("Location"), body.decode("utf-8", errors="replace")
 
 
 def redfin_get(url, params=None):
-    """GET with Redfin-compatible headers. Returns str body."""
+    """GET with Redfin-compatible headers over the keep-alive pool. Returns str body.
+
+    Raises on network errors and non-2xx responses; main() turns those into the error menu.
+    """
     if params:
         url = url + "?" + urllib.parse.urlencode(params)
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": UA,
-            "Accept": "text/csv,application/json,text/html,*/*",
-            "Referer": "https://www.redfin.com/",
-        },
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return resp.read().decode("utf-8", errors="replace")
-    except Exception as e:
-        print("⌂ —", flush=True)
-        print("---", flush=True)
-        print(f"Redfin fetch error | {ANSI_MONOSPACE} {ACCENT_RED}", flush=True)
-        print(f"{e} | {ANSI_MONOSPACE} {DIMMED} size=10", flush=True)
-        sys.exit(0)
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        if parts.netloc != REDFIN_HOST:
+            raise ValueError(f"Unexpected host {parts.netloc}")
+        status, location, body = _request(urllib.parse.urlunsplit(("", "", parts.path, parts.query, "")))
+        if status in (301, 302, 303, 307, 308) and location:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        if status >= 400:
+            raise http.client.HTTPException(f"HTTP Error {status} for {parts.path}")
+        return body
+    raise http.client.HTTPException(f"Too many redirects for {url}")
+
+
+def print_fetch_error(e):
+    print("⌂ —", flush=True)
+    print("---", flush=True)
+    print(f"Redfin fetch error | {ANSI_MONOSPACE} {ACCENT_RED}", flush=True)
+    print(f"{e} | {ANSI_MONOSPACE} {DIMMED} size=10", flush=True)
+
+
+REDFIN_CSV_URL = "https://www.redfin.com/stingray/api/gis-csv"
+ACTIVE_STATUS = "9"  # active, contingent and pending
+SOLD_STATUS = "130"
+
+
+def redfin_csv_params(status, **extra):
+    """Query parameters for a gis-csv search of SEARCH_ZIP."""
+    return {
+        "al": "1",
+        "num_homes": str(NUM_HOMES),
+        "page_number": "1",
+        "region_id": SEARCH_ZIP,
+        "region_type": "2",
+        "sf": "1,2,3,5,6,7",
+        "sp": "true",
+        "status": status,
+        "uipt": "1,2,3,4,5,6,7,8",
+        "v": "8",
+        **extra,
+    }
+
+
+# Outcome of each get_cached key this run: "hit", "miss" or "stale" (plus the error for stale)
+CACHE_OUTCOMES = {}
 
 
 def get_cached(key, fetcher):
-    """Simple file-cache wrapper."""
+    """File cache with a per-key TTL from CACHE_TTLS.
+
+    Fresh entries are returned without fetching. Writes go through a temp file and
+    os.replace, so a crash never leaves a truncated entry. If the fetch raises or
+    returns an empty body, the cached copy is served at any age (stale-if-error);
+    with no copy at all the error propagates. A fetcher returns None when there is
+    simply nothing to fetch: that isn't an error, so the cached copy is served if
+    there is one and None otherwise.
+    """
     os.makedirs(CACHE_DIR, exist_ok=True)
     path = os.path.join(CACHE_DIR, key)
+    cached = None
     if os.path.exists(path):
+        with open(path, "r") as f:
+            cached = f.read()
         age = datetime.now().timestamp() - os.path.getmtime(path)
-        if age < CACHE_TTL_SEC:
-            with open(path, "r") as f:
-                return f.read()
-    data = fetcher()
-    if data:
-        with open(path, "w") as f:
-            f.write(data)
+        if cached and age < CACHE_TTLS[key]:
+            CACHE_OUTCOMES[key] = ("hit", None)
+            return cached
+
+    try:
+        data = fetcher()
+        if data is None:
+            CACHE_OUTCOMES[key] = ("stale", "nothing new returned") if cached else ("miss", None)
+            return cached
+        if not data:
+            raise ValueError("empty response")
+    except Exception as e:
+        if not cached:
+            raise
+        CACHE_OUTCOMES[key] = ("stale", e)
+        return cached
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    CACHE_OUTCOMES[key] = ("miss", None)
     return data
 
 
+def print_cache_footer():
+    """Hit/miss counts for this run, and a warning per entry served stale."""
+    counts = {}
+    for outcome, _ in CACHE_OUTCOMES.values():
+        counts[outcome] = counts.get(outcome, 0) + 1
+    summary = "  ·  ".join(f"{counts.get(k, 0)} {k}" for k in ("hit", "miss", "stale"))
+    print(f"Cache  {summary} | {ANSI_MONOSPACE} {DIMMED} size=10")
+    for key, (outcome, error) in sorted(CACHE_OUTCOMES.items()):
+        if outcome == "stale":
+            age = (datetime.now().timestamp() - os.path.getmtime(os.path.join(CACHE_DIR, key))) / HOUR
+            print(
+                f"⚠ {key} is {age:.0f}h old: {error} | {ANSI_MONOSPACE} {ACCENT_ORANGE} size=10"
+            )
+
+
+# ─── Redfin CSV parsing ─────────────────────────────────────────────────
+
+
+EARTH_RADIUS_MILES = 3958.8
+
+# Numeric gis-csv columns kept as typed arrays; blanks and junk become NaN
+NUMERIC_COLUMNS = {
+    "price": "PRICE",
+    "beds": "BEDS",
+    "baths": "BATHS",
+    "sqft": "SQUARE FEET",
+    "ppsf": "$/SQUARE FEET",
+    "dom": "DAYS ON MARKET",
+    "lat": "LATITUDE",
+    "lon": "LONGITUDE",
+}
+ACTIVE_STATUSES = {"active", "active (hot home)", "contingent"}
+PENDING_STATUSES = {"pending"}
+DOM_BUCKETS = (7, 30, 90)  # Upper bounds (days) of the DOM distribution buckets
+PRICE_BANDS = (250_000, 500_000, 750_000, 1_000_000)  # Upper bounds of the price bands
+
+
+def _to_float(val):
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return math.nan
+
+
+def _present(v):
+    return v if v == v else None
+
+
+@dataclass(slots=True)
+class Listing:
+    """One gis-csv row with its fields converted once; missing numbers are None."""
+
+    address: str
+    status: str  # Lower-cased STATUS
+    url: str
+    property_id: str  # Redfin property ID from the URL, else "mls:<MLS#>"
+    price: float | None
+    beds: float | None
+    baths: float | None
+    sqft: float | None
+    ppsf: float | None
+    dom: float | None
+    sold_date: date | None
+    distance: float | None = None
+
+
+PROPERTY_ID_RE = re.compile(r"/home/(\d+)")
+
+
+def listing_key(url, mls, address):
+    """Stable identity for a listing across snapshots."""
+    match = PROPERTY_ID_RE.search(url)
+    if match:
+        return match.group(1)
+    return f"mls:{mls}" if mls else f"addr:{address.lower()}"
+
+
+def parse_sold_date(val):
+    """Redfin writes SOLD DATE as "March-5-2024"."""
+    try:
+        return datetime.strptime(val, "%B-%d-%Y").date()
+    except (ValueError, TypeError):
+        return None
+
+
+def bounding_box(lat, lon, radius_miles):
+    """Half-widths (degrees of latitude, longitude) of a box enclosing the radius circle."""
+    reach = radius_miles / EARTH_RADIUS_MILES  # Angular radius
+    # Widest longitude offset of the circle, reached slightly poleward of lat
+    ratio = math.sin(reach) / math.cos(math.radians(lat))
+    return math.degrees(reach), math.degrees(math.asin(ratio)) if ratio < 1 else 180.0
+
+
+def radius_filter(lats, lons, lat, lon, radius_miles):
+    """(index, distance) of each coordinate within radius_miles of (lat, lon).
+
+    Callers pass only coordinates already inside bounding_box, so haversine
+    runs once over the rows a wide search can't rule out on raw degrees.
+    """
+    lat0, lon0 = math.radians(lat), math.radians(lon)
+    cos0 = math.cos(lat0)
+    sin, cos, radians = math.sin, math.cos, math.radians
+    distances = [
+        2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(
+            sin((radians(lats[i]) - lat0) / 2) ** 2
+            + cos0 * cos(radians(lats[i])) * sin((radians(lons[i]) - lon0) / 2) ** 2
+        ))
+        for i in range(len(lats))
+    ]
+    return [(i, d) for i, d in enumerate(distances) if d <= radius_miles]
+
+
+class ListingTable:
+    """A gis-csv body parsed once: a Listing per row for display, plus one
+    array('d') per NUMERIC_COLUMNS entry for the bulk stats.
+
+    Filters return a new table over the selected listings, so the status
+    views never re-read the CSV.
+    """
+
+    def __init__(self, listings, columns):
+        self.listings = listings
+        self.columns = columns
+
+    @classmethod
+    def from_csv(cls, raw, near=None):
+        """Parse raw; near=(lat, lon, radius_miles) keeps only listings within the radius.
+
+        Rows are streamed through the radius's bounding box and only
+        coordinates are read before the radius filter, so rows outside it are
+        neither kept nor converted.
+        """
+        reader = csv.reader(io.StringIO(raw or ""))
+        header = next(reader, [])
+        pos = {name: i for i, name in enumerate(header)}
+        numeric = [(name, pos.get(field)) for name, field in NUMERIC_COLUMNS.items()]
+        url_pos = next((i for i, name in enumerate(header) if name.startswith("URL")), None)
+        address_pos, status_pos, sold_pos = pos.get("ADDRESS"), pos.get("STATUS"), pos.get("SOLD DATE")
+        mls_pos = pos.get("MLS#")
+
+        def cell(rec, i):
+            return rec[i] if i is not None and i < len(rec) else ""
+
+        if near:
+            lat, lon, radius_miles = near
+            dlat, dlon = bounding_box(lat, lon, radius_miles)
+            lat_pos, lon_pos = pos.get("LATITUDE"), pos.get("LONGITUDE")
+            records, lats, lons = [], array("d"), array("d")
+            for rec in reader:
+                rec_lat, rec_lon = _to_float(cell(rec, lat_pos)), _to_float(cell(rec, lon_pos))
+                if abs(rec_lat - lat) <= dlat and abs(rec_lon - lon) <= dlon:  # NaN fails both
+                    records.append(rec)
+                    lats.append(rec_lat)
+                    lons.append(rec_lon)
+            selected = radius_filter(lats, lons, lat, lon, radius_miles)
+        else:
+            records = list(reader)
+            selected = [(i, None) for i in range(len(records))]
+
+        listings = []
+        columns = {name: array("d") for name in NUMERIC_COLUMNS}
+        for i, distance in selected:
+            rec = records[i]
+            values = {}
+            for name, col in numeric:
+                values[name] = v = _to_float(cell(rec, col))
+                columns[name].append(v)
+            address, url = cell(rec, address_pos).strip(), cell(rec, url_pos)
+            listings.append(Listing(
+                address=address,
+                status=cell(rec, status_pos).strip().lower(),
+                url=url,
+                property_id=listing_key(url, cell(rec, mls_pos).strip(), address),
+                price=_present(values["price"]),
+                beds=_present(values["beds"]),
+                baths=_present(values["baths"]),
+                sqft=_present(values["sqft"]),
+                ppsf=_present(values["ppsf"]),
+                dom=_present(values["dom"]),
+                sold_date=parse_sold_date(cell(rec, sold_pos)),
+                distance=distance,
+            ))
+        return cls(listings, columns)
+
+    def __len__(self):
+        return len(self.listings)
+
+    def take(self, indices):
+        return ListingTable(
+            [self.listings[i] for i in indices],
+            {name: array("d", [col[i] for i in indices]) for name, col in self.columns.items()},
+        )
+
+    def with_status(self, statuses):
+        """Listings whose lower-cased status is in statuses."""
+        return self.take([i for i, listing in enumerate(self.listings) if listing.status in statuses])
+
+    def sorted_by(self, key, reverse=False):
+        """Listings ordered by key(listing)."""
+        order = sorted(range(len(self.listings)), key=lambda i: key(self.listings[i]), reverse=reverse)
+        return self.take(order)
+
+    def values(self, name):
+        """Sorted non-missing values of a numeric column."""
+        return sorted(v for v in self.columns[name] if v == v)
+
+
+def percentile(values, q):
+    """Linearly interpolated q-th percentile (0-100) of already-sorted values."""
+    if not values:
+        return None
+    pos = (len(values) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+
+def bucket_counts(values, bounds):
+    """Counts of sorted values in (-inf, b0], (b0, b1], ..., (bn, inf)."""
+    edges = [0] + [bisect.bisect_right(values, b) for b in bounds] + [len(values)]
+    return [edges[i + 1] - edges[i] for i in range(len(edges) - 1)]
+
+
+def summarize(table):
+    """Price, $/sqft and days-on-market statistics for a table, computed in one pass per column."""
+    prices = table.values("price")
+    ppsf = table.values("ppsf")
+    dom = table.values("dom")
+    return {
+        "price_median": percentile(prices, 50),
+        "price_min": prices[0] if prices else None,
+        "price_max": prices[-1] if prices else None,
+        "price_bands": bucket_counts(prices, PRICE_BANDS),
+        "ppsf_p25": percentile(ppsf, 25),
+        "ppsf_median": percentile(ppsf, 50),
+        "ppsf_p75": percentile(ppsf, 75),
+        "dom_median": percentile(dom, 50),
+        "dom_buckets": bucket_counts(dom, DOM_BUCKETS),
+    }
+
+
+def band_labels(bounds, fmt):
+    """Human labels for bucket_counts buckets: "≤a", "a–b", ..., ">z"."""
+    labels = [f"≤{fmt(bounds[0])}"]
+    labels += [f"{fmt(lo)}–{fmt(hi)}" for lo, hi in zip(bounds, bounds[1:])]
+    labels.append(f">{fmt(bounds[-1])}")
+    return labels
+
+
+def print_market_stats(stats):
+    """Submenu of bulk statistics under a section's median line."""
+    print(f"     Market stats | {ANSI_MONOSPACE} {DIMMED} size=11")
+    if stats["ppsf_median"] is not None:
+        print(
+            f"--$/SF  p25 {fmt_ppsf(stats['ppsf_p25'])}  ·  median {fmt_ppsf(stats['ppsf_median'])}"
+            f"  ·  p75 {fmt_ppsf(stats['ppsf_p75'])} | {ANSI_MONOSPACE} size=11"
+        )
+    bands = band_labels(PRICE_BANDS, lambda v: fmt_price(v).replace(",000", "K"))
+    print(f"--Price bands | {ANSI_MONOSPACE} {LABEL_COLOR} size=10")
+    for label, n in zip(bands, stats["price_bands"]):
+        print(f"--  {label:<20} {n:>4} | {ANSI_MONOSPACE} size=11")
+    if stats["dom_median"] is not None:
+        print(f"--Days on market  (median {fmt_dom(stats['dom_median'])}) | {ANSI_MONOSPACE} {LABEL_COLOR} size=10")
+        for label, n in zip(band_labels(DOM_BUCKETS, lambda v: f"{v}d"), stats["dom_buckets"]):
+            print(f"--  {label:<20} {n:>4} | {ANSI_MONOSPACE} size=11")
+
+
+def parse_listings(raw):
+    """Parse a Redfin gis-csv body once into a ListingTable of listings within RADIUS_MILES of home.
+
+    Sections take their views with with_status() instead of parsing the body again.
+    """
+    try:
+        return ListingTable.from_csv(raw, near=(HOME_LAT, HOME_LON, RADIUS_MILES))
+    except Exception:
+        return ListingTable.from_csv("")
+
+
+# ─── Listing history ────────────────────────────────────────────────────
+#
+# Every snapshot that differs from the last one of its source ("active" or
+# "sold") is appended to observations. listing_state holds each listing's
+# latest status and price per source and is the index new snapshots are
+# diffed against, so a sold price is never compared with a list price and a
+# home relisted while it is still in the sold search doesn't flip between the
+# two. properties holds what the sources share (address, URL, first seen).
+# Differences become events: "new", "price_cut" and "status" (e.g. active ->
+# pending -> sold). Snapshots older than HISTORY_RETENTION_DAYS are pruned
+# with their observations and events.
+
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    taken_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_by_time ON snapshots (taken_at);
+CREATE TABLE IF NOT EXISTS observations (
+    snapshot_id INTEGER NOT NULL,
+    property_id TEXT NOT NULL,
+    status TEXT,
+    price REAL,
+    dom REAL
+);
+CREATE INDEX IF NOT EXISTS observations_by_property ON observations (property_id, snapshot_id);
+CREATE INDEX IF NOT EXISTS observations_by_snapshot ON observations (snapshot_id);
+CREATE TABLE IF NOT EXISTS properties (
+    property_id TEXT PRIMARY KEY,
+    address TEXT,
+    url TEXT,
+    first_seen INTEGER NOT NULL,
+    last_seen INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS listing_state (
+    source TEXT NOT NULL,
+    property_id TEXT NOT NULL,
+    status TEXT,
+    price REAL,
+    last_seen INTEGER NOT NULL,
+    PRIMARY KEY (source, property_id)
+);
+CREATE INDEX IF NOT EXISTS listing_state_by_property ON listing_state (property_id);
+CREATE TABLE IF NOT EXISTS events (
+    snapshot_id INTEGER NOT NULL,
+    property_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    old TEXT,
+    new TEXT
+);
+CREATE INDEX IF NOT EXISTS events_by_snapshot ON events (snapshot_id, kind);
+CREATE INDEX IF NOT EXISTS events_by_kind ON events (kind, snapshot_id);
+"""
+
+
+def open_history():
+    os.makedirs(DATA_DIR, exist_ok=True)
+    conn = sqlite3.connect(HISTORY_DB)
+    conn.executescript(HISTORY_SCHEMA)
+    return conn
+
+
+def _select_in(conn, query, ids):
+    """Run query once per chunk of ids, staying under SQLite's bound-parameter limit."""
+    for start in range(0, len(ids), 500):
+        chunk = ids[start:start + 500]
+        yield from conn.execute(query.format(marks=",".join("?" * len(chunk))), chunk)
+
+
+def record_snapshot(conn, source, raw, table):
+    """Diff a parsed snapshot against its source's listing_state and append it. Returns its snapshot id.
+
+    A body identical to the source's last snapshot (a cache hit or a stale-if-error
+    fallback) is not recorded again and returns None: nothing changed since last run.
+    A source's first snapshot is the baseline and raises no events. A listing a
+    source sees for the first time but another source already knows (an active
+    listing turning up in the sold search) raises a status event, never a price cut.
+    """
+    digest = hashlib.sha1(raw.encode()).hexdigest()
+    last = conn.execute(
+        "SELECT id, digest FROM snapshots WHERE source = ? ORDER BY id DESC LIMIT 1", (source,)
+    ).fetchone()
+    if last and last[1] == digest:
+        return None
+
+    ids = list({l.property_id for l in table.listings})
+    known = {}  # This source's last status and price
+    elsewhere = {}  # Latest status from any other source
+    for row_source, property_id, status, price in _select_in(
+        conn, "SELECT source, property_id, status, price FROM listing_state WHERE property_id IN ({marks})", ids
+    ):
+        if row_source == source:
+            known[property_id] = (status, price)
+        else:
+            elsewhere[property_id] = status
+    existing = {row[0] for row in _select_in(
+        conn, "SELECT property_id FROM properties WHERE property_id IN ({marks})", ids
+    )}
+
+    with conn:
+        snapshot_id = conn.execute(
+            "INSERT INTO snapshots (source, digest, taken_at) VALUES (?, ?, ?)",
+            (source, digest, datetime.now().isoformat(timespec="seconds")),
+        ).lastrowid
+        events = []
+        seen = set()
+        for l in table.listings:
+            if l.property_id in seen:
+                continue
+            seen.add(l.property_id)
+            old = known.get(l.property_id)
+            if old is not None:
+                old_status, old_price = old
+                if old_status != l.status:
+                    events.append((snapshot_id, l.property_id, "status", old_status, l.status))
+                if old_price and l.price and l.price < old_price:
+                    events.append((snapshot_id, l.property_id, "price_cut", str(old_price), str(l.price)))
+            elif last and l.property_id in elsewhere:
+                if elsewhere[l.property_id] != l.status:
+                    events.append((snapshot_id, l.property_id, "status", elsewhere[l.property_id], l.status))
+            elif last and l.property_id not in existing:
+                events.append((snapshot_id, l.property_id, "new", None, l.status))
+            conn.execute(
+                """INSERT INTO properties (property_id, address, url, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT (property_id) DO UPDATE
+                   SET address = excluded.address, url = excluded.url, last_seen = excluded.last_seen""",
+                (l.property_id, l.address, l.url, snapshot_id, snapshot_id),
+            )
+            conn.execute(
+                """INSERT INTO listing_state (source, property_id, status, price, last_seen) VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT (source, property_id) DO UPDATE
+                   SET status = excluded.status, price = excluded.price, last_seen = excluded.last_seen""",
+                (source, l.property_id, l.status, l.price, snapshot_id),
+            )
+        conn.executemany(
+            "INSERT INTO observations VALUES (?, ?, ?, ?, ?)",
+            [(snapshot_id, l.property_id, l.status, l.price, l.dom) for l in table.listings],
+        )
+        conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?)", events)
+    return snapshot_id
+
+
+def prune_history(conn, keep_days=HISTORY_RETENTION_DAYS):
+    """Drop snapshots older than keep_days with their observations and events.
+
+    Each source's latest snapshot is kept, as the digest the next run compares
+    against. Listings no kept snapshot has seen are forgotten, so one that
+    returns after the window counts as new again.
+    """
+    cutoff = (datetime.now() - timedelta(days=keep_days)).isoformat(timespec="seconds")
+    expired = """SELECT id FROM snapshots WHERE taken_at < ?
+                 AND id NOT IN (SELECT MAX(id) FROM snapshots GROUP BY source)"""
+    with conn:
+        conn.execute(f"DELETE FROM observations WHERE snapshot_id IN ({expired})", (cutoff,))
+        conn.execute(f"DELETE FROM events WHERE snapshot_id IN ({expired})", (cutoff,))
+        conn.execute(f"DELETE FROM snapshots WHERE id IN ({expired})", (cutoff,))
+        oldest = conn.execute("SELECT MIN(id) FROM snapshots").fetchone()[0]
+        if oldest is not None:
+            conn.execute("DELETE FROM listing_state WHERE last_seen < ?", (oldest,))
+            conn.execute("DELETE FROM properties WHERE last_seen < ?", (oldest,))
+
+
+def snapshot_events(conn, snapshot_ids):
+    """Events raised by the given snapshots, with each listing's address and URL."""
+    marks = ",".join("?" * len(snapshot_ids))
+    return conn.execute(
+        f"""SELECT e.kind, e.old, e.new, e.property_id, p.address, p.url
+            FROM events e JOIN properties p USING (property_id)
+            WHERE e.snapshot_id IN ({marks})""",
+        list(snapshot_ids),
+    ).fetchall()
+
+
+def dom_trend(conn, source="active", snapshots=DOM_TREND_SNAPSHOTS):
+    """Median days on market in the source's last few snapshots, oldest first."""
+    ids = [
+        row[0] for row in conn.execute(
+            "SELECT id FROM snapshots WHERE source = ? ORDER BY id DESC LIMIT ?", (source, snapshots)
+        )
+    ][::-1]
+    trend = []
+    for snapshot_id in ids:
+        values = [
+            row[0] for row in conn.execute(
+                "SELECT dom FROM observations WHERE snapshot_id = ? AND dom IS NOT NULL ORDER BY dom",
+                (snapshot_id,),
+            )
+        ]
+        if values:
+            trend.append(percentile(values, 50))
+    return trend
+
+
+def load_history(active_raw, for_sale, sold_raw, sold_listings):
+    """Record this run's snapshots; returns (events since the previous snapshots, DOM trend).
+
+    History is a nice-to-have, so a locked or unreadable database just means no badges.
+    """
+    try:
+        conn = open_history()
+        try:
+            ids = []
+            if active_raw:
+                ids.append(record_snapshot(conn, "active", active_raw, for_sale))
+            if sold_raw:
+                ids.append(record_snapshot(conn, "sold", sold_raw, sold_listings))
+            prune_history(conn)
+            ids = [i for i in ids if i is not None]
+            return (snapshot_events(conn, ids) if ids else []), dom_trend(conn)
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        return [], []
+
+
+def listing_badges(events):
+    """Per-property menu badges: 🆕 for new listings, ↓ for price cuts."""
+    badges = {}
+    for kind, _old, _new, property_id, _address, _url in events:
+        if kind == "new":
+            badges[property_id] = badges.get(property_id, "") + "🆕"
+        elif kind == "price_cut":
+            badges[property_id] = badges.get(property_id, "") + "↓"
+    return badges
+
+
+def print_history(events, trend):
+    """Submenu summarising what changed since the last snapshot."""
+    groups = {
+        "New listings": [e for e in events if e[0] == "new" and e[2] not in ("sold", "pending")],
+        "Price cuts": [e for e in events if e[0] == "price_cut"],
+        "Went pending": [e for e in events if e[0] == "status" and e[2] == "pending"],
+        "Sold": [e for e in events if e[0] == "status" and e[2] == "sold"],
+    }
+    print(f"     Since last run | {ANSI_MONOSPACE} {DIMMED} size=11")
+    for label, group in groups.items():
+        print(f"--{label:<20} {len(group):>4} | {ANSI_MONOSPACE} size=11")
+        for kind, old, new, _pid, address, url in group[:10]:
+            detail = f"{fmt_price(old)} → {fmt_price(new)}" if kind == "price_cut" else ""
+            href = f"href={url}" if url else ""
+            print(f"----{short_addr(address):<28} {detail} | {ANSI_MONOSPACE} size=11 {href}")
+    if len(trend) > 1:
+        print(
+            f"--Median DOM  {' → '.join(fmt_dom(v) for v in trend)} | {ANSI_MONOSPACE} {LABEL_COLOR} size=11"
+        )
+
+
 # ─── Fetch AVM estimate for home ────────────────────────────────────────
 
 
@@ -389,6 +1033,12 @@ def fetch_home_estimate():
         return None
 
 
+def fetch_home_estimate_json():
+    """fetch_home_estimate() as a cache entry; None when Redfin has no estimate for the address."""
+    estimate = fetch_home_estimate()
+    return json.dumps(estimate) if estimate else None
+
+
 # ─── Main output ─────────────────────────────────────────────────────────
 
 
@@ -396,87 +1046,54 @@ def main():
     now = datetime.now()
 
     # --- Fetch data (with caching) ---
-    home_raw = get_cached(
-        "home_estimate.json", lambda: json.dumps(fetch_home_estimate())
-    )
+    # The AVM chain and both CSVs are independent, so a cold run takes about as
+    # long as the three-request AVM chain rather than all five requests in a row
+    with ThreadPoolExecutor(max_workers=POOL_SIZE) as pool:
+        home_job = pool.submit(get_cached, "home_estimate.json", fetch_home_estimate_json)
+        active_job = pool.submit(
+            get_cached,
+            "active.csv",
+            lambda: redfin_get(REDFIN_CSV_URL, redfin_csv_params(ACTIVE_STATUS)),
+        )
+        sold_job = pool.submit(
+            get_cached,
+            "sold.csv",
+            lambda: redfin_get(
+                REDFIN_CSV_URL,
+                redfin_csv_params(SOLD_STATUS, sold_within_days=str(SOLD_DAYS)),
+            ),
+        )
+        results = {}
+        errors = []
+        for name, job in (("home", home_job), ("active", active_job), ("sold", sold_job)):
+            try:
+                results[name] = job.result()
+            except Exception as e:
+                # Nothing cached to fall back on; render the rest
+                results[name] = None
+                errors.append(e)
+        if len(errors) == len(results):
+            print_fetch_error(errors[0])
+            sys.exit(0)
+        home_raw, active_raw, sold_raw = results["home"], results["active"], results["sold"]
+
     try:
         home = json.loads(home_raw) if home_raw else None
     except Exception:
         home = None
 
-    active_raw = get_cached(
-        "active.csv",
-        lambda: redfin_get(
-            "https://www.redfin.com/stingray/api/gis-csv",
-            {
-                "al": "1",
-                "num_homes": "350",
-                "page_number": "1",
-                "region_id": SEARCH_ZIP,
-                "region_type": "2",
-                "sf": "1,2,3,5,6,7",
-                "sp": "true",
-                "status": "9",
-                "uipt": "1,2,3,4,5,6,7,8",
-                "v": "8",
-            },
-        ),
-    )
-
-    sold_raw = get_cached(
-        "sold.csv",
-        lambda: redfin_get(
-            "https://www.redfin.com/stingray/api/gis-csv",
-            {
-                "al": "1",
-                "num_homes": "350",
-                "page_number": "1",
-                "region_id": SEARCH_ZIP,
-                "region_type": "2",
-                "sf": "1,2,3,5,6,7",
-                "sp": "true",
-                "status": "130",
-                "uipt": "1,2,3,4,5,6,7,8",
-                "v": "8",
-                "sold_within_days": str(SOLD_DAYS),
-            },
-        ),
-    )
-
-    # Parse CSVs and filter by radius
-    def parse_and_filter(raw, status_filter=None):
-        if not raw:
-            return []
-        rows = []
-        try:
-            reader = csv.DictReader(io.StringIO(raw))
-            for row in reader:
-                try:
-                    lat = float(row.get("LATITUDE", 0))
-                    lon = float(row.get("LONGITUDE", 0))
-                except (ValueError, TypeError):
-                    continue
-                dist = haversine_miles(HOME_LAT, HOME_LON, lat, lon)
-                if dist <= RADIUS_MILES:
-                    row["_distance"] = dist
-                    if status_filter:
-                        s = row.get("STATUS", "").strip().lower()
-                        if s not in status_filter:
-                            continue
-                    rows.append(row)
-        except Exception:
-            pass
-        return rows
+    # Parse each CSV once and filter by radius; sections are status views of it
+    for_sale = parse_listings(active_raw)
+    active_listings = for_sale.with_status(ACTIVE_STATUSES)
+    pending_listings = for_sale.with_status(PENDING_STATUSES)
+    sold_listings = parse_listings(sold_raw)
 
-    active_listings = parse_and_filter(
-        active_raw, {"active", "active (hot home)", "contingent"}
-    )
-    pending_listings = parse_and_filter(active_raw, {"pending"})
-    sold_listings = parse_and_filter(sold_raw)
+    events, trend = load_history(active_raw, for_sale, sold_raw, sold_listings)
+    badges = listing_badges(events)
 
     # Sort: active by price desc, sold by sold date desc
-    active_listings.sort(key=lambda r: float(r.get("PRICE", 0) or 0), reverse=True)
-    sold_listings.sort(key=lambda r: r.get("SOLD DATE", ""), reverse=True)
+    active_listings = active_listings.sorted_by(lambda l: l.price or 0, reverse=True)
+    sold_listings = sold_listings.sorted_by(lambda l: l.sold_date or date.min, reverse=True)
 
     # ─── MENU BAR HEADER ────────────────────────────────────────────
     if home and home.get("estimate"):
@@ -519,8 +1136,6 @@ def main():
             print(
                 f"     View on Redfin ↗ | href={home['url']} {ANSI_MONOSPACE} {ACCENT_BLUE} size=11"
             )
-    else:
-        print(f"     Could not retrieve estimate | {ANSI_MONOSPACE} {DIMMED}")
 
     print("---")
 
@@ -534,32 +1149,29 @@ def main():
     print(f"🏷️  FOR SALE  ({' · '.join(status_parts)}) | {HEADER_FONT} {WHITE}")
 
     if active_listings:
-        prices = [float(r["PRICE"]) for r in active_listings if r.get("PRICE")]
-        if prices:
-            med = sorted(prices)[len(prices) // 2]
+        stats = summarize(active_listings)
+        if stats["price_median"] is not None:
             print(
-                f"     Median {fmt_price(med)}  ·  Range {fmt_price(min(prices))}–{fmt_price(max(prices))} | {ANSI_MONOSPACE} {DIMMED} size=11"
+                f"     Median {fmt_price(stats['price_median'])}  ·  Range {fmt_price(stats['price_min'])}–{fmt_price(stats['price_max'])} | {ANSI_MONOSPACE} {DIMMED} size=11"
             )
+            print_market_stats(stats)
+        print_history(events, trend)
 
         print(
             f"     {'ADDRESS':<24} {'PRICE':>10} {'BD/BA':>8} {'SQFT':>7} {'$/SF':>6} {'DOM':>5} | {ANSI_MONOSPACE} {LABEL_COLOR} size=10"
         )
 
-        for row in active_listings[:15]:
-            addr = short_addr(row.get("ADDRESS", ""))
-            price = fmt_price(row.get("PRICE"))
-            bb = fmt_beds_baths(row.get("BEDS"), row.get("BATHS"))
-            sqft = fmt_sqft(row.get("SQUARE FEET"))
-            ppsf = fmt_ppsf(row.get("$/SQUARE FEET"))
-            dom = fmt_dom(row.get("DAYS ON MARKET"))
-            url = ""
-            for k in row:
-                if k.startswith("URL"):
-                    url = row[k]
-                    break
-            href = f"href={url}" if url else ""
+        for l in active_listings.listings[:15]:
+            addr = short_addr(l.address)
+            price = fmt_price(l.price)
+            bb = fmt_beds_baths(l.beds, l.baths)
+            sqft = fmt_sqft(l.sqft)
+            ppsf = fmt_ppsf(l.ppsf)
+            dom = fmt_dom(l.dom)
+            badge = badges.get(l.property_id, "")
+            href = f"href={l.url}" if l.url else ""
             print(
-                f"     {addr:<24} {price:>10} {bb:>8} {sqft:>7} {ppsf:>6} {dom:>5} | {ANSI_MONOSPACE} size=11 {href}"
+                f"     {addr:<24} {price:>10} {bb:>8} {sqft:>7} {ppsf:>6} {dom:>5} {badge} | {ANSI_MONOSPACE} size=11 {href}"
             )
     else:
         print(
@@ -581,30 +1193,25 @@ def main():
     print(f"✅  SOLD – LAST {SOLD_DAYS} DAYS  ({sold_count}) | {HEADER_FONT} {WHITE}")
 
     if sold_listings:
-        sold_prices = [float(r["PRICE"]) for r in sold_listings if r.get("PRICE")]
-        if sold_prices:
-            med_sold = sorted(sold_prices)[len(sold_prices) // 2]
+        sold_stats = summarize(sold_listings)
+        if sold_stats["price_median"] is not None:
             print(
-                f"     Median {fmt_price(med_sold)}  ·  Range {fmt_price(min(sold_prices))}–{fmt_price(max(sold_prices))} | {ANSI_MONOSPACE} {DIMMED} size=11"
+                f"     Median {fmt_price(sold_stats['price_median'])}  ·  Range {fmt_price(sold_stats['price_min'])}–{fmt_price(sold_stats['price_max'])} | {ANSI_MONOSPACE} {DIMMED} size=11"
             )
+            print_market_stats(sold_stats)
 
         print(
             f"     {'ADDRESS':<24} {'PRICE':>10} {'BD/BA':>8} {'SQFT':>7} {'$/SF':>6} {'SOLD':>10} | {ANSI_MONOSPACE} {LABEL_COLOR} size=10"
         )
 
-        for row in sold_listings[:15]:
-            addr = short_addr(row.get("ADDRESS", ""))
-            price = fmt_price(row.get("PRICE"))
-            bb = fmt_beds_baths(row.get("BEDS"), row.get("BATHS"))
-            sqft = fmt_sqft(row.get("SQUARE FEET"))
-            ppsf = fmt_ppsf(row.get("$/SQUARE FEET"))
-            sold_dt = row.get("SOLD DATE", "")[:10] if row.get("SOLD DATE") else "—"
-            url = ""
-            for k in row:
-                if k.startswith("URL"):
-                    url = row[k]
-                    break
-            href = f"href={url}" if url else ""
+        for l in sold_listings.listings[:15]:
+            addr = short_addr(l.address)
+            price = fmt_price(l.price)
+            bb = fmt_beds_baths(l.beds, l.baths)
+            sqft = fmt_sqft(l.sqft)
+            ppsf = fmt_ppsf(l.ppsf)
+            sold_dt = l.sold_date.isoformat() if l.sold_date else "—"
+            href = f"href={l.url}" if l.url else ""
             print(
                 f"     {addr:<24} {price:>10} {bb:>8} {sqft:>7} {ppsf:>6} {sold_dt:>10} | {ANSI_MONOSPACE} size=11 {href}"
             )
@@ -630,6 +1237,9 @@ def main():
     print(
         f"Updated {updated}  ·  {SEARCH_ZIP}  ·  {RADIUS_MILES}mi radius | {ANSI_MONOSPACE} {DIMMED} size=10"
     )
+    print_cache_footer()
+    for e in errors:
+        print(f"⚠ Redfin fetch error: {e} | {ANSI_MONOSPACE} {ACCENT_RED} size=10")
     print(f"Refresh | refresh=true {ANSI_MONOSPACE} size=11")
     print(
         f"Clear Cache | bash=/bin/rm param0=-rf param1={CACHE_DIR} refresh=true terminal=false {ANSI_MONOSPACE} size=11"
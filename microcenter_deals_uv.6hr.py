@@ -5,6 +5,7 @@
 #     "aiohttp>=3.8.0",
 #     "beautifulsoup4>=4.9.0",
 #     "curl_cffi>=0.7.0",
+#     "lxml>=5.0.0",
 #     "pydantic>=2.0.0",
 # ]
 # ///
@@ -24,7 +25,7 @@ from typing import Optional, List, cast
 
 import aiohttp
 from aiohttp import ClientTimeout
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from pydantic import BaseModel, HttpUrl, Field
 
 # Constants
@@ -32,6 +33,22 @@ MICROCENTER_DEALS_URL = "https://www.microcenter.com/search/search_results.aspx?
 LOWES_KOBALT_URL = "https://www.lowes.com/search?searchTerm=kobalt&refinement=982555943,982555939,982555940,4294965883,2,982555941&int_cmp=%3A%3ATools%3A%3APOPCAT_OFFERS_Kobalt_Hybrid"
 BING_KOBALT_URL = "https://www.bing.com/shop?q=kobalt+tools+deals+lowes&count=40"
 REQUEST_TIMEOUT = 15
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+def has_class(name: str) -> re.Pattern:
+    """Strainer filter for one CSS class; strainers see the raw, space-separated class attribute."""
+    return re.compile(rf"(^|\s){re.escape(name)}(\s|$)")
+
+
+# Product tiles on the search results page; parse_deals builds only these
+DEAL_TILE_STRAINER = SoupStrainer("li", attrs={"class": has_class("product_wrapper")})
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 }
@@ -105,8 +122,13 @@ def fetch_kobalt_via_bing() -> List[LowesKobaltItem]:
     except Exception:
         return []
 
-    soup = BeautifulSoup(r.text, "html.parser")
-    lowes_offer_urls = extract_lowes_offer_urls(r.text)
+    return parse_bing_kobalt(r.text)
+
+
+def parse_bing_kobalt(html: str) -> List[LowesKobaltItem]:
+    """Parse discounted Lowe's Kobalt items from a Bing Shopping results page."""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    lowes_offer_urls = extract_lowes_offer_urls(html)
     items: List[LowesKobaltItem] = []
     seen_names: set[str] = set()
 
@@ -216,12 +238,18 @@ def parse_price(price_text: str) -> Optional[float]:
 
 def parse_deals(html: str) -> List[MicrocenterDeal]:
     """Parse deals from HTML content using data attributes."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=DEAL_TILE_STRAINER)
     deals = []
 
     product_links = soup.find_all(
         "a", {"data-id": True, "data-price": True, "data-name": True}
     )
+    if not product_links:
+        # Tile markup changed; fall back to scanning the whole page
+        soup = BeautifulSoup(html, HTML_PARSER)
+        product_links = soup.find_all(
+            "a", {"data-id": True, "data-price": True, "data-name": True}
+        )
 
     seen_skus = set()
 
@@ -1,4 +1,6 @@
 #!/Users/hodgesd/PycharmProjects/swiftbar_plugins/.venv/bin/python3.12
+import os
+import pickle
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
@@ -8,6 +10,9 @@ from bs4 import BeautifulSoup
 from pydantic import BaseModel, HttpUrl, validator
 
 ARTICLE_RECENCY_DAYS = 7
+REQUEST_TIMEOUT = 10  # Seconds; a hung source must not hold up the menu
+# Parsed articles plus ETag/Last-Modified per source URL, so unchanged feeds (304) aren't re-parsed
+CACHE_FILE = os.path.expanduser("~/.cache/swiftbar_news.pickle")
 
 
 class Article(BaseModel):
@@ -31,11 +36,25 @@ class NewsSource(BaseModel):
     is_html: bool = False
     date_tag: str = 'published'
 
-    def fetch_news(self) -> List[Article]:
+    def fetch_news(self, cache: dict) -> List[Article]:
+        key = str(self.url)
+        cached = cache.get(key)
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
         try:
-            response = requests.get(self.url)
+            response = requests.get(key, headers=headers, timeout=REQUEST_TIMEOUT)
+            if response.status_code == 304 and cached:
+                return [article for article in cached['articles'] if self.is_recent(article.date)]
             response.raise_for_status()
-            return self.parse_html(response.text) if self.is_html else self.parse_rss(response.content)
+            articles = self.parse_html(response.text) if self.is_html else self.parse_rss(response.content)
+            cache[key] = {'etag': response.headers.get('ETag'),
+                          'last_modified': response.headers.get('Last-Modified'),
+                          'articles': articles}
+            return articles
         except requests.RequestException as e:
             print(f"Error fetching source: {e}")
             return []
@@ -69,7 +88,27 @@ class NewsSource(BaseModel):
         return current_time - article_date <= timedelta(days=ARTICLE_RECENCY_DAYS)
 
 
+def load_cache() -> dict:
+    try:
+        with open(CACHE_FILE, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return {}
+
+
+def save_cache(cache: dict) -> None:
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        tmp_file = f"{CACHE_FILE}.tmp"
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(cache, f)
+        os.replace(tmp_file, CACHE_FILE)
+    except Exception:
+        pass
+
+
 def main():
+    cache = load_cache()
     sources = [
         NewsSource(url='https://www.scott.af.mil/News/', is_html=True),
         NewsSource(url='https://daringfireball.net/feeds/articles'),
@@ -82,11 +121,12 @@ def main():
     print("---")
     source_names = ["Scott News", "Daring Fireball", "Apple Newsroom", "Michael Kennedy", "Chief Pilots Forum"]
     for name, source in zip(source_names, sources):
-        articles = source.fetch_news()
+        articles = source.fetch_news(cache)
         print(f"{name} | href={source.url}")
         for article in articles:
             formatted_date = article.date.strftime('%-m/%-d/%y') if article.date else 'No date'
             print(f"--[{formatted_date}] {article.title} | href={article.url}")
+    save_cache(cache)
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@
 # dependencies = [
 #     "requests>=2.25.0",
 #     "beautifulsoup4>=4.9.0",
+#     "lxml>=5.0.0",
 # ]
 # ///
 
@@ -14,14 +15,30 @@
 # <xbar.desc>Scrapes headlines from STLToday.com and displays them in SwiftBar.</xbar.desc>
 # <xbar.dependencies>uv,requests,bs4</xbar.dependencies>
 
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Set
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from requests.adapters import HTTPAdapter, Retry
 
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+
+def has_class(name: str) -> re.Pattern:
+    """Strainer filter for one CSS class; strainers see the raw, space-separated class attribute."""
+    return re.compile(rf'(^|\s){re.escape(name)}(\s|$)')
+
+
+# Headlines all live in section.block; skip building the rest of the page
+BLOCK_STRAINER = SoupStrainer('section', attrs={'class': has_class('block')})
+
 EXCLUDED_CATEGORIES = {
         "LatestVideo",
         "Partner",
@@ -110,7 +127,7 @@ class STLScraper:
         try:
             response = self.session.get("https://www.stltoday.com", timeout=20)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER, parse_only=BLOCK_STRAINER)
             articles = []
 
             blocks = soup.select('section.block')
@@ -0,0 +1,69 @@
+"""Parse-time benchmark for the scrapers' HTML parsing layer.
+
+Compares the old full ``html.parser`` tree against the fast backend with
+SoupStrainer-restricted parsing, using the saved fixtures. Run from the repo
+root:
+
+    python tests/bench_parsing.py
+"""
+import importlib.util
+import sys
+import timeit
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+ROOT = Path(__file__).resolve().parent.parent
+ARTICLE_SNIPPET = (ROOT / "tests" / "article_snippet.html").read_text()
+MAXPREPS_SAMPLE = (ROOT / "sample_result.html").read_text()
+ROUNDS = 20
+
+
+def load_plugin(filename: str):
+    """Import a plugin script whose filename isn't a valid module name."""
+    spec = importlib.util.spec_from_file_location(filename.split(".")[0], ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def stltoday_page() -> str:
+    """A front-page-sized document: the card fixture as the one headline block among filler."""
+    filler = "".join(f'<div class="promo">{ARTICLE_SNIPPET}</div>' for _ in range(6))
+    block = (
+        '<section class="block"><div class="block-title-inner"><h3>Sports</h3></div>'
+        f"{ARTICLE_SNIPPET}</section>"
+    )
+    return f"<html><body>{filler}{block}</body></html>"
+
+
+def bench(label: str, fn) -> float:
+    seconds = min(timeit.repeat(fn, number=1, repeat=ROUNDS))
+    print(f"  {label:<40} {seconds * 1000:8.2f} ms")
+    return seconds
+
+
+def main():
+    daily_news = load_plugin("daily_news_uv.2hr.py")
+    bball = load_plugin("bball.1d.py")
+    print(f"Fast backend: {daily_news.HTML_PARSER} (best of {ROUNDS})")
+
+    page = stltoday_page()
+    print(f"\nSTLToday front page ({len(page) // 1024} KB)")
+    before = bench("html.parser, full tree", lambda: BeautifulSoup(page, "html.parser").select("section.block"))
+    after = bench("parse_stltoday (strained)", lambda: daily_news.parse_stltoday(page))
+    print(f"  speedup: {before / after:.1f}x")
+
+    print(f"\nMaxPreps schedule sample ({len(MAXPREPS_SAMPLE) // 1024} KB)")
+    before = bench("html.parser, full tree", lambda: BeautifulSoup(MAXPREPS_SAMPLE, "html.parser").select("table tbody"))
+    after = bench(f"{bball.HTML_PARSER}, full tree", lambda: BeautifulSoup(MAXPREPS_SAMPLE, bball.HTML_PARSER).select("table tbody"))
+    print(f"  speedup: {before / after:.1f}x")
+
+    print(f"\nSTLToday card fixture ({len(ARTICLE_SNIPPET) // 1024} KB)")
+    before = bench("html.parser, full tree", lambda: BeautifulSoup(ARTICLE_SNIPPET, "html.parser").select("article"))
+    after = bench(f"{daily_news.HTML_PARSER}, full tree", lambda: BeautifulSoup(ARTICLE_SNIPPET, daily_news.HTML_PARSER).select("article"))
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,331 @@
+"""Offline microbenchmarks for every scraper's parse step.
+
+Times each parser against the responses saved by record_fixtures.py, or the
+deterministic set from synthetic_fixtures.py, and reports per-call latency
+plus peak memory (tracemalloc). Run from the repo root:
+
+    python tests/bench_scrapers.py --synthetic          # print the table
+    python tests/bench_scrapers.py --synthetic --save baseline.json
+    python tests/bench_scrapers.py --synthetic --compare baseline.json
+    python tests/bench_scrapers.py                      # recorded fixtures
+
+The run fails before timing anything if a fixture is missing, and exits
+non-zero if a plugin can't be loaded or a parser finds nothing in its fixture.
+--compare also exits non-zero when any parser got REGRESSION_THRESHOLD slower.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from bench_parsing import load_plugin
+from record_fixtures import BBALL, DAILY_NEWS, FIXTURES, HOME_COMPS, MICROCENTER
+from synthetic_fixtures import generate
+
+ROUNDS = 20
+REGRESSION_THRESHOLD = 1.25  # Flag parsers whose median got 25% slower than the baseline
+REGRESSION_MIN_MS = 0.5  # ...by at least this much, so timer noise on tiny fixtures doesn't count
+
+
+def bench_techmeme(m, html):
+    return m.parse_techmeme(html)
+
+
+def bench_lobsters(m, html):
+    return m.parse_lobsters(html)
+
+
+def bench_stltoday(m, html):
+    return m.parse_stltoday(html)
+
+
+def bench_bnd(m, html):
+    return m.parse_bnd(html)
+
+
+def bench_stlpr(m, html):
+    return m.parse_stlpr(html)
+
+
+def bench_maxpreps_schedule(m, html):
+    school = m.School(url="", last_updated=datetime.now())
+    soup = m.BeautifulSoup(html, m.HTML_PARSER, parse_only=m.MAXPREPS_TABLE_STRAINER)
+    school.schedule = m.parse_maxpreps_schedule(soup) or []
+    m.parse_maxpreps_team(html, school)
+    return school.schedule
+
+
+def bench_maxpreps_schedule_dom(m, html):
+    """The pre-JSON-first path: full tree for the table, title and __NEXT_DATA__ script."""
+    soup = m.BeautifulSoup(html, m.HTML_PARSER)
+    games = m.parse_maxpreps_schedule(soup) or []
+    soup.select_one(".sub-title")
+    script = soup.find("script", id="__NEXT_DATA__")
+    if script:
+        json.loads(script.string)
+    return games
+
+
+def bench_maxpreps_rankings(m, html):
+    school = m.School(url="", last_updated=datetime.now())
+    m.parse_maxpreps_rankings(html, school, "IL")
+    return [school.rankings_tooltip] if school.rankings_tooltip else []
+
+
+def bench_maxpreps_rankings_dom(m, html):
+    """The pre-JSON-first path: a strained tree around the __NEXT_DATA__ script."""
+    soup = m.BeautifulSoup(html, m.HTML_PARSER, parse_only=m.SoupStrainer("script", attrs={"id": "__NEXT_DATA__"}))
+    script = soup.find("script", id="__NEXT_DATA__")
+    return [json.loads(script.string)] if script else []
+
+
+def bench_espn(m, html):
+    school = m.School(url="", last_updated=datetime.now())
+    m.parse_espn_team(m.BeautifulSoup(html, m.HTML_PARSER), school)
+    return school.schedule
+
+
+def bench_espn_json(m, text):
+    school = m.School(url="", last_updated=datetime.now())
+    m.parse_espn_schedule(json.loads(text), school)
+    return school.schedule
+
+
+def bench_ncaa_net(m, html):
+    return m.parse_rankings_table(m.BeautifulSoup(html, m.HTML_PARSER), ("Rank", "School", "---"))
+
+
+def bench_njcaa_index(m, html):
+    return [m.find_njcaa_week_url(m.BeautifulSoup(html, m.HTML_PARSER))]
+
+
+def bench_njcaa_week(m, html):
+    return m.parse_rankings_table(m.BeautifulSoup(html, m.HTML_PARSER), ("Place", "Name", "---"))
+
+
+def bench_redfin(m, raw):
+    return m.parse_listings(raw).listings
+
+
+def bench_redfin_stats(m, raw):
+    table = m.parse_listings(raw)
+    m.summarize(table)
+    return table.listings
+
+
+def format_listing_rows(m, listings):
+    return [
+        (m.short_addr(l.address), m.fmt_price(l.price), m.fmt_beds_baths(l.beds, l.baths),
+         m.fmt_sqft(l.sqft), m.fmt_ppsf(l.ppsf), m.fmt_dom(l.dom))
+        for l in listings
+    ]
+
+
+def bench_redfin_render(m, raw):
+    """Active and pending views of one parse, every row formatted."""
+    table = m.parse_listings(raw)
+    return format_listing_rows(m, table.with_status(m.ACTIVE_STATUSES).listings) + format_listing_rows(
+        m, table.with_status(m.PENDING_STATUSES).listings
+    )
+
+
+def haversine_miles(lat1, lon1, lat2, lon2):
+    """home_comps' per-row distance before the columnar radius filter."""
+    import math
+
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
+    return 3958.8 * 2 * math.asin(math.sqrt(a))
+
+
+def bench_redfin_render_dicts(m, raw):
+    """The pre-typed-model path: a DictReader pass per section and string fields re-parsed to format."""
+    out = []
+    for statuses in (m.ACTIVE_STATUSES, m.PENDING_STATUSES):
+        for row in csv.DictReader(io.StringIO(raw)):
+            try:
+                lat, lon = float(row.get("LATITUDE", 0)), float(row.get("LONGITUDE", 0))
+            except (ValueError, TypeError):
+                continue
+            if haversine_miles(m.HOME_LAT, m.HOME_LON, lat, lon) > m.RADIUS_MILES:
+                continue
+            if row.get("STATUS", "").strip().lower() in statuses:
+                out.append((m.short_addr(row.get("ADDRESS", "")), m.fmt_price(row.get("PRICE")),
+                            m.fmt_beds_baths(row.get("BEDS"), row.get("BATHS")), m.fmt_sqft(row.get("SQUARE FEET")),
+                            m.fmt_ppsf(row.get("$/SQUARE FEET")), m.fmt_dom(row.get("DAYS ON MARKET"))))
+    return out
+
+
+def bench_microcenter(m, html):
+    return m.parse_deals(html)
+
+
+def bench_bing(m, html):
+    return m.parse_bing_kobalt(html)
+
+
+# (label, fixture file, plugin, parse step)
+CASES = [
+    ("Techmeme", "techmeme.html", DAILY_NEWS, bench_techmeme),
+    ("Lobsters", "lobsters.html", DAILY_NEWS, bench_lobsters),
+    ("STLToday", "stltoday.html", DAILY_NEWS, bench_stltoday),
+    ("BND", "bnd.html", DAILY_NEWS, bench_bnd),
+    ("STLPR", "stlpr.html", DAILY_NEWS, bench_stlpr),
+    ("MaxPreps schedule DOM", "maxpreps_schedule.html", BBALL, bench_maxpreps_schedule_dom),
+    ("MaxPreps schedule", "maxpreps_schedule.html", BBALL, bench_maxpreps_schedule),
+    ("MaxPreps rankings DOM", "maxpreps_rankings.html", BBALL, bench_maxpreps_rankings_dom),
+    ("MaxPreps rankings", "maxpreps_rankings.html", BBALL, bench_maxpreps_rankings),
+    ("ESPN team page", "espn_team.html", BBALL, bench_espn),
+    ("ESPN schedule JSON", "espn_schedule.json", BBALL, bench_espn_json),
+    ("NCAA NET", "ncaa_net.html", BBALL, bench_ncaa_net),
+    ("NJCAA index", "njcaa_index.html", BBALL, bench_njcaa_index),
+    ("NJCAA week", "njcaa_week.html", BBALL, bench_njcaa_week),
+    ("Redfin active CSV", "redfin_active.csv", HOME_COMPS, bench_redfin),
+    ("Redfin sold CSV", "redfin_sold.csv", HOME_COMPS, bench_redfin),
+    ("Redfin active stats", "redfin_active.csv", HOME_COMPS, bench_redfin_stats),
+    ("Redfin render dicts", "redfin_active.csv", HOME_COMPS, bench_redfin_render_dicts),
+    ("Redfin render", "redfin_active.csv", HOME_COMPS, bench_redfin_render),
+    ("Microcenter deals", "microcenter.html", MICROCENTER, bench_microcenter),
+    ("Bing Shopping", "bing_shopping.html", MICROCENTER, bench_bing),
+]
+
+
+def redfin_env(fixtures: Path):
+    """Point home_comps at the middle of the recorded search when it has no config of its own."""
+    path = fixtures / "redfin_active.csv"
+    if not path.exists():
+        return
+    rows = list(csv.DictReader(io.StringIO(path.read_text())))
+    coords = []
+    for row in rows:
+        try:
+            coords.append((float(row["LATITUDE"]), float(row["LONGITUDE"])))
+        except (KeyError, TypeError, ValueError):
+            continue
+    if not coords:
+        return
+    for key, value in {
+        "REDFIN_ADDRESS": "benchmark",
+        "REDFIN_CITY": "benchmark",
+        "REDFIN_STATE": "IL",
+        "REDFIN_ZIP": "00000",
+        "REDFIN_LAT": str(statistics.median(c[0] for c in coords)),
+        "REDFIN_LON": str(statistics.median(c[1] for c in coords)),
+    }.items():
+        os.environ.setdefault(key, value)
+
+
+def measure(fn, rounds: int) -> dict:
+    """Per-call latency over `rounds` runs, then peak allocation of one more traced run."""
+    result = fn()  # warm up imports, regex caches and the parser
+    times = timeit.repeat(fn, number=1, repeat=rounds)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "best_ms": min(times) * 1000,
+        "median_ms": statistics.median(times) * 1000,
+        "peak_kb": peak / 1024,
+        "items": len(result or []),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=ROUNDS)
+    parser.add_argument("--fixtures", metavar="DIR", type=Path, default=FIXTURES, help="read fixtures from DIR")
+    parser.add_argument("--synthetic", action="store_true", help="time a freshly generated synthetic fixture set")
+    parser.add_argument("--save", metavar="FILE", help="write results as JSON for a later --compare")
+    parser.add_argument("--compare", metavar="FILE", help="flag parsers slower than this saved run")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        with tempfile.TemporaryDirectory() as tmp:
+            generate(Path(tmp))
+            return run(args, Path(tmp))
+    return run(args, args.fixtures)
+
+
+def run(args, fixtures: Path) -> int:
+    missing = sorted({filename for _, filename, _, _ in CASES if not (fixtures / filename).exists()})
+    if missing:
+        print(f"Missing fixtures in {fixtures}: {', '.join(missing)}", file=sys.stderr)
+        print("Record them with tests/record_fixtures.py, or pass --synthetic.", file=sys.stderr)
+        return 2
+
+    redfin_env(fixtures)
+    plugins = {}
+    results = {}
+    failed = []
+    print(f"{'parser':<20} {'fixture':>8} {'best':>9} {'median':>9} {'peak mem':>10} {'items':>6}")
+    for label, filename, plugin, step in CASES:
+        if plugin not in plugins:
+            try:
+                plugins[plugin] = load_plugin(plugin)
+            except (ImportError, SystemExit) as e:
+                plugins[plugin] = e
+        module = plugins[plugin]
+        if isinstance(module, BaseException):
+            print(f"{label:<20} FAILED: cannot load {plugin} ({type(module).__name__}: {module})")
+            failed.append(label)
+            continue
+
+        text = (fixtures / filename).read_text()
+        stats = measure(lambda: step(module, text), args.rounds)
+        stats["fixture_kb"] = len(text.encode()) / 1024
+        results[label] = stats
+        print(
+            f"{label:<20} {len(text) // 1024:>5} KB {stats['best_ms']:>6.2f} ms {stats['median_ms']:>6.2f} ms "
+            f"{stats['peak_kb']:>7.0f} KB {stats['items']:>6}"
+        )
+        if not stats["items"]:
+            print(f"{label:<20} FAILED: parsed nothing from {filename}")
+            failed.append(label)
+
+    before = [results.get(f"MaxPreps {page} DOM") for page in ("schedule", "rankings")]
+    after = [results.get(f"MaxPreps {page}") for page in ("schedule", "rankings")]
+    if all(before + after):
+        print(
+            f"\nMaxPreps parse per school: {sum(r['median_ms'] for r in before):.2f} ms full DOM -> "
+            f"{sum(r['median_ms'] for r in after):.2f} ms JSON-first"
+        )
+
+    page, api = results.get("ESPN team page"), results.get("ESPN schedule JSON")
+    if page and api:
+        print(
+            f"ESPN per team: {page['fixture_kb']:.0f} KB / {page['median_ms']:.2f} ms team page -> "
+            f"{api['fixture_kb']:.0f} KB / {api['median_ms']:.2f} ms schedule API"
+        )
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressed = [
+            label for label, stats in results.items()
+            if label in baseline
+            and stats["median_ms"] > baseline[label]["median_ms"] * REGRESSION_THRESHOLD
+            and stats["median_ms"] - baseline[label]["median_ms"] > REGRESSION_MIN_MS
+        ]
+        for label in regressed:
+            print(f"REGRESSION {label}: {baseline[label]['median_ms']:.2f} ms -> {results[label]['median_ms']:.2f} ms")
+        if regressed:
+            return 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
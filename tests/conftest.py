@@ -0,0 +1,33 @@
+"""Shared fixtures: the plugins under test, imported once per session.
+
+Run from the repo root:
+
+    python -m pytest tests
+"""
+import os
+
+import pytest
+
+from bench_parsing import load_plugin
+
+# home_comps reads its home address at import and exits without one
+REDFIN_ENV = {
+    "REDFIN_ADDRESS": "100 Main St",
+    "REDFIN_CITY": "St. Louis",
+    "REDFIN_STATE": "MO",
+    "REDFIN_ZIP": "63110",
+    "REDFIN_LAT": "38.6270",
+    "REDFIN_LON": "-90.1994",
+}
+
+
+@pytest.fixture(scope="session")
+def bball():
+    return load_plugin("bball.1d.py")
+
+
+@pytest.fixture(scope="session")
+def home_comps():
+    for key, value in REDFIN_ENV.items():
+        os.environ.setdefault(key, value)
+    return load_plugin("home_comps_uv.8hr.py")
@@ -0,0 +1,118 @@
+"""Record live responses for the scraper benchmarks in tests/fixtures/.
+
+Each source is fetched once and saved as-is so bench_scrapers.py can time the
+parsers offline. Existing fixtures are kept unless --force is given. Run from
+the repo root:
+
+    python tests/record_fixtures.py                 # record anything missing
+    python tests/record_fixtures.py techmeme --force
+
+The Redfin fixtures are searches around the address in the home_comps config,
+so they are git-ignored.
+"""
+import argparse
+import sys
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from bench_parsing import ROOT, load_plugin
+
+FIXTURES = ROOT / "tests" / "fixtures"
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+TIMEOUT = 30
+
+DAILY_NEWS = "daily_news_uv.2hr.py"
+BBALL = "bball.1d.py"
+HOME_COMPS = "home_comps_uv.8hr.py"
+MICROCENTER = "microcenter_deals_uv.6hr.py"
+
+
+def first(urls: dict) -> str:
+    return next(iter(urls.values()))
+
+
+def njcaa_week_url(bball) -> str:
+    index = (FIXTURES / "njcaa_index.html").read_text()
+    return bball.find_njcaa_week_url(BeautifulSoup(index, bball.HTML_PARSER)) or bball.njcaa_fallback_week_url()
+
+
+def redfin_csv_url(home_comps, status, **extra) -> str:
+    return home_comps.REDFIN_CSV_URL + "?" + urllib.parse.urlencode(home_comps.redfin_csv_params(status, **extra))
+
+
+# (fixture file, plugin that owns the URL, URL for that plugin). Order matters:
+# njcaa_week is found by reading the already-recorded index.
+RECORDINGS = [
+    ("techmeme.html", DAILY_NEWS, lambda m: m.TECHMEME_URL),
+    ("lobsters.html", DAILY_NEWS, lambda m: m.LOBSTERS_URL),
+    ("stltoday.html", DAILY_NEWS, lambda m: m.STLTODAY_URL),
+    ("bnd.html", DAILY_NEWS, lambda m: m.BND_URL),
+    ("stlpr.html", DAILY_NEWS, lambda m: m.STLPR_URL),
+    ("maxpreps_schedule.html", BBALL, lambda m: first(m.il_school_urls)),
+    ("maxpreps_rankings.html", BBALL, lambda m: first(m.il_school_urls).replace("/schedule/", "/rankings/")),
+    ("espn_team.html", BBALL, lambda m: first(m.college_urls)),
+    ("espn_schedule.json", BBALL, lambda m: m.espn_schedule_api_url(first(m.college_urls))),
+    ("ncaa_net.html", BBALL, lambda m: m.NCAA_NET_URL),
+    ("njcaa_index.html", BBALL, lambda m: m.get_njcaa_rankings_index_url()),
+    ("njcaa_week.html", BBALL, njcaa_week_url),
+    ("redfin_active.csv", HOME_COMPS, lambda m: redfin_csv_url(m, m.ACTIVE_STATUS)),
+    ("redfin_sold.csv", HOME_COMPS, lambda m: redfin_csv_url(m, m.SOLD_STATUS, sold_within_days=str(m.SOLD_DAYS))),
+    ("microcenter.html", MICROCENTER, lambda m: m.MICROCENTER_DEALS_URL),
+    ("bing_shopping.html", MICROCENTER, lambda m: m.BING_KOBALT_URL),
+]
+
+
+def fetch(url: str) -> str:
+    """GET a page the way a browser would; Bing only answers impersonated TLS clients."""
+    try:
+        from curl_cffi import requests as creq
+    except ImportError:
+        creq = None
+    if creq is not None:
+        r = creq.get(url, impersonate="chrome", timeout=TIMEOUT)
+        r.raise_for_status()
+        return r.text
+    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT, "Accept": "text/html,text/csv,*/*"})
+    with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
+        return resp.read().decode("utf-8", errors="replace")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help="fixture names to record (default: all)")
+    parser.add_argument("--force", action="store_true", help="re-record fixtures that already exist")
+    args = parser.parse_args()
+
+    FIXTURES.mkdir(parents=True, exist_ok=True)
+    plugins = {}
+    failed = 0
+    for filename, plugin, url_for in RECORDINGS:
+        if args.names and Path(filename).stem not in args.names:
+            continue
+        path = FIXTURES / filename
+        if path.exists() and not args.force:
+            print(f"  {filename:<24} exists, skipping")
+            continue
+        try:
+            if plugin not in plugins:
+                plugins[plugin] = load_plugin(plugin)
+            url = url_for(plugins[plugin])
+            body = fetch(url)
+        except (Exception, SystemExit) as e:
+            # home_comps exits with its setup menu when it has no config
+            print(f"  {filename:<24} FAILED: {type(e).__name__}: {e}")
+            failed += 1
+            continue
+        path.write_text(body)
+        print(f"  {filename:<24} {len(body) // 1024:6d} KB  {url}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,320 @@
+"""Deterministic stand-ins for the recorded scraper fixtures.
+
+Live pages can't be shared (the Redfin searches reveal the configured home,
+the news and retail pages are copyrighted), so bench_scrapers.py can run
+against these instead. Every fixture uses the markup its parser reads, padded
+with page-like filler to roughly the size of the real response, and is built
+from a fixed seed so two runs time byte-identical input. Run from the repo
+root:
+
+    python tests/synthetic_fixtures.py /tmp/fixtures
+    python tests/bench_scrapers.py --fixtures /tmp/fixtures
+
+or let the benchmark generate a throwaway set with --synthetic.
+"""
+import json
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+SEED = 20240101
+WORDS = (
+    "city council budget vote school district river levee transit plan stadium lease "
+    "county board election court ruling hospital expansion storm damage road repair "
+    "startup funding chip export cloud outage model release privacy lawsuit merger"
+).split()
+SEASON_START = datetime(2025, 11, 10)
+PLAYED = 20  # Games per schedule with a final score; the rest are upcoming
+SELLERS = ("Lowe's", "Home Depot")  # Only Lowe's offers are kept, so half the cards are skipped
+REDFIN_CENTER = (38.6270, -90.1994)
+REDFIN_ROWS = 3000
+REDFIN_HEADER = [
+    "SALE TYPE", "SOLD DATE", "PROPERTY TYPE", "ADDRESS", "CITY", "STATE OR PROVINCE", "ZIP OR POSTAL CODE",
+    "PRICE", "BEDS", "BATHS", "LOCATION", "SQUARE FEET", "LOT SIZE", "YEAR BUILT", "DAYS ON MARKET",
+    "$/SQUARE FEET", "HOA/MONTH", "STATUS", "NEXT OPEN HOUSE START TIME", "NEXT OPEN HOUSE END TIME",
+    "URL (SEE https://www.redfin.com/buy-a-home/comparative-market-analysis FOR INFO ON PRICING)",
+    "SOURCE", "MLS#", "FAVORITE", "INTERESTED", "LATITUDE", "LONGITUDE",
+]
+
+
+def sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize()
+
+
+def filler(rng: random.Random, kb: int) -> str:
+    """Navigation, ad slots and inline config: markup the strained parsers should skip."""
+    parts, size = [], 0
+    while size < kb * 1024:
+        part = (
+            f'<div class="nav-item promo-{rng.randrange(1000)}"><a href="/section/{rng.randrange(10**6)}">'
+            f'{sentence(rng, 4)}</a><span class="ad-slot" data-slot="{rng.randrange(10**6)}"></span></div>'
+            f'<script>window.cfg_{rng.randrange(10**6)} = {json.dumps([sentence(rng, 6) for _ in range(4)])};</script>'
+        )
+        parts.append(part)
+        size += len(part)
+    return "".join(parts)
+
+
+def page(rng: random.Random, body: str, kb: int) -> str:
+    half = filler(rng, kb // 2)
+    return f"<!DOCTYPE html><html><head><title>x</title></head><body>{half}{body}{filler(rng, kb // 2)}</body></html>"
+
+
+def techmeme(rng):
+    stories = "".join(
+        f'<div class="clus"><div class="ii"><strong><a class="ourh" href="https://example.com/t/{i}">'
+        f"{sentence(rng, 9)}</a></strong> &mdash; {sentence(rng, 30)}</div></div>"
+        for i in range(60)
+    )
+    return page(rng, stories, 300)
+
+
+def lobsters(rng):
+    stories = "".join(
+        f'<li><div class="details"><span class="link"><a class="u-url" href="https://example.com/l/{i}">'
+        f'{sentence(rng, 7)}</a></span><span class="tags"><a class="tag">{rng.choice(WORDS)}</a>'
+        f'<a class="tag">{rng.choice(WORDS)}</a></span><div class="description">{sentence(rng, 20)}</div></div></li>'
+        for i in range(25)
+    )
+    return page(rng, f'<ol class="stories list">{stories}</ol>', 60)
+
+
+def stltoday(rng):
+    blocks = "".join(
+        f'<section class="block"><div class="block-title-inner"><h3>{category}</h3></div>'
+        + "".join(
+            f'<article><h3 class="card-headline"><a href="/news/{category.lower()}/{i}">{sentence(rng, 8)}</a></h3>'
+            f'<div class="card-lead"><p>{sentence(rng, 25)}</p></div></article>'
+            for i in range(8)
+        )
+        + "</section>"
+        for category in ("Sports", "Business", "Food & Drink", "Politics", "Weather")
+    )
+    return page(rng, blocks, 450)
+
+
+def bnd(rng):
+    grid = "".join(
+        f'<article><span class="kicker">{rng.choice(WORDS).title()}</span><h3><a href="/news/local/{i}.html">'
+        f'{sentence(rng, 8)}</a></h3><p class="blurb">{sentence(rng, 22)}</p></article>'
+        for i in range(20)
+    )
+    latest = "".join(
+        f'<div class="package"><h3><a href="/news/latest/{i}.html">{sentence(rng, 8)}</a></h3></div>'
+        for i in range(20)
+    )
+    return page(rng, f'<section class="grid">{grid}</section><div data-tb-region="latest">{latest}</div>', 600)
+
+
+def stlpr(rng):
+    promos = "".join(
+        f'<ps-promo><a href="/news/{i}" aria-label="story"></a><a href="/section/{i}">'
+        f'{rng.choice(WORDS).title()}</a><a href="/news/{i}">{sentence(rng, 9)}</a>'
+        f"<p>{sentence(rng, 3)}</p><p>{sentence(rng, 24)}</p></ps-promo>"
+        for i in range(40)
+    )
+    return page(rng, promos, 400)
+
+
+def season_dates(rng, count):
+    """A fixed season's game days; the first PLAYED of them carry final scores."""
+    return sorted(SEASON_START + timedelta(days=rng.randrange(130)) for _ in range(count))
+
+
+def next_data(team_context: dict) -> str:
+    payload = json.dumps({"props": {"pageProps": {"teamContext": team_context}}, "page": "/team"})
+    return f'<script id="__NEXT_DATA__" type="application/json">{payload}</script>'
+
+
+def maxpreps_context(rng, kb: int) -> dict:
+    """A teamContext sized like MaxPreps', which ships the roster, stats and news with every page."""
+    context = {
+        "teamId": "aaaa-1111",
+        "standingsData": {"overallStanding": {"overallWinLossTies": "14-6", "streak": 3, "streakResult": "W"}},
+        "rankingsData": {"data": [
+            {"rankingType": 1, "rank": 7, "contextName": "Illinois"},
+            {"rankingType": 2, "rank": 3, "contextName": "Class 4A"},
+            {"rankingType": 3, "rank": 12, "contextName": "St. Louis Metro"},
+        ]},
+        "content": [],
+    }
+    while len(json.dumps(context)) < kb * 1024:
+        context["content"].append({"id": rng.randrange(10**9), "headline": sentence(rng, 10), "body": sentence(rng, 60)})
+    return context
+
+
+def maxpreps_schedule(rng):
+    rows = []
+    for i, day in enumerate(season_dates(rng, 28)):
+        where = rng.choice(("vs", "@"))
+        past = i < PLAYED
+        rows.append(
+            f"<tr><td>{day.month}/{day.day}</td><td>{where} <span class=\"name\">{sentence(rng, 2)}</span></td>"
+            f'<td><a href="https://www.maxpreps.com/games/{i}">7:00pm</a></td>'
+            f"<td>{rng.choice('WL') + ' 61-54' if past else ''}</td></tr>"
+        )
+    tables = (
+        '<table><tbody><tr><td>Overall</td><td>14-6</td></tr></tbody></table>'
+        f'<table><tbody>{"".join(rows)}</tbody></table>'
+    )
+    body = f'<h1 class="sub-title">Synthetic High School Boys Basketball</h1>{tables}{next_data(maxpreps_context(rng, 380))}'
+    return page(rng, body, 180)
+
+
+def maxpreps_rankings(rng):
+    return page(rng, f'<h1 class="sub-title">Synthetic Rankings</h1>{next_data(maxpreps_context(rng, 380))}', 120)
+
+
+def espn_team(rng):
+    games = []
+    for i, day in enumerate(season_dates(rng, 31)):
+        past = i < PLAYED
+        score = f'<div class="Schedule__Score">{rng.choice("WL")} 75-60</div>' if past else ""
+        games.append(
+            f'<a class="Schedule__Game" href="https://www.espn.com/mens-college-basketball/game/_/gameId/{i}">'
+            f'<span class="Schedule__Time">{day.month}/{day.day}</span><span class="Schedule_atVs">{rng.choice(("vs", "@"))}</span>'
+            f'<span class="Schedule__Team">{sentence(rng, 2)}</span><span class="Schedule__Time">7:00 PM</span>{score}</a>'
+        )
+    header = (
+        '<span class="db pr3 nowrap fw-bold">Saint Louis</span>'
+        '<ul class="ClubhouseHeader__Record"><li>18-7</li><li>#22 in AP Top 25</li></ul>'
+    )
+    # ESPN inlines the whole app state (__espnfitt__) ahead of the markup
+    state = json.dumps({"page": {"content": [sentence(rng, 40) for _ in range(2600)]}})
+    return page(rng, f"<script>window['__espnfitt__']={state};</script>{header}{''.join(games)}", 420)
+
+
+def espn_schedule(rng):
+    events = []
+    for i, day in enumerate(season_dates(rng, 31)):
+        start = day.replace(hour=23, tzinfo=timezone.utc)
+        completed = i < PLAYED
+        won = rng.random() < 0.6
+        ours = {"id": "139", "homeAway": rng.choice(("home", "away")), "winner": won,
+                "score": {"value": 75.0 if won else 60.0}, "curatedRank": {"current": rng.choice((22, 25, 99))},
+                "team": {"id": "139", "location": "Saint Louis"}}
+        theirs = {"id": str(1000 + i), "homeAway": "away" if ours["homeAway"] == "home" else "home", "winner": not won,
+                  "score": {"value": 60.0 if won else 75.0}, "team": {"id": str(1000 + i), "location": sentence(rng, 2)}}
+        events.append({
+            "id": str(i),
+            "date": start.strftime("%Y-%m-%dT%H:%MZ"),
+            "name": sentence(rng, 6),
+            "competitions": [{"competitors": [ours, theirs], "timeValid": True,
+                              "status": {"type": {"completed": completed}},
+                              "venue": {"fullName": sentence(rng, 3), "address": {"city": "St. Louis"}},
+                              "notes": [{"headline": sentence(rng, 12)}]}],
+            "links": [{"href": f"https://www.espn.com/mens-college-basketball/game/_/gameId/{i}"}],
+        })
+    data = {"team": {"id": "139", "location": "Saint Louis", "recordSummary": "18-7"}, "events": events}
+    return json.dumps(data)
+
+
+def rankings_table(rng, headers, count):
+    rows = "".join(
+        f"<tr><td>{rank}</td><td>{sentence(rng, 2)}</td><td>{rng.randrange(30)}-{rng.randrange(15)}</td></tr>"
+        for rank in range(1, count + 1)
+    )
+    head = "".join(f"<th>{h}</th>" for h in headers)
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{rows}</tbody></table>"
+
+
+def ncaa_net(rng):
+    return page(rng, rankings_table(rng, ("Rank", "School", "Record"), 364), 160)
+
+
+def njcaa_index(rng):
+    links = "".join(
+        f'<li><a href="/sports/mbkb/2025-26/div1/rankings/Week_{week}">Week {week}</a></li>'
+        for week in range(14, 0, -1)
+    )
+    links += '<li><a href="/sports/mbkb/2025-26/div1/rankings/Preseason">Preseason</a></li>'
+    return page(rng, f"<ul>{links}</ul>", 60)
+
+
+def njcaa_week(rng):
+    return page(rng, rankings_table(rng, ("Place", "Name", "Record"), 25), 80)
+
+
+def redfin(rng, sold):
+    lines = [",".join(f'"{h}"' if "," in h else h for h in REDFIN_HEADER)]
+    lat0, lon0 = REDFIN_CENTER
+    for i in range(REDFIN_ROWS):
+        price = rng.randrange(120, 1400) * 1000
+        sqft = rng.randrange(800, 4200)
+        status = "Sold" if sold else rng.choice(("Active", "Active", "Active", "Pending", "Contingent"))
+        sold_date = f"{rng.choice(('January', 'February', 'March'))}-{rng.randrange(1, 29)}-2026" if sold else ""
+        dom = "" if sold else str(rng.randrange(1, 240))
+        mls = (500000 if sold else 100000) + i
+        lines.append(",".join([
+            "PAST SALE" if sold else "MLS Listing", sold_date, "Single Family Residential",
+            f"{rng.randrange(100, 9999)} {rng.choice(WORDS).title()} Ave", "St. Louis", "MO", "63110",
+            str(price), str(rng.randrange(2, 6)), str(rng.choice((1, 1.5, 2, 2.5, 3))), "", str(sqft), "",
+            str(rng.randrange(1900, 2024)), dom, str(price // sqft), "", status, "", "",
+            f"https://www.redfin.com/MO/St-Louis/{i}-Ave-63110/home/{mls}", "MARIS", str(mls), "N", "Y",
+            f"{lat0 + rng.uniform(-0.15, 0.15):.6f}", f"{lon0 + rng.uniform(-0.15, 0.15):.6f}",
+        ]))
+    return "\n".join(lines) + "\n"
+
+
+def microcenter(rng):
+    tiles = []
+    for i in range(96):
+        price = rng.randrange(30, 2000) + 0.99
+        save = f'<span class="savings">Save ${rng.randrange(10, 300)}.00</span>' if rng.random() < 0.6 else ""
+        tiles.append(
+            f'<li class="product_wrapper"><a href="/product/{600000 + i}/item" data-id="{600000 + i}" '
+            f'data-price="{price:.2f}" data-name="{sentence(rng, 8)}" data-brand="{rng.choice(WORDS).title()}">'
+            f'{sentence(rng, 8)}</a><div class="price">${price:.2f}</div>{save}</li>'
+        )
+    return page(rng, f'<ul class="products">{"".join(tiles)}</ul>', 700)
+
+
+def bing_shopping(rng):
+    cards, blobs = [], []
+    for i in range(60):
+        price = rng.randrange(20, 400) + 0.98
+        offer = f"offer{i}"
+        cards.append(
+            f'<div class="br-item" data-offerid="{offer}"><a class="br-titlelink" href="/shop/{i}">'
+            f'<div class="br-title" title="Kobalt {sentence(rng, 6)}">Kobalt</div></a>'
+            f'<div class="br-price">${price:.2f}</div><div class="br-oPrice">${price + rng.randrange(5, 80):.2f}</div>'
+            f'<span class="br-sellerName">{rng.choice(SELLERS)}</span></div>'
+        )
+        custom = json.dumps({"GlobalOfferId": offer, "PageUrl": f"https://www.lowes.com/pd/kobalt/{i}"})
+        blobs.append('"CustomData":"' + custom.replace('"', '\\"') + '"')
+    script = "<script>var data = {" + ",".join(blobs) + "};</script>"
+    return page(rng, "".join(cards) + script, 400)
+
+
+GENERATORS = {
+    "techmeme.html": techmeme,
+    "lobsters.html": lobsters,
+    "stltoday.html": stltoday,
+    "bnd.html": bnd,
+    "stlpr.html": stlpr,
+    "maxpreps_schedule.html": maxpreps_schedule,
+    "maxpreps_rankings.html": maxpreps_rankings,
+    "espn_team.html": espn_team,
+    "espn_schedule.json": espn_schedule,
+    "ncaa_net.html": ncaa_net,
+    "njcaa_index.html": njcaa_index,
+    "njcaa_week.html": njcaa_week,
+    "redfin_active.csv": lambda rng: redfin(rng, sold=False),
+    "redfin_sold.csv": lambda rng: redfin(rng, sold=True),
+    "microcenter.html": microcenter,
+    "bing_shopping.html": bing_shopping,
+}
+
+
+def generate(directory: Path) -> None:
+    """Write every fixture into directory; each gets its own seeded generator so they're independent."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for i, (filename, build) in enumerate(GENERATORS.items()):
+        (directory / filename).write_text(build(random.Random(SEED + i)))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit(f"usage: {sys.argv[0]} DIRECTORY")
+    generate(Path(sys.argv[1]))
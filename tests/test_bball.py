@@ -0,0 +1,180 @@
+"""Unit tests for bball.1d.py: rank lookups, host backoff, schedule parsing and the page cache."""
+import asyncio
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+
+# --- RankIndex ---
+
+@pytest.fixture
+def ranks(bball):
+    return bball.RankIndex(
+        {"Vincennes University": 3, "Vincennes Tech": 1, "Kansas": 2, "Kansas State": 5, "St. Mary's (CA)": 9},
+        {"Saint Marys": "St. Mary's (CA)"},
+    )
+
+
+def test_lookup_normalizes_and_follows_aliases(ranks):
+    assert ranks.lookup("kansas state") == 5
+    assert ranks.lookup("St Marys CA") == 9
+    assert ranks.lookup("Saint Mary's") == 9
+    assert ranks.lookup("Kansas St") is None
+
+
+def test_contained_in_prefers_the_longest_name(ranks):
+    assert ranks.contained_in("Kansas State Wildcats") == 5
+    assert ranks.contained_in("Kansas Jayhawks") == 2
+    assert ranks.contained_in("Wichita State") is None
+
+
+@pytest.mark.parametrize("query, rank", [
+    ("Vinc", 1),  # A partial first word, best rank wins
+    ("Vincennes", 1),
+    ("Vincennes U", 3),
+    ("Kansas St", 5),
+    ("Zzz", None),
+    ("", None),
+])
+def test_prefixed_by(ranks, query, rank):
+    assert ranks.prefixed_by(query) == rank
+
+
+# --- HostLimiter ---
+
+def test_throttled_halves_rate_down_to_the_floor(bball):
+    limiter = bball.HostLimiter(rate=1.0, capacity=2)
+    limiter.throttled(retry_after=0)
+    assert limiter.rate == 0.5
+    assert limiter.tokens == 0
+    for _ in range(10):
+        limiter.throttled(retry_after=0)
+    assert limiter.rate == bball.MIN_HOST_RATE
+
+
+def test_succeeded_recovers_up_to_the_configured_rate(bball):
+    limiter = bball.HostLimiter(rate=1.0, capacity=2)
+    limiter.throttled(retry_after=0)
+    limiter.succeeded()
+    assert limiter.rate == 0.5 + bball.HOST_RATE_RECOVERY
+    for _ in range(10):
+        limiter.succeeded()
+    assert limiter.rate == 1.0
+
+
+def test_retry_after_blocks_the_host_and_is_capped(bball):
+    limiter = bball.HostLimiter(rate=1.0, capacity=2)
+    limiter.throttled(retry_after=3600)
+    assert limiter.blocked_until - time.monotonic() <= bball.MAX_RETRY_AFTER
+
+
+def test_acquire_waits_out_retry_after(bball):
+    limiter = bball.HostLimiter(rate=100.0, capacity=2)
+    limiter.throttled(retry_after=0.2)
+    start = time.monotonic()
+    asyncio.run(limiter.acquire())
+    assert time.monotonic() - start >= 0.2
+
+
+def test_parse_retry_after(bball):
+    assert bball.parse_retry_after("5") == 5.0
+    assert bball.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert bball.parse_retry_after("soon") is None
+    assert bball.parse_retry_after(None) is None
+
+
+# --- Schedule parsing ---
+
+def espn_event(day, opponent, home_away="home", completed=False, won=True, rank=None):
+    ours = {"id": "139", "homeAway": home_away, "winner": won, "score": {"value": 75.0 if won else 60.0},
+            "team": {"id": "139", "location": "Saint Louis"}}
+    if rank is not None:
+        ours["curatedRank"] = {"current": rank}
+    theirs = {"id": "7", "winner": not won, "score": {"value": 60.0 if won else 75.0},
+              "team": {"id": "7", "location": f" {opponent} "}}
+    return {
+        "date": f"{day}T12:00Z",
+        "competitions": [{"competitors": [ours, theirs], "timeValid": True,
+                          "status": {"type": {"completed": completed}}}],
+        "links": [{"href": f"https://www.espn.com/game/{day}"}],
+    }
+
+
+def espn_schedule(*events):
+    return {"team": {"id": "139", "location": "Saint Louis", "recordSummary": "18-7"}, "events": list(events)}
+
+
+def test_parse_espn_schedule(bball):
+    school = bball.School(url="https://www.espn.com/team", last_updated=datetime.now())
+    data = espn_schedule(
+        espn_event("2026-01-10", "Dayton", completed=True, won=False, rank=22),
+        {"date": "2026-01-12T12:00Z", "competitions": []},  # Malformed: skipped
+        espn_event("2099-02-01", "VCU", rank=99),
+    )
+    bball.parse_espn_schedule(data, school)
+
+    assert (school.name, school.record) == ("Saint Louis", "18-7")
+    assert school.ranking is None  # The latest poll has them unranked
+    played, upcoming = school.schedule
+    assert (played.opponent, played.result, played.score) == ("DAYTON", "L", "75-60")
+    assert played.game_url == "https://www.espn.com/game/2026-01-10"
+    assert (upcoming.opponent, upcoming.result, upcoming.score) == ("VCU", None, None)
+    assert upcoming.home_away == "Home" and upcoming.tipoff_time is not None
+
+
+def test_parse_espn_schedule_keeps_frozen_games(bball):
+    school = bball.School(url="https://www.espn.com/team", last_updated=datetime.now())
+    event = espn_event("2026-01-10", "Dayton", completed=True)
+    bball.parse_espn_schedule(espn_schedule(event), school)
+    frozen_game = school.schedule[0]
+    frozen = {bball.game_key(frozen_game.date, frozen_game.opponent): frozen_game}
+
+    event["competitions"][0]["status"]["type"]["completed"] = False  # ESPN dropped the final
+    bball.parse_espn_schedule(espn_schedule(event), school, frozen)
+    assert school.schedule == [frozen_game]
+
+
+@pytest.mark.parametrize("cell, expected", [
+    ("W 65-58", ("W", "65-58")),
+    (" L63-70 (OT)", ("L", "63-70")),
+    ("7:00pm", (None, None)),
+    ("", (None, None)),
+])
+def test_parse_past_game_scores(bball, cell, expected):
+    assert bball.parse_past_game_scores(cell) == expected
+
+
+# --- Page cache ---
+
+@pytest.fixture
+def cache_dir(bball, tmp_path, monkeypatch):
+    monkeypatch.setattr(bball, "CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_cached_page_round_trip(bball, cache_dir):
+    url = "https://example.com/schedule"
+    assert bball.load_cached_page(url, "schedule") is None
+    bball.save_cached_page(url, "schedule", "<html/>", '"abc"', None)
+    entry = bball.load_cached_page(url, "schedule")
+    assert (entry["body"], entry["etag"], entry["last_modified"]) == ("<html/>", '"abc"', None)
+    assert os.listdir(cache_dir) == [os.path.basename(bball.cache_path(url, "schedule"))]
+
+
+def test_prune_page_cache(bball, cache_dir):
+    expired = time.time() - bball.CACHE_TTLS["schedule"] - bball.CACHE_REVALIDATE_WINDOW - 60
+    bball.save_cached_page("https://example.com/fresh", "schedule", "fresh", None, None)
+    bball.save_cached_page("https://example.com/old", "schedule", "old", None, None)
+    os.utime(bball.cache_path("https://example.com/old", "schedule"), (expired, expired))
+    bball.save_cached_page("https://example.com/box", "box_score", "gone", None, None)  # No TTL any more
+    (cache_dir / ("0" * 40 + ".json")).write_text("{}")  # Old unprefixed layout
+    (cache_dir / "schedules.json").write_text("{}")
+    (cache_dir / "stale.json.1.tmp").write_text("")
+    os.utime(cache_dir / "stale.json.1.tmp", (expired, expired))
+
+    bball.prune_page_cache()
+    assert sorted(os.listdir(cache_dir)) == sorted([
+        os.path.basename(bball.cache_path("https://example.com/fresh", "schedule")), "schedules.json",
+    ])
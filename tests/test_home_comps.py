@@ -0,0 +1,133 @@
+"""Unit tests for home_comps_uv.8hr.py: listing history and the stale-if-error file cache."""
+import os
+import sqlite3
+import time
+
+import pytest
+
+HEADER = "ADDRESS,STATUS,PRICE,DAYS ON MARKET,URL,MLS#"
+
+
+def csv_body(*rows):
+    """A gis-csv body from (home id, status, price) rows."""
+    lines = [HEADER]
+    for home_id, status, price in rows:
+        lines.append(f"{home_id} Main St,{status},{price},10,https://www.redfin.com/MO/home/{home_id},M{home_id}")
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def history(home_comps):
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(home_comps.HISTORY_SCHEMA)
+    yield conn
+    conn.close()
+
+
+def record(home_comps, conn, source, raw):
+    return home_comps.record_snapshot(conn, source, raw, home_comps.ListingTable.from_csv(raw))
+
+
+def events_of(home_comps, conn, snapshot_id):
+    return sorted((kind, old, new, pid) for kind, old, new, pid, _address, _url in
+                  home_comps.snapshot_events(conn, [snapshot_id]))
+
+
+def test_first_snapshot_is_the_baseline(home_comps, history):
+    first = record(home_comps, history, "active", csv_body((1, "Active", 300000)))
+    assert events_of(home_comps, history, first) == []
+
+
+def test_unchanged_snapshot_raises_no_events_again(home_comps, history):
+    record(home_comps, history, "active", csv_body((1, "Active", 300000)))
+    raw = csv_body((1, "Active", 290000), (2, "Active", 250000))
+    changed = record(home_comps, history, "active", raw)
+    assert len(events_of(home_comps, history, changed)) == 2
+
+    assert record(home_comps, history, "active", raw) is None
+
+
+def test_price_cuts_status_changes_and_new_listings(home_comps, history):
+    record(home_comps, history, "active", csv_body((1, "Active", 300000), (2, "Active", 250000)))
+    snapshot = record(home_comps, history, "active", csv_body(
+        (1, "Active", 290000), (2, "Pending", 250000), (3, "Active", 400000),
+    ))
+    assert events_of(home_comps, history, snapshot) == [
+        ("new", None, "active", "3"),
+        ("price_cut", "300000.0", "290000.0", "1"),
+        ("status", "active", "pending", "2"),
+    ]
+    address, url = home_comps.snapshot_events(history, [snapshot])[0][4:]
+    assert url.startswith("https://www.redfin.com/") and address.endswith("Main St")
+
+
+def test_sold_price_is_not_compared_with_list_price(home_comps, history):
+    record(home_comps, history, "active", csv_body((1, "Active", 300000)))
+    record(home_comps, history, "sold", csv_body((9, "Sold", 200000)))
+    snapshot = record(home_comps, history, "sold", csv_body((9, "Sold", 200000), (1, "Sold", 280000)))
+    assert events_of(home_comps, history, snapshot) == [("status", "active", "sold", "1")]
+
+
+def test_load_history_reports_each_change_once(home_comps, tmp_path, monkeypatch):
+    monkeypatch.setattr(home_comps, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(home_comps, "HISTORY_DB", str(tmp_path / "history.sqlite3"))
+
+    def run(raw):
+        table = home_comps.ListingTable.from_csv(raw)
+        events, _trend = home_comps.load_history(raw, table, "", table)
+        return [e[0] for e in events]
+
+    assert run(csv_body((1, "Active", 300000))) == []
+    assert run(csv_body((1, "Active", 290000))) == ["price_cut"]
+    assert run(csv_body((1, "Active", 290000))) == []  # Cache hit: same body as last run
+
+
+# --- get_cached ---
+
+@pytest.fixture
+def cache(home_comps, tmp_path, monkeypatch):
+    monkeypatch.setattr(home_comps, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(home_comps, "CACHE_OUTCOMES", {})
+    return tmp_path
+
+
+def expire(path, key, home_comps):
+    old = time.time() - home_comps.CACHE_TTLS[key] - 60
+    os.utime(path, (old, old))
+
+
+def fail():
+    raise OSError("connection reset")
+
+
+def test_fresh_entry_is_served_without_fetching(home_comps, cache):
+    assert home_comps.get_cached("active.csv", lambda: "body") == "body"
+    assert home_comps.get_cached("active.csv", fail) == "body"
+    assert home_comps.CACHE_OUTCOMES["active.csv"] == ("hit", None)
+
+
+def test_failed_fetch_serves_the_stale_copy(home_comps, cache):
+    home_comps.get_cached("active.csv", lambda: "body")
+    expire(cache / "active.csv", "active.csv", home_comps)
+
+    assert home_comps.get_cached("active.csv", fail) == "body"
+    outcome, error = home_comps.CACHE_OUTCOMES["active.csv"]
+    assert outcome == "stale" and isinstance(error, OSError)
+    assert home_comps.get_cached("active.csv", lambda: "") == "body"  # An empty body is a failure too
+
+
+def test_failed_fetch_without_a_copy_raises(home_comps, cache):
+    with pytest.raises(OSError):
+        home_comps.get_cached("active.csv", fail)
+    with pytest.raises(ValueError):
+        home_comps.get_cached("sold.csv", lambda: "")
+    assert not any(cache.iterdir())
+
+
+def test_no_estimate_is_not_an_error(home_comps, cache):
+    assert home_comps.get_cached("home_estimate.json", lambda: None) is None
+    assert home_comps.CACHE_OUTCOMES["home_estimate.json"] == ("miss", None)
+
+    home_comps.get_cached("home_estimate.json", lambda: '{"estimate": 1}')
+    expire(cache / "home_estimate.json", "home_estimate.json", home_comps)
+    assert home_comps.get_cached("home_estimate.json", lambda: None) == '{"estimate": 1}'